@@ -0,0 +1,34 @@
+"""Add indexes for account-state filters and list sort columns
+
+Revision ID: 0001_user_client_indexes
+Revises:
+Create Date: 2026-10-16 01:20:00
+
+Tables themselves are still created by ``db.create_all()`` on startup;
+that only builds indexes for brand-new tables, so existing databases pick
+them up from this revision (``flask db upgrade``).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_user_client_indexes'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_users_active', 'users', ['is_active_user', 'deactivated_at'],
+                    if_not_exists=True)
+    op.create_index('ix_users_created_at', 'users', ['created_at'], if_not_exists=True)
+    op.create_index('ix_clients_name', 'clients', ['name'], if_not_exists=True)
+    op.create_index('ix_clients_created', 'clients', ['created'], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_clients_created', table_name='clients', if_exists=True)
+    op.drop_index('ix_clients_name', table_name='clients', if_exists=True)
+    op.drop_index('ix_users_created_at', table_name='users', if_exists=True)
+    op.drop_index('ix_users_active', table_name='users', if_exists=True)
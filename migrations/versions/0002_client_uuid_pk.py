@@ -0,0 +1,37 @@
+"""Store clients.id as a native UUID
+
+Revision ID: 0002_client_uuid_pk
+Revises: 0001_user_client_indexes
+Create Date: 2026-10-16 01:35:00
+
+Existing ids are 32-char uuid4 hex strings, which PostgreSQL casts to
+``uuid`` directly.  On SQLite ``sa.Uuid`` is CHAR(32) hex — the same
+representation already stored — so nothing changes there.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_client_uuid_pk'
+down_revision = '0001_user_client_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('clients', 'id',
+                    existing_type=sa.String(length=32),
+                    type_=sa.Uuid(),
+                    postgresql_using='id::uuid')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('clients', 'id',
+                    existing_type=sa.Uuid(),
+                    type_=sa.String(length=32),
+                    postgresql_using="replace(id::text, '-', '')")
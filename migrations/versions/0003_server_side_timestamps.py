@@ -0,0 +1,40 @@
+"""Stamp users.created_at and clients.created on the database server
+
+Revision ID: 0003_server_side_timestamps
+Revises: 0002_client_uuid_pk
+Create Date: 2026-10-16 01:50:00
+
+SQLite cannot alter a column default in place; databases created by
+``db.create_all()`` after this change already carry the default.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_server_side_timestamps'
+down_revision = '0002_client_uuid_pk'
+branch_labels = None
+depends_on = None
+
+# The columns are ``timestamp without time zone`` holding UTC; plain now()
+# would be stored in the session's TimeZone.
+UTC_NOW = sa.text("timezone('utc', CURRENT_TIMESTAMP)")
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('users', 'created_at', existing_type=sa.DateTime(),
+                    server_default=UTC_NOW)
+    op.alter_column('clients', 'created', existing_type=sa.DateTime(),
+                    server_default=UTC_NOW)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('clients', 'created', existing_type=sa.DateTime(),
+                    server_default=None)
+    op.alter_column('users', 'created_at', existing_type=sa.DateTime(),
+                    server_default=None)
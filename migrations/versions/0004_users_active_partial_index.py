@@ -0,0 +1,26 @@
+"""Partial index on users for non-revoked accounts
+
+Revision ID: 0004_users_active_partial_index
+Revises: 0003_server_side_timestamps
+Create Date: 2026-10-16 02:10:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_users_active_partial_index'
+down_revision = '0003_server_side_timestamps'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_users_active_partial', 'users', ['is_active_user'],
+                    postgresql_where=sa.text('deactivated_at IS NULL'),
+                    sqlite_where=sa.text('deactivated_at IS NULL'),
+                    if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_users_active_partial', table_name='users', if_exists=True)
@@ -2,13 +2,111 @@
 """
 DataForSEO API wrapper
 """
-import urllib.request
-import urllib.parse
+import http.client
 import json
 import base64
+import threading
 from credential import get_dataforseo_credentials
 
-API_BASE = "https://api.dataforseo.com/v3"
+# httpx (installed with the webapp) lets the concurrent calls the webapp
+# makes share one HTTP/2 connection as multiplexed streams.  The CLI scripts
+# fall back to a stdlib keep-alive connection per thread.
+try:
+    import httpx
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    _HTTPX_AVAILABLE = False
+
+# orjson (installed with the webapp) parses the large keyword/competitor
+# responses several times faster than the stdlib and works on bytes directly.
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+try:
+    import h2  # noqa: F401 — httpx needs it for http2=True
+    _HTTP2_AVAILABLE = _HTTPX_AVAILABLE
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+API_HOST = "api.dataforseo.com"
+API_BASE = f"https://{API_HOST}/v3"
+
+_client = None
+_client_lock = threading.Lock()
+
+# One keep-alive HTTPS connection per thread, so consecutive calls (and the
+# webapp's concurrent fan-outs) skip a fresh TCP + TLS handshake each time.
+_local = threading.local()
+
+
+def _get_client():
+    """Return the process-wide httpx client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    base_url=API_BASE,
+                    timeout=60,
+                    transport=httpx.HTTPTransport(
+                        http2=_HTTP2_AVAILABLE,
+                        retries=1,
+                        limits=httpx.Limits(max_keepalive_connections=16,
+                                            max_connections=32),
+                    ),
+                )
+    return _client
+
+
+def _connection() -> http.client.HTTPSConnection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = http.client.HTTPSConnection(API_HOST, timeout=60)
+    return conn
+
+
+def _drop_connection() -> None:
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+def _post_httpx(endpoint: str, body: bytes, headers: dict) -> tuple:
+    """POST through the shared httpx client; returns (status, payload)."""
+    try:
+        resp = _get_client().post(f"/{endpoint}", content=body, headers=headers)
+    except Exception as e:
+        raise RuntimeError(f"DataForSEO request failed: {e}")
+    return resp.status_code, resp.content
+
+
+def _post_http_client(endpoint: str, body: bytes, headers: dict) -> tuple:
+    """POST over this thread's keep-alive connection; returns (status, payload)."""
+    # A kept-alive connection may have been closed by the server while idle;
+    # that surfaces as a reset on the next request, so reconnect once.
+    for attempt in range(2):
+        conn = _connection()
+        try:
+            conn.request("POST", f"/v3/{endpoint}", body=body, headers=headers)
+            resp = conn.getresponse()
+            payload = resp.read()
+        except (ConnectionResetError, BrokenPipeError) as e:
+            _drop_connection()
+            if attempt:
+                raise RuntimeError(f"DataForSEO request failed: {e}")
+            continue
+        except Exception as e:
+            _drop_connection()
+            raise RuntimeError(f"DataForSEO request failed: {e}")
+        if resp.will_close:
+            _drop_connection()
+        return resp.status, payload
 
 
 def api_post(endpoint: str, data: list) -> dict:
@@ -20,26 +118,20 @@ def api_post(endpoint: str, data: list) -> dict:
             "Set DATAFORSEO_LOGIN and DATAFORSEO_PASSWORD environment variables."
         )
 
-    url = f"{API_BASE}/{endpoint}"
     auth = base64.b64encode(f"{login}:{password}".encode()).decode()
     headers = {
         "Authorization": f"Basic {auth}",
         "Content-Type": "application/json"
     }
+    body = _dumps(data)
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(data).encode(),
-        headers=headers,
-        method="POST"
-    )
+    post = _post_httpx if _HTTPX_AVAILABLE else _post_http_client
+    status, payload = post(endpoint, body, headers)
 
+    if status >= 400:
+        raise RuntimeError(f"DataForSEO API error HTTP {status}: {payload.decode()}")
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode()
-        raise RuntimeError(f"DataForSEO API error HTTP {e.code}: {error_body}")
+        return _loads(payload)
     except Exception as e:
         raise RuntimeError(f"DataForSEO request failed: {e}")
 
@@ -9,6 +9,7 @@ import urllib.error
 import urllib.parse
 import ssl
 import re
+import threading
 import time
 import sys
 import html as html_module
@@ -135,37 +136,96 @@ def _url_variants(url):
     return variants
 
 
+_HTTPX_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "en-GB,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Cache-Control": "max-age=0",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Sec-Ch-Ua": '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"macOS"',
+}
+
+_CURL_CFFI_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "en-GB,en;q=0.9",
+    "Cache-Control": "max-age=0",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# Connections are kept alive between fetches, so the page, robots.txt and
+# sitemap requests of one audit share a handshake.  httpx.Client is
+# thread-safe and multiplexes over HTTP/2; curl_cffi sessions are not, so
+# each thread gets its own.
+_httpx_client = None
+_httpx_client_lock = threading.Lock()
+_cffi_local = threading.local()
+
+
+def _get_httpx_client():
+    global _httpx_client
+    if _httpx_client is None:
+        with _httpx_client_lock:
+            if _httpx_client is None:
+                _httpx_client = httpx.Client(
+                    http2=True,
+                    follow_redirects=True,
+                    verify=False,
+                    headers=_HTTPX_HEADERS,
+                )
+    return _httpx_client
+
+
+def _get_cffi_session():
+    session = getattr(_cffi_local, "session", None)
+    if session is None:
+        session = _cffi_local.session = cffi_requests.Session(impersonate="chrome124")
+    return session
+
+
+# Pages are read up to this many bytes.  The audit needs the <head> plus the
+# first <h1> and any JSON-LD blocks, which sit well inside this on real
+# pages; the cap stops multi-MB bodies (inline state blobs, base64 assets)
+# from being downloaded and regex-scanned in full.
+_MAX_PAGE_BYTES = 1024 * 1024
+_CHUNK_SIZE = 16384
+
+
+def _read_capped(chunks):
+    """Join byte *chunks* until _MAX_PAGE_BYTES, then stop reading."""
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        if len(buf) >= _MAX_PAGE_BYTES:
+            del buf[_MAX_PAGE_BYTES:]
+            break
+    return bytes(buf)
+
+
+def _decode(body, encoding):
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
 def _fetch_httpx(url, timeout):
     """Fetch using httpx with HTTP/2 — passes most WAF fingerprint checks.
     Returns (content, headers_dict, load_time) or raises.
     """
     start = time.time()
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-        "Accept-Language": "en-GB,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Cache-Control": "max-age=0",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-        "Sec-Ch-Ua": '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
-        "Sec-Ch-Ua-Mobile": "?0",
-        "Sec-Ch-Ua-Platform": '"macOS"',
-    }
-    with httpx.Client(
-        http2=True,
-        follow_redirects=True,
-        timeout=timeout,
-        verify=False,
-        headers=headers,
-    ) as client:
-        resp = client.get(url)
-        content = resp.text
-        load_time = time.time() - start
-        return content, dict(resp.headers), load_time
+    with _get_httpx_client().stream("GET", url, timeout=timeout) as resp:
+        body = _read_capped(resp.iter_bytes(_CHUNK_SIZE))
+        content = _decode(body, resp.encoding)
+        headers = dict(resp.headers)
+    load_time = time.time() - start
+    return content, headers, load_time
 
 
 def _fetch_curl_cffi(url, timeout):
@@ -179,22 +239,23 @@ def _fetch_curl_cffi(url, timeout):
     Returns (content, headers_dict, load_time) or raises.
     """
     start = time.time()
-    resp = cffi_requests.get(
+    resp = _get_cffi_session().get(
         url,
-        impersonate="chrome124",
-        headers={
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": "en-GB,en;q=0.9",
-            "Cache-Control": "max-age=0",
-            "Upgrade-Insecure-Requests": "1",
-        },
+        headers=_CURL_CFFI_HEADERS,
         timeout=timeout,
         verify=False,
         allow_redirects=True,
+        stream=True,
     )
-    content = resp.text
+    try:
+        body = _read_capped(resp.iter_content(chunk_size=_CHUNK_SIZE))
+        headers = dict(resp.headers)
+    finally:
+        resp.close()
+    charset = re.search(r"charset=([\w-]+)", headers.get("content-type", ""), re.I)
+    content = _decode(body, charset and charset.group(1))
     load_time = time.time() - start
-    return content, dict(resp.headers), load_time
+    return content, headers, load_time
 
 
 def _fetch_urllib(url, headers, timeout):
@@ -205,7 +266,7 @@ def _fetch_urllib(url, headers, timeout):
     ctx.verify_mode = ssl.CERT_NONE
     req = urllib.request.Request(url, headers=headers)
     with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-        content = resp.read().decode("utf-8", errors="ignore")
+        content = resp.read(_MAX_PAGE_BYTES).decode("utf-8", errors="ignore")
         load_time = time.time() - start
         return content, dict(resp.headers), load_time
 
@@ -0,0 +1,78 @@
+"""
+Shared pytest fixtures.
+
+Provides a Flask test client bound to a throwaway SQLite database and a
+``count_queries`` helper used to pin the number of SQL statements that
+cheap endpoints are allowed to emit (guards against N+1 regressions).
+"""
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Environment must be set before webapp/config.py is first imported
+# ---------------------------------------------------------------------------
+_TMP_DIR = tempfile.mkdtemp(prefix='seo-geo-tests-')
+os.environ.setdefault('DATABASE_URL', f'sqlite:///{os.path.join(_TMP_DIR, "test.db")}')
+os.environ.setdefault('OUTPUT_DIR', os.path.join(_TMP_DIR, 'reports'))
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _p in (os.path.join(_PROJECT_ROOT, 'webapp'), os.path.join(_PROJECT_ROOT, 'scripts')):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect every SQL statement *engine* executes inside the block."""
+    from sqlalchemy import event
+
+    queries = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, 'before_cursor_execute', _before_cursor_execute)
+
+
+@pytest.fixture
+def flask_app(monkeypatch):
+    """The real application with CSRF and rate limiting disabled."""
+    from app import app
+    from extensions import db, limiter
+
+    monkeypatch.setitem(app.config, 'TESTING', True)
+    monkeypatch.setitem(app.config, 'WTF_CSRF_ENABLED', False)
+    # Restored after the test; tests that exercise limits re-enable it
+    monkeypatch.setattr(limiter, 'enabled', False)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def admin_client(flask_app):
+    """A test client logged in as an active admin user."""
+    from extensions import db
+    from models import User
+
+    admin = User(email='admin@numiko.com', name='Admin', password_hash='x',
+                 is_active_user=True, is_admin=True)
+    db.session.add(admin)
+    db.session.commit()
+
+    client = flask_app.test_client()
+    with client.session_transaction() as sess:
+        sess['_user_id'] = str(admin.id)
+        sess['_fresh'] = True
+    return client
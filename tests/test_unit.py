@@ -258,94 +258,133 @@ class TestCleanDomain:
 # 3. client_store CRUD
 # ===========================================================================
 
+import uuid
+
 import client_store as cs
 from config import Config
 
 
 class TestClientStore:
-    """Test client CRUD operations using a temporary data file."""
+    """Test client CRUD operations against the SQLite test database."""
 
     @pytest.fixture(autouse=True)
-    def _use_tmp_data_file(self, tmp_path, monkeypatch):
-        """Point Config.DATA_FILE at a temporary location for each test."""
-        tmp_file = str(tmp_path / 'clients.json')
-        monkeypatch.setattr(Config, 'DATA_FILE', tmp_file)
-        # Also update the lock file path used by client_store
-        monkeypatch.setattr(cs, '_LOCK_FILE', tmp_file + '.lock')
+    def _db(self, flask_app):
+        """Every test runs inside the app context with fresh tables."""
+        yield
+
+    @staticmethod
+    def _new_id():
+        return uuid.uuid4().hex
 
     # -- basic reads -------------------------------------------------------
-    def test_load_clients_empty_when_no_file(self):
-        """No file on disk -> empty list."""
+    def test_load_clients_empty_when_no_rows(self):
+        """Empty table -> empty list."""
         assert cs.load_clients() == []
 
-    def test_get_client_bad_id_returns_empty_dict(self):
+    def test_get_client_unknown_id_returns_empty_dict(self):
+        assert cs.get_client(self._new_id()) == {}
+
+    def test_get_client_malformed_id_returns_empty_dict(self):
+        """Ids that are not UUIDs are treated as not found, not as errors."""
         assert cs.get_client('nonexistent-id') == {}
+        assert cs.get_client('c1') == {}
+        assert cs.get_client('') == {}
+
+    def test_save_client_malformed_id_raises(self):
+        with pytest.raises(ValueError):
+            cs.save_client({'id': 'c1', 'name': 'Acme'})
 
     # -- create & read back ------------------------------------------------
     def test_save_client_creates_new(self):
-        client = {'id': 'c1', 'name': 'Acme'}
-        cs.save_client(client)
+        cid = self._new_id()
+        cs.save_client({'id': cid, 'name': 'Acme'})
 
         loaded = cs.load_clients()
         assert len(loaded) == 1
-        assert loaded[0]['id'] == 'c1'
+        assert loaded[0]['id'] == cid
         assert loaded[0]['name'] == 'Acme'
 
+    def test_save_client_accepts_dashed_id(self):
+        cid = uuid.uuid4()
+        cs.save_client({'id': str(cid), 'name': 'Acme'})
+        assert cs.get_client(cid.hex)['name'] == 'Acme'
+
     def test_get_client_returns_correct(self):
-        cs.save_client({'id': 'c1', 'name': 'Acme'})
-        cs.save_client({'id': 'c2', 'name': 'Beta'})
+        c1, c2 = self._new_id(), self._new_id()
+        cs.save_client({'id': c1, 'name': 'Acme'})
+        cs.save_client({'id': c2, 'name': 'Beta'})
 
-        assert cs.get_client('c2')['name'] == 'Beta'
+        assert cs.get_client(c2)['name'] == 'Beta'
 
     # -- update ------------------------------------------------------------
     def test_save_client_updates_existing(self):
-        cs.save_client({'id': 'c1', 'name': 'Acme'})
-        cs.save_client({'id': 'c1', 'name': 'Acme Updated'})
+        cid = self._new_id()
+        cs.save_client({'id': cid, 'name': 'Acme'})
+        cs.save_client({'id': cid, 'name': 'Acme Updated'})
 
         loaded = cs.load_clients()
         assert len(loaded) == 1
         assert loaded[0]['name'] == 'Acme Updated'
 
+    def test_partial_update_only_overwrites_given_fields(self):
+        """The upsert updates only keys present in the dict."""
+        cid = self._new_id()
+        cs.save_client({'id': cid, 'name': 'Acme', 'domain': 'acme.com',
+                        'cms': 'Drupal', 'notes': 'Key account'})
+        cs.save_client({'id': cid, 'cms': 'WordPress'})
+
+        client = cs.get_client(cid)
+        assert client['cms'] == 'WordPress'
+        assert client['name'] == 'Acme'
+        assert client['domain'] == 'acme.com'
+        assert client['notes'] == 'Key account'
+
+    def test_update_never_overwrites_created(self):
+        cid = self._new_id()
+        cs.save_client({'id': cid, 'name': 'Acme', 'created': '2024-01-02T03:04:05+00:00'})
+        cs.save_client({'id': cid, 'name': 'Acme 2', 'created': '2030-01-01T00:00:00+00:00'})
+
+        client = cs.get_client(cid)
+        assert client['name'] == 'Acme 2'
+        assert client['created'].startswith('2024-01-02T03:04:05')
+
+    def test_resave_with_id_only_changes_nothing(self):
+        cid = self._new_id()
+        cs.save_client({'id': cid, 'name': 'Acme', 'domain': 'acme.com'})
+        before = cs.get_client(cid)
+        cs.save_client({'id': cid})
+        assert cs.get_client(cid) == before
+
     # -- delete ------------------------------------------------------------
     def test_delete_client_removes(self):
-        cs.save_client({'id': 'c1', 'name': 'Acme'})
-        cs.save_client({'id': 'c2', 'name': 'Beta'})
+        c1, c2 = self._new_id(), self._new_id()
+        cs.save_client({'id': c1, 'name': 'Acme'})
+        cs.save_client({'id': c2, 'name': 'Beta'})
 
-        cs.delete_client('c1')
+        cs.delete_client(c1)
         loaded = cs.load_clients()
         assert len(loaded) == 1
-        assert loaded[0]['id'] == 'c2'
+        assert loaded[0]['id'] == c2
 
     def test_delete_nonexistent_is_safe(self):
-        """Deleting an ID that does not exist should not crash."""
-        cs.save_client({'id': 'c1', 'name': 'Acme'})
+        """Deleting an ID that does not exist (or is malformed) should not crash."""
+        cs.save_client({'id': self._new_id(), 'name': 'Acme'})
+        cs.delete_client(self._new_id())
         cs.delete_client('no-such-id')
         assert len(cs.load_clients()) == 1
 
-    # -- corrupt file handling ---------------------------------------------
-    def test_corrupt_json_returns_empty(self):
-        """A corrupt JSON file should return [] rather than crash."""
-        with open(Config.DATA_FILE, 'w') as f:
-            f.write('{{{broken json!!!}}}')
-        assert cs.load_clients() == []
-
-    def test_empty_file_returns_empty(self):
-        """A zero-byte file should return []."""
-        with open(Config.DATA_FILE, 'w') as f:
-            pass  # write nothing
-        assert cs.load_clients() == []
-
     # -- multiple operations -----------------------------------------------
     def test_full_lifecycle(self):
         """Create -> read -> update -> delete lifecycle."""
-        cs.save_client({'id': 'x', 'name': 'Original'})
-        assert cs.get_client('x')['name'] == 'Original'
+        cid = self._new_id()
+        cs.save_client({'id': cid, 'name': 'Original'})
+        assert cs.get_client(cid)['name'] == 'Original'
 
-        cs.save_client({'id': 'x', 'name': 'Modified'})
-        assert cs.get_client('x')['name'] == 'Modified'
+        cs.save_client({'id': cid, 'name': 'Modified'})
+        assert cs.get_client(cid)['name'] == 'Modified'
 
-        cs.delete_client('x')
-        assert cs.get_client('x') == {}
+        cs.delete_client(cid)
+        assert cs.get_client(cid) == {}
         assert cs.load_clients() == []
 
 
@@ -760,6 +799,32 @@ class TestUserModel:
                      deactivated_at=datetime.now(timezone.utc))
             assert not u.is_active
 
+    def test_malformed_email_rejected_by_model(self, _user_in_app):
+        User, _db, app = _user_in_app
+        with app.app_context():
+            with pytest.raises(ValueError):
+                User(email='not-an-email', name='T', password_hash='x')
+
+    # -- transparent rehash on login ----------------------------------------
+
+    def test_legacy_work_factor_needs_rehash(self, _user_in_app):
+        User, _db, app = _user_in_app
+        with app.app_context():
+            u = User(email='t@numiko.com', name='T',
+                     password_hash=generate_password_hash('Test1234', method='pbkdf2:sha256:1000'))
+            assert u.check_password('Test1234')
+            assert u.password_needs_rehash()
+
+    def test_current_hash_does_not_need_rehash(self, _user_in_app):
+        User, _db, app = _user_in_app
+        with app.app_context():
+            u = User(email='t@numiko.com', name='T')
+            u.set_password('Test1234')
+            assert u.password_hash.startswith('$argon2id$')
+            assert u.check_password('Test1234')
+            assert not u.check_password('wrong')
+            assert not u.password_needs_rehash()
+
 
 # ===========================================================================
 # 9. Password validation
@@ -834,6 +899,12 @@ class TestEmailValidation:
         """sub.numiko.com is NOT @numiko.com."""
         assert not self._check('user@sub.numiko.com')
 
+    def test_empty_local_part_rejected(self):
+        assert not self._check('@numiko.com')
+
+    def test_whitespace_rejected(self):
+        assert not self._check('first last@numiko.com')
+
 
 # ===========================================================================
 # 11. Password reset tokens
@@ -901,3 +972,311 @@ class TestPasswordResetTokens:
         t1 = generate_password_reset_token('alice@numiko.com')
         t2 = generate_password_reset_token('alice@numiko.com')
         assert t1 != t2
+
+
+# ===========================================================================
+# 12. Query-count guardrails (N+1 prevention)
+# ===========================================================================
+
+from conftest import count_queries
+
+
+class TestQueryCounts:
+    """Pin the number of SQL statements cheap endpoints may emit."""
+
+    def test_admin_users_bounded_queries(self, flask_app, admin_client):
+        from extensions import db
+        from models import User
+
+        for i in range(5):
+            db.session.add(User(email=f'user{i}@numiko.com', name=f'U{i}',
+                                password_hash='x'))
+        db.session.commit()
+
+        with count_queries(db.engine) as queries:
+            resp = admin_client.get('/admin/users')
+        assert resp.status_code == 200
+        # user loader + pagination count + page select
+        assert len(queries) <= 3, queries
+
+    def test_login_page_when_authenticated_bounded_queries(self, flask_app, admin_client):
+        from extensions import db
+
+        with count_queries(db.engine) as queries:
+            resp = admin_client.get('/login')
+        assert resp.status_code == 302
+        assert len(queries) <= 2, queries
+
+
+# ===========================================================================
+# 13. Single-use activation and reset tokens
+# ===========================================================================
+
+
+class TestSingleUseTokens:
+    """A consumed activation or reset link must not work a second time."""
+
+    @staticmethod
+    def _add_user(email, **attrs):
+        from extensions import db
+        from models import User
+
+        user = User(email=email, name='T', **attrs)
+        user.set_password('Original1')
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+    def test_mark_and_check_token(self):
+        from email_service import is_token_used, mark_token_used
+
+        token = f'unit-{uuid.uuid4().hex}'
+        assert not is_token_used(token)
+        mark_token_used(token)
+        assert is_token_used(token)
+
+    def test_reused_activation_token_rejected(self, flask_app):
+        from sqlalchemy import update
+        from extensions import db
+        from email_service import generate_activation_token
+        from models import User
+
+        email = f'act-{uuid.uuid4().hex[:8]}@numiko.com'
+        user_id = self._add_user(email, is_active_user=False)
+        token = generate_activation_token(email)
+        client = flask_app.test_client()
+
+        client.get(f'/activate/{token}')
+        assert db.session.get(User, user_id).is_active_user
+
+        # Deactivate behind the token's back; replaying the link must not
+        # switch the account back on.
+        db.session.execute(update(User).where(User.id == user_id)
+                           .values(is_active_user=False))
+        db.session.commit()
+        resp = client.get(f'/activate/{token}')
+        assert resp.status_code == 302
+        db.session.expire_all()
+        assert not db.session.get(User, user_id).is_active_user
+
+    def test_reused_reset_token_rejected(self, flask_app):
+        from extensions import db
+        from email_service import generate_password_reset_token
+        from models import User
+
+        email = f'reset-{uuid.uuid4().hex[:8]}@numiko.com'
+        user_id = self._add_user(email, is_active_user=True)
+        token = generate_password_reset_token(email)
+        client = flask_app.test_client()
+
+        resp = client.post(f'/reset-password/{token}', data={
+            'password': 'Changed12', 'confirm_password': 'Changed12'})
+        assert resp.status_code == 302
+        assert '/login' in resp.headers['Location']
+
+        resp = client.post(f'/reset-password/{token}', data={
+            'password': 'Hijacked12', 'confirm_password': 'Hijacked12'})
+        assert resp.status_code == 302
+        assert '/forgot-password' in resp.headers['Location']
+        db.session.expire_all()
+        user = db.session.get(User, user_id)
+        assert user.check_password('Changed12')
+        assert not user.check_password('Hijacked12')
+
+
+# ===========================================================================
+# 14. Admin user list pagination
+# ===========================================================================
+
+
+class TestAdminUsersPagination:
+    """/admin/users shows ADMIN_USERS_PER_PAGE users per page, newest first."""
+
+    def test_page_two_returns_next_users(self, flask_app, admin_client):
+        from datetime import datetime, timedelta
+        from auth import ADMIN_USERS_PER_PAGE
+        from extensions import db
+        from models import User
+
+        # The admin (created now) is newest, then user60 ... user01
+        base = datetime(2024, 1, 1)
+        for i in range(1, 61):
+            db.session.add(User(email=f'user{i:02d}@numiko.com', name=f'U{i}',
+                                password_hash='x',
+                                created_at=base + timedelta(minutes=i)))
+        db.session.commit()
+        assert ADMIN_USERS_PER_PAGE == 50
+
+        page1 = admin_client.get('/admin/users').get_data(as_text=True)
+        page2 = admin_client.get('/admin/users?page=2').get_data(as_text=True)
+
+        # Page 1: admin + user60 ... user12 (50 rows)
+        assert 'user60@numiko.com' in page1
+        assert 'user12@numiko.com' in page1
+        assert 'user11@numiko.com' not in page1
+        # Page 2: the remaining user11 ... user01
+        for i in range(1, 12):
+            assert f'user{i:02d}@numiko.com' in page2
+        for i in range(12, 61):
+            assert f'user{i:02d}@numiko.com' not in page2
+        assert 'admin@numiko.com' not in page2.split('<tbody', 1)[-1]
+
+
+# ===========================================================================
+# 15. Login rate limits
+# ===========================================================================
+
+
+class TestLoginRateLimits:
+    """Per-IP and per-account throttling on POST /login."""
+
+    @pytest.fixture
+    def limited_client(self, flask_app, monkeypatch):
+        """A test client with the rate limiter switched on for this test only."""
+        from extensions import limiter
+
+        monkeypatch.setattr(limiter, 'enabled', True)
+        limiter.reset()
+        yield flask_app.test_client()
+        limiter.reset()
+
+    def test_sixth_login_post_in_a_minute_is_limited(self, limited_client):
+        form = {'email': 'nobody@numiko.com', 'password': 'wrong'}
+        for _ in range(5):
+            assert limited_client.post('/login', data=form).status_code == 200
+        assert limited_client.post('/login', data=form).status_code == 429
+
+    def test_login_get_is_not_limited(self, limited_client):
+        for _ in range(7):
+            assert limited_client.get('/login').status_code == 200
+
+    def test_failures_elsewhere_do_not_lock_out_the_account(self, limited_client):
+        """Failed attempts from other addresses leave the owner able to log in."""
+        from extensions import db
+        from models import User
+
+        user = User(email='target@numiko.com', name='T', is_active_user=True)
+        user.set_password('Correct12')
+        db.session.add(user)
+        db.session.commit()
+
+        bad = {'email': 'target@numiko.com', 'password': 'wrong'}
+        for i in range(25):
+            resp = limited_client.post('/login', data=bad,
+                                       environ_base={'REMOTE_ADDR': f'10.0.0.{i + 1}'})
+            assert resp.status_code == 200
+        resp = limited_client.post('/login', data={'email': 'target@numiko.com',
+                                                   'password': 'Correct12'},
+                                   environ_base={'REMOTE_ADDR': '10.0.1.1'})
+        assert resp.status_code == 302
+
+    def test_account_key_is_per_address_and_email(self, flask_app):
+        from auth import _login_email_key
+
+        def key(addr, email):
+            with flask_app.test_request_context('/login', method='POST',
+                                                data={'email': email},
+                                                environ_base={'REMOTE_ADDR': addr}):
+                return _login_email_key()
+
+        assert key('10.0.0.1', ' Target@Numiko.com ') == key('10.0.0.1', 'target@numiko.com')
+        assert key('10.0.0.1', 'target@numiko.com') != key('10.0.0.2', 'target@numiko.com')
+        assert key('10.0.0.1', 'target@numiko.com') != key('10.0.0.1', 'other@numiko.com')
+
+    def test_only_failed_logins_count_toward_account_limit(self):
+        from auth import _login_failed
+
+        class _Resp:
+            def __init__(self, status_code):
+                self.status_code = status_code
+
+        assert _login_failed(_Resp(200))
+        assert _login_failed(_Resp(429))
+        assert not _login_failed(_Resp(302))
+
+
+# ===========================================================================
+# 16. Content guide skeleton substitution
+# ===========================================================================
+
+
+class TestContentGuideSkeleton:
+    """The cached skeleton's {{TOKEN}} sentinels are all filled per client,
+    in the body and in the cover (first-page) footer.  Uses the real Numiko
+    template, since the footer comes from it."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_skeleton(self):
+        # Other tests may have cached a skeleton built on a blank document
+        _cg_mod._skeleton_bytes.cache_clear()
+        yield
+        _cg_mod._skeleton_bytes.cache_clear()
+
+    @staticmethod
+    def _saved_parts(doc):
+        """{part name: XML text} for every body, header and footer part."""
+        import io
+        import zipfile
+
+        buf = io.BytesIO()
+        doc.save(buf)
+        with zipfile.ZipFile(buf) as zf:
+            return {name: zf.read(name).decode('utf-8') for name in zf.namelist()
+                    if name.startswith('word/') and name.endswith('.xml')}
+
+    def test_no_sentinel_left_and_client_name_everywhere(self):
+        doc = build_content_guide({
+            'client_name': 'Acme Widgets',
+            'client_domain': 'acme-widgets.com',
+            'cms': 'WordPress',
+        })
+
+        for name, xml in self._saved_parts(doc).items():
+            assert '{{' not in xml, name
+
+        body = '\n'.join(p.text for p in doc.paragraphs)
+        assert 'Acme Widgets' in body
+        assert 'acme-widgets.com' in body
+        assert 'WordPress' in body
+
+        footer = doc.sections[0].first_page_footer
+        footer_text = '\n'.join(p.text for p in footer.paragraphs)
+        assert 'Acme Widgets' in footer_text
+
+    def test_second_client_does_not_see_first_clients_strings(self):
+        build_content_guide({'client_name': 'First Co', 'client_domain': 'first.com'})
+        doc = build_content_guide({'client_name': 'Second Co', 'client_domain': 'second.com'})
+
+        xml = '\n'.join(self._saved_parts(doc).values())
+        assert 'Second Co' in xml
+        assert 'First Co' not in xml
+        assert 'first.com' not in xml
+
+
+# ===========================================================================
+# 17. add_table markup rendering
+# ===========================================================================
+
+
+class TestAddTable:
+    """add_table renders rows as a markup string; text must survive escaping."""
+
+    def test_special_characters_round_trip(self):
+        import io
+
+        headers = ('Tom & Jerry', 'a < b', 'Say "hi"')
+        rows = [
+            ('R&D <team>', '"quoted" & <tagged>', "it's > 3"),
+            ('short row',),
+        ]
+        doc = DocxDocument()
+        _docx_helpers.add_table(doc, headers, rows)
+
+        buf = io.BytesIO()
+        doc.save(buf)
+        buf.seek(0)
+        table = DocxDocument(buf).tables[-1]
+
+        assert [c.text for c in table.rows[0].cells] == list(headers)
+        assert [c.text for c in table.rows[1].cells] == list(rows[0])
+        assert [c.text for c in table.rows[2].cells] == ['short row', '', '']
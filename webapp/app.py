@@ -5,16 +5,16 @@ import io
 import csv
 import uuid
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from urllib.parse import urlparse
 
 # Put webapp/ on path so local imports work regardless of where flask is launched
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_WEBAPP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _WEBAPP_DIR not in sys.path:
+    sys.path.insert(0, _WEBAPP_DIR)
 
 from flask import Flask, render_template, request, redirect, url_for, send_file, flash, Response, jsonify
 from flask_wtf.csrf import CSRFProtect
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
 from flask_login import login_required
 from werkzeug.utils import secure_filename
 
@@ -25,7 +25,7 @@ from config import (
     DEFAULT_KEYWORD_LIMIT,
     MAX_KEYWORD_EXPORT_LIMIT,
 )
-from extensions import db, login_manager, migrate
+from extensions import db, login_manager, migrate, server_session, limiter
 from auth import auth_bp
 from client_store import load_clients, save_client, delete_client, get_client
 from services.audit_service import run_audit
@@ -33,6 +33,7 @@ from services.keyword_service import run_keyword_research
 from services.ai_visibility_service import run_ai_visibility, LOCATION_OPTIONS
 from services.domain_service import run_domain_overview
 from services.report_service import generate_content_guide_docx, generate_geo_audit_docx
+from report_generators.docx_helpers import default_report_date
 
 # ── Logging ──────────────────────────────────────────────────────────────────
 logger = logging.getLogger(__name__)
@@ -49,20 +50,21 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = Config.SQLALCHEMY_TRACK_MODIFICAT
 app.config['SESSION_COOKIE_HTTPONLY'] = Config.SESSION_COOKIE_HTTPONLY
 app.config['SESSION_COOKIE_SAMESITE'] = Config.SESSION_COOKIE_SAMESITE
 app.config['SESSION_COOKIE_SECURE'] = Config.SESSION_COOKIE_SECURE
+app.config['RATELIMIT_STORAGE_URI'] = Config.REDIS_URL or 'memory://'
+if Config.REDIS_URL:
+    import redis
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = redis.Redis.from_url(Config.REDIS_URL)
 
 # ── Extensions ───────────────────────────────────────────────────────────────
 csrf = CSRFProtect(app)
-
-limiter = Limiter(
-    get_remote_address,
-    app=app,
-    default_limits=["120 per minute"],
-    storage_uri=os.environ.get('REDIS_URL', 'memory://'),
-)
+limiter.init_app(app)
 
 db.init_app(app)
 login_manager.init_app(app)
 migrate.init_app(app, db)
+if Config.REDIS_URL:
+    server_session.init_app(app)
 
 # ── Jinja2 custom filters ─────────────────────────────────────────────────────
 def _format_number(value):
@@ -87,6 +89,16 @@ app.register_blueprint(auth_bp)
 # Apply rate limits to auth POST routes
 limiter.limit("10 per minute", methods=["POST"])(auth_bp)
 
+# ── Email link templates ─────────────────────────────────────────────────────
+# Built once from the URL map so email_service only has to .format() a token
+if Config.EXTERNAL_BASE_URL:
+    with app.test_request_context(base_url=Config.EXTERNAL_BASE_URL):
+        for _key, _endpoint in (('_ACTIVATION_URL_TEMPLATE', 'auth.activate'),
+                                ('_PASSWORD_RESET_URL_TEMPLATE', 'auth.reset_password')):
+            app.config[_key] = url_for(
+                _endpoint, token='__token__', _external=True,
+            ).replace('__token__', '{token}')
+
 # ── Create tables (if not using migrations) ──────────────────────────────────
 with app.app_context():
     from models import User, Client  # noqa: F401  ensure models are registered
@@ -101,7 +113,7 @@ with app.app_context():
             if not _existing_seed:
                 _seed = User(email=_SEED_EMAIL, name='Seed User',
                              is_active_user=True, is_admin=True)
-                _seed.activated_at = datetime.now()
+                _seed.activated_at = datetime.now(timezone.utc)
                 _seed.set_password(_SEED_PASS)
                 db.session.add(_seed)
                 db.session.commit()
@@ -246,7 +258,7 @@ def content_guide():
             'client_name': request.form.get('client_name', '').strip(),
             'client_domain': request.form.get('client_domain', '').strip(),
             'project_name': request.form.get('project_name', '').strip(),
-            'date': request.form.get('date', '').strip() or datetime.now().strftime('%B %Y'),
+            'date': request.form.get('date', '').strip() or default_report_date(),
             'cms': request.form.get('cms', DEFAULT_CMS).strip(),
         }
 
@@ -314,7 +326,7 @@ def audit_report():
         'client_name': client_name or domain,
         'client_domain': domain,
         'project_name': project_name,
-        'date': datetime.now().strftime('%B %Y'),
+        'date': default_report_date(),
         'logo_path': Config.AGENCY_LOGO_PATH,
     }
 
@@ -365,7 +377,7 @@ def client_new():
             'cms': request.form.get('cms', '').strip(),
             'location_code': int(request.form.get('location_code', DEFAULT_LOCATION_CODE) or DEFAULT_LOCATION_CODE),
             'notes': request.form.get('notes', '').strip(),
-            'created': datetime.now().isoformat(),
+            'created': datetime.now(timezone.utc).isoformat(),
         }
         if not client['name']:
             flash('Client name is required.', 'error')
@@ -555,7 +567,7 @@ def api_client_quick_create():
         'cms': '',
         'location_code': DEFAULT_LOCATION_CODE,
         'notes': '',
-        'created': datetime.now().isoformat(),
+        'created': datetime.now(timezone.utc).isoformat(),
     }
     save_client(client)
     logger.info("Quick-created client: %s (%s)", client['name'], client['id'])
@@ -7,25 +7,29 @@ user management.
 """
 import re
 import logging
-from datetime import datetime, timezone
 from functools import wraps
 from typing import Optional
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, abort
+from flask import Blueprint, render_template, request, redirect, url_for, flash, abort, g
+from flask_limiter.util import get_remote_address
 from flask_login import login_user, logout_user, login_required, current_user
+from sqlalchemy import select, update, func, not_
 
-from extensions import db, login_manager
-from models import User
+from extensions import db, login_manager, limiter
+from models import EMAIL_RE, User, check_dummy_password, utcnow
 from config import Config
 from email_service import (
     generate_activation_token, verify_activation_token, send_activation_email,
     generate_password_reset_token, verify_password_reset_token, send_password_reset_email,
+    is_token_used, mark_token_used,
 )
 
 logger = logging.getLogger(__name__)
 
 auth_bp = Blueprint('auth', __name__)
 
+ADMIN_USERS_PER_PAGE = 50
+
 
 # ── Flask-Login user loader ──────────────────────────────────────────────────
 
@@ -40,31 +44,59 @@ def _unauthorized():
     return redirect(url_for('auth.login', next=request.path))
 
 
+@auth_bp.before_request
+def _cache_current_user():
+    """Resolve ``current_user`` once per auth request and keep it on ``g``.
+
+    Handlers below read ``g.user`` instead of going through the
+    ``current_user`` proxy on every attribute access.
+    """
+    g.user = current_user._get_current_object()
+
+
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 def admin_required(f):
-    """Decorator: login_required + must be an admin."""
+    """Decorator: ``login_required`` + must be an admin.
+
+    Authentication (including its LOGIN_DISABLED and OPTIONS exemptions) is
+    left to ``login_required``; the role check reads the user already
+    resolved onto ``g``.  Role bits are deliberately not cached in the
+    session cookie: a demoted admin must lose access on their very next
+    request.
+    """
     @wraps(f)
     @login_required
     def decorated(*args, **kwargs):
-        if not current_user.is_admin:
+        if not g.user.is_admin:
             abort(403)
         return f(*args, **kwargs)
     return decorated
 
 
+# Resolved once at import — the allowed domain is fixed for the process.
+_ALLOWED_DOMAIN_SUFFIX = '@' + Config.ALLOWED_EMAIL_DOMAIN
+
+
 def _is_valid_email(email: str) -> bool:
-    """Check that *email* belongs to the allowed domain."""
-    domain = Config.ALLOWED_EMAIL_DOMAIN.lower()
-    return bool(email) and email.lower().endswith(f'@{domain}')
+    """Check that *email* is well formed and belongs to the allowed domain."""
+    if not email:
+        return False
+    email = email.lower()
+    return email.endswith(_ALLOWED_DOMAIN_SUFFIX) and EMAIL_RE.fullmatch(email) is not None
 
 
 _PASSWORD_RE_UPPER = re.compile(r'[A-Z]')
 _PASSWORD_RE_DIGIT = re.compile(r'[0-9]')
+# Single-pass check for the common case (a password that meets every rule);
+# the individual patterns above are only consulted to pick the error message.
+_PASSWORD_RE_STRONG = re.compile(r'(?=.*[A-Z])(?=.*[0-9]).{8,}', re.DOTALL)
 
 
 def _validate_password(password: str) -> Optional[str]:
     """Return an error message if *password* is too weak, else ``None``."""
+    if _PASSWORD_RE_STRONG.fullmatch(password):
+        return None
     if len(password) < 8:
         return 'Password must be at least 8 characters.'
     if not _PASSWORD_RE_UPPER.search(password):
@@ -74,11 +106,29 @@ def _validate_password(password: str) -> Optional[str]:
     return None
 
 
+def _login_email_key() -> str:
+    """Rate-limit key for per-account login throttling from one address.
+
+    Keyed on address *and* email so failures from one client cannot lock the
+    account out for everyone else.
+    """
+    return f"login:{get_remote_address()}|{request.form.get('email', '').strip().lower()}"
+
+
+def _login_failed(response) -> bool:
+    """Only failed attempts count toward the per-account limit; a successful
+    login redirects."""
+    return response.status_code != 302
+
+
 # ── Public routes ────────────────────────────────────────────────────────────
 
 @auth_bp.route('/login', methods=['GET', 'POST'])
+@limiter.limit("5 per minute;50 per hour", methods=["POST"])
+@limiter.limit("20 per hour", methods=["POST"], key_func=_login_email_key,
+               deduct_when=_login_failed)
 def login():
-    if current_user.is_authenticated:
+    if g.user.is_authenticated:
         return redirect(url_for('index'))
 
     if request.method == 'POST':
@@ -86,11 +136,34 @@ def login():
         password = request.form.get('password', '')
         remember = bool(request.form.get('remember'))
 
-        user = User.query.filter_by(email=email).first()
+        # Common path: only active accounts match, so a hit needs no further
+        # state checks in Python.
+        user = db.session.execute(
+            select(User).where(User.email == email, User.is_active)
+        ).scalar_one_or_none()
 
         if user is None:
-            logger.warning('[LOGIN] FAIL user not found: %s', email)
-            flash('Invalid email or password.', 'error')
+            # Rare path: probe by email alone to pick the right message.
+            # The password is still checked first so account state is
+            # never disclosed to someone without the credentials.
+            inactive = db.session.execute(
+                select(User).where(User.email == email)
+            ).scalar_one_or_none()
+            if inactive is None:
+                check_dummy_password(password)
+                logger.warning('[LOGIN] FAIL user not found: %s', email)
+                flash('Invalid email or password.', 'error')
+            elif not inactive.check_password(password):
+                logger.warning('[LOGIN] FAIL wrong password for: %s (id=%s, active=%s)',
+                               email, inactive.id, inactive.is_active_user)
+                flash('Invalid email or password.', 'error')
+            elif inactive.deactivated_at:
+                logger.warning('[LOGIN] FAIL account revoked: %s', email)
+                flash('Your account has been revoked. Contact an administrator.', 'error')
+            else:
+                logger.warning('[LOGIN] FAIL account not activated: %s', email)
+                flash('Your account has not been activated yet. '
+                      'Check your email for the activation link.', 'error')
             return render_template('login.html', email=email)
 
         if not user.check_password(password):
@@ -99,18 +172,15 @@ def login():
             flash('Invalid email or password.', 'error')
             return render_template('login.html', email=email)
 
-        if not user.is_active:
-            if user.deactivated_at:
-                logger.warning('[LOGIN] FAIL account revoked: %s', email)
-                flash('Your account has been revoked. Contact an administrator.', 'error')
-            else:
-                logger.warning('[LOGIN] FAIL account not activated: %s', email)
-                flash('Your account has not been activated yet. '
-                      'Check your email for the activation link.', 'error')
-            return render_template('login.html', email=email)
+        if user.password_needs_rehash():
+            user.set_password(password)
+            logger.info('[LOGIN] Password hash upgraded for: %s', email)
 
         login_user(user, remember=remember)
-        user.last_login = datetime.now(timezone.utc)
+        # Let the database stamp the time — single-column UPDATE, no ORM flush
+        db.session.execute(
+            update(User).where(User.id == user.id).values(last_login=utcnow())
+        )
         db.session.commit()
         logger.info('[LOGIN] OK: %s', email)
 
@@ -121,8 +191,9 @@ def login():
 
 
 @auth_bp.route('/register', methods=['GET', 'POST'])
+@limiter.limit("3 per minute", methods=["POST"])
 def register():
-    if current_user.is_authenticated:
+    if g.user.is_authenticated:
         return redirect(url_for('index'))
 
     if request.method == 'POST':
@@ -157,7 +228,7 @@ def register():
         user.set_password(password)
 
         # Auto-promote to admin if this is the ADMIN_EMAIL
-        if Config.ADMIN_EMAIL and email == Config.ADMIN_EMAIL.lower():
+        if Config.ADMIN_EMAIL and email == Config.ADMIN_EMAIL:
             user.is_admin = True
 
         db.session.add(user)
@@ -174,7 +245,13 @@ def register():
 
 
 @auth_bp.route('/activate/<token>')
+@limiter.limit("10 per minute")
 def activate(token):
+    if is_token_used(token):
+        # Repeat click on a link we have already processed
+        flash('Account already activated. Please log in.', 'error')
+        return redirect(url_for('auth.login'))
+
     email = verify_activation_token(token)
     if email is None:
         flash('Invalid or expired activation link.', 'error')
@@ -189,9 +266,12 @@ def activate(token):
         flash('Account already activated. Please log in.', 'error')
         return redirect(url_for('auth.login'))
 
-    user.is_active_user = True
-    user.activated_at = datetime.now(timezone.utc)
+    db.session.execute(
+        update(User).where(User.id == user.id)
+        .values(is_active_user=True, activated_at=utcnow())
+    )
     db.session.commit()
+    mark_token_used(token)
     logger.info('User activated: %s', email)
 
     flash('Your account has been activated! You can now log in.')
@@ -201,7 +281,7 @@ def activate(token):
 @auth_bp.route('/logout')
 @login_required
 def logout():
-    logger.info('User logged out: %s', current_user.email)
+    logger.info('User logged out: %s', g.user.email)
     logout_user()
     flash('You have been logged out.')
     return redirect(url_for('auth.login'))
@@ -210,8 +290,9 @@ def logout():
 # ── Password reset ────────────────────────────────────────────────────────────
 
 @auth_bp.route('/forgot-password', methods=['GET', 'POST'])
+@limiter.limit("3 per minute", methods=["POST"])
 def forgot_password():
-    if current_user.is_authenticated:
+    if g.user.is_authenticated:
         return redirect(url_for('index'))
 
     if request.method == 'POST':
@@ -241,10 +322,10 @@ def forgot_password():
 
 @auth_bp.route('/reset-password/<token>', methods=['GET', 'POST'])
 def reset_password(token):
-    if current_user.is_authenticated:
+    if g.user.is_authenticated:
         return redirect(url_for('index'))
 
-    email = verify_password_reset_token(token)
+    email = None if is_token_used(token) else verify_password_reset_token(token)
     if email is None:
         flash('This password reset link is invalid or has expired.', 'error')
         return redirect(url_for('auth.forgot_password'))
@@ -272,6 +353,7 @@ def reset_password(token):
 
         user.set_password(password)
         db.session.commit()
+        mark_token_used(token)
         logger.info('[PASSWORD RESET] Password updated for: %s', email)
         flash('Your password has been reset. You can now log in.')
         return redirect(url_for('auth.login'))
@@ -282,8 +364,9 @@ def reset_password(token):
 # ── Resend activation ─────────────────────────────────────────────────────────
 
 @auth_bp.route('/resend-activation', methods=['GET', 'POST'])
+@limiter.limit("3 per minute", methods=["POST"])
 def resend_activation():
-    if current_user.is_authenticated:
+    if g.user.is_authenticated:
         return redirect(url_for('index'))
 
     if request.method == 'POST':
@@ -309,35 +392,47 @@ def resend_activation():
 @auth_bp.route('/admin/users')
 @admin_required
 def admin_users():
-    users = User.query.order_by(User.created_at.desc()).all()
-    return render_template('admin/users.html', users=users)
+    pagination = db.paginate(
+        select(User).order_by(User.created_at.desc()),
+        per_page=ADMIN_USERS_PER_PAGE,
+        error_out=False,
+    )
+    return render_template('admin/users.html', users=pagination.items,
+                           pagination=pagination)
 
 
 @auth_bp.route('/admin/users/<int:user_id>/toggle-active', methods=['POST'])
 @admin_required
 def admin_toggle_active(user_id):
+    # Reject self-targeting before touching the DB; the acting admin is
+    # already loaded (g.user) by the user loader.
+    if user_id == g.user.id:
+        flash('You cannot revoke your own access.', 'error')
+        return redirect(url_for('auth.admin_users'))
+
     user = db.session.get(User, user_id)
     if user is None:
         flash('User not found.', 'error')
         return redirect(url_for('auth.admin_users'))
 
-    if user.id == current_user.id:
-        flash('You cannot revoke your own access.', 'error')
-        return redirect(url_for('auth.admin_users'))
-
+    # Minimal single-statement UPDATEs; the loaded instance is left alone
+    # (it is expired by the commit anyway).
+    stmt = (update(User).where(User.id == user_id)
+            .execution_options(synchronize_session=False))
     if user.deactivated_at is None and user.is_active_user:
         # Revoke
-        user.deactivated_at = datetime.now(timezone.utc)
+        db.session.execute(stmt.values(deactivated_at=utcnow()))
         flash(f'Access revoked for {user.email}.')
-        logger.info('Admin %s revoked access for %s', current_user.email, user.email)
+        logger.info('Admin %s revoked access for %s', g.user.email, user.email)
     else:
         # Restore
-        user.deactivated_at = None
-        user.is_active_user = True
-        if user.activated_at is None:
-            user.activated_at = datetime.now(timezone.utc)
+        db.session.execute(stmt.values(
+            deactivated_at=None,
+            is_active_user=True,
+            activated_at=func.coalesce(User.activated_at, utcnow()),
+        ))
         flash(f'Access restored for {user.email}.')
-        logger.info('Admin %s restored access for %s', current_user.email, user.email)
+        logger.info('Admin %s restored access for %s', g.user.email, user.email)
 
     db.session.commit()
     return redirect(url_for('auth.admin_users'))
@@ -346,39 +441,49 @@ def admin_toggle_active(user_id):
 @auth_bp.route('/admin/users/<int:user_id>/toggle-admin', methods=['POST'])
 @admin_required
 def admin_toggle_admin(user_id):
+    # Reject self-targeting before touching the DB; the acting admin is
+    # already loaded (g.user) by the user loader.
+    if user_id == g.user.id:
+        flash('You cannot change your own admin status.', 'error')
+        return redirect(url_for('auth.admin_users'))
+
     user = db.session.get(User, user_id)
     if user is None:
         flash('User not found.', 'error')
         return redirect(url_for('auth.admin_users'))
 
-    if user.id == current_user.id:
-        flash('You cannot change your own admin status.', 'error')
-        return redirect(url_for('auth.admin_users'))
-
-    user.is_admin = not user.is_admin
-    db.session.commit()
+    # Flip the flag in SQL and read the new value back via RETURNING
+    is_admin = db.session.execute(
+        update(User).where(User.id == user_id)
+        .values(is_admin=not_(User.is_admin))
+        .returning(User.is_admin)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
 
-    action = 'promoted to admin' if user.is_admin else 'demoted from admin'
+    action = 'promoted to admin' if is_admin else 'demoted from admin'
     flash(f'{user.email} {action}.')
-    logger.info('Admin %s %s %s', current_user.email, action, user.email)
+    logger.info('Admin %s %s %s', g.user.email, action, user.email)
+    db.session.commit()
     return redirect(url_for('auth.admin_users'))
 
 
 @auth_bp.route('/admin/users/<int:user_id>/delete', methods=['POST'])
 @admin_required
 def admin_delete_user(user_id):
+    # Reject self-targeting before touching the DB; the acting admin is
+    # already loaded (g.user) by the user loader.
+    if user_id == g.user.id:
+        flash('You cannot delete your own account.', 'error')
+        return redirect(url_for('auth.admin_users'))
+
     user = db.session.get(User, user_id)
     if user is None:
         flash('User not found.', 'error')
         return redirect(url_for('auth.admin_users'))
 
-    if user.id == current_user.id:
-        flash('You cannot delete your own account.', 'error')
-        return redirect(url_for('auth.admin_users'))
-
     email = user.email
     db.session.delete(user)
     db.session.commit()
     flash(f'User {email} deleted.')
-    logger.info('Admin %s deleted user %s', current_user.email, email)
+    logger.info('Admin %s deleted user %s', g.user.email, email)
     return redirect(url_for('auth.admin_users'))
@@ -9,6 +9,10 @@ code needs to change.
 import logging
 import uuid
 from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from extensions import db
 from models import Client
@@ -18,63 +22,89 @@ logger = logging.getLogger(__name__)
 
 def load_clients() -> list:
     """Return all clients as a list of dicts, ordered by creation date."""
-    return [c.to_dict() for c in Client.query.order_by(Client.created.asc()).all()]
+    return Client.bulk_to_dict(db.session)
+
+
+def _to_uuid(client_id) -> Optional[uuid.UUID]:
+    """Parse a client id (32-char hex or dashed form); ``None`` if malformed."""
+    if isinstance(client_id, uuid.UUID):
+        return client_id
+    try:
+        return uuid.UUID(str(client_id))
+    except ValueError:
+        return None
 
 
 def get_client(client_id: str) -> dict:
     """Return a single client as a dict, or an empty dict if not found."""
-    c = db.session.get(Client, client_id)
+    cid = _to_uuid(client_id)
+    c = db.session.get(Client, cid) if cid else None
     return c.to_dict() if c else {}
 
 
+def _parse_created(created_raw) -> datetime:
+    """Coerce a 'created' value (ISO string, datetime or missing) to a datetime."""
+    if isinstance(created_raw, datetime):
+        return created_raw
+    if isinstance(created_raw, str):
+        try:
+            return datetime.fromisoformat(created_raw)
+        except ValueError:
+            pass
+    return datetime.now(timezone.utc)
+
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    'postgresql': pg_insert,
+    'sqlite': sqlite_insert,
+}
+
+
 def save_client(client: dict) -> None:
     """Insert or update a client record.
 
-    ``client`` must be a dict with at least 'id' and 'name' keys.
+    ``client`` must be a dict with at least 'id' and 'name' keys.  Issues a
+    single ``INSERT … ON CONFLICT (id) DO UPDATE``; on conflict only the
+    fields present in ``client`` are overwritten ('created' never is).
     """
-    client_id = client.get('id') or uuid.uuid4().hex
-    existing = db.session.get(Client, client_id)
-
-    if existing:
-        existing.name = client.get('name', existing.name)
-        existing.domain = client.get('domain', existing.domain) or ''
-        existing.project_name = client.get('project_name', existing.project_name) or ''
-        existing.cms = client.get('cms', existing.cms) or ''
-        existing.location_code = int(client.get('location_code', existing.location_code) or 2826)
-        existing.notes = client.get('notes', existing.notes) or ''
-        logger.info('Updated client %s', client_id)
+    raw_id = client.get('id')
+    client_id = _to_uuid(raw_id) if raw_id else uuid.uuid4()
+    if client_id is None:
+        raise ValueError(f'Invalid client id: {raw_id!r}')
+    row = {
+        'id': client_id,
+        'name': client.get('name', ''),
+        'domain': client.get('domain', '') or '',
+        'project_name': client.get('project_name', '') or '',
+        'cms': client.get('cms', '') or '',
+        'location_code': int(client.get('location_code', 2826) or 2826),
+        'notes': client.get('notes', '') or '',
+        'created': _parse_created(client.get('created')),
+    }
+
+    insert = _UPSERT_INSERTS.get(db.session.get_bind().dialect.name)
+    if insert is None:
+        # Dialect without ON CONFLICT support — fall back to an ORM merge
+        db.session.merge(Client(**row))
     else:
-        # Parse 'created' if provided as an ISO string, otherwise use now
-        created_raw = client.get('created')
-        if isinstance(created_raw, str):
-            try:
-                created_dt = datetime.fromisoformat(created_raw)
-            except ValueError:
-                created_dt = datetime.now(timezone.utc)
-        elif isinstance(created_raw, datetime):
-            created_dt = created_raw
+        stmt = insert(Client).values(**row)
+        updates = {k: stmt.excluded[k] for k in row
+                   if k in client and k not in ('id', 'created')}
+        if updates:
+            stmt = stmt.on_conflict_do_update(index_elements=[Client.id], set_=updates)
         else:
-            created_dt = datetime.now(timezone.utc)
-
-        new_client = Client(
-            id=client_id,
-            name=client.get('name', ''),
-            domain=client.get('domain', '') or '',
-            project_name=client.get('project_name', '') or '',
-            cms=client.get('cms', '') or '',
-            location_code=int(client.get('location_code', 2826) or 2826),
-            notes=client.get('notes', '') or '',
-            created=created_dt,
-        )
-        db.session.add(new_client)
-        logger.info('Created client %s', client_id)
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Client.id])
+        db.session.execute(stmt)
 
     db.session.commit()
+    logger.info('Saved client %s', client_id.hex)
 
 
 def delete_client(client_id: str) -> None:
     """Remove a client record. No-op if the client does not exist."""
-    c = db.session.get(Client, client_id)
+    cid = _to_uuid(client_id)
+    c = db.session.get(Client, cid) if cid else None
     if c:
         db.session.delete(c)
         db.session.commit()
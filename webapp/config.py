@@ -44,10 +44,11 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
     # ── User registration & activation ───────────────────────────────────
-    ALLOWED_EMAIL_DOMAIN = os.environ.get('ALLOWED_EMAIL_DOMAIN', 'numiko.com')
+    # Both normalised to lowercase once here so callers never re-lower them
+    ALLOWED_EMAIL_DOMAIN = os.environ.get('ALLOWED_EMAIL_DOMAIN', 'numiko.com').strip().lower()
     ACTIVATION_TOKEN_MAX_AGE = 48 * 3600  # 48 hours
     ACTIVATION_TOKEN_SALT = 'email-activation-salt'
-    ADMIN_EMAIL = os.environ.get('ADMIN_EMAIL', '')
+    ADMIN_EMAIL = os.environ.get('ADMIN_EMAIL', '').strip().lower()
 
     # ── Password reset ────────────────────────────────────────────────────
     PASSWORD_RESET_TOKEN_MAX_AGE = 15 * 60   # 15 minutes
@@ -56,6 +57,23 @@ class Config:
     # ── Email (Resend) ────────────────────────────────────────────────────
     RESEND_API_KEY = os.environ.get('RESEND_API_KEY', '')
     RESEND_FROM_EMAIL = os.environ.get('RESEND_FROM_EMAIL', 'Numiko <noreply@numiko.com>')
+    # Public origin for links in emails, e.g. https://seo.numiko.com.  When
+    # unset, links are built from the incoming request's host.
+    EXTERNAL_BASE_URL = os.environ.get('EXTERNAL_BASE_URL', '').rstrip('/')
+
+    # ── Report generation ────────────────────────────────────────────────
+    # Size of the pool that builds DOCX reports off the request thread.  Each
+    # Gunicorn worker gets its own pool, so keep this small.  0 builds reports
+    # inline on the request thread instead.
+    REPORT_WORKERS = int(os.environ.get('REPORT_WORKERS', 2))
+    # Seconds a report may wait for a free pool worker before it is built
+    # inline instead.  Builds already running on a worker are waited for.
+    REPORT_TIMEOUT = int(os.environ.get('REPORT_TIMEOUT', 30))
+
+    # ── Redis (optional) ─────────────────────────────────────────────────
+    # When set, sessions are stored server-side and rate-limit counters are
+    # shared across Gunicorn workers.  Unset → signed cookies + in-memory.
+    REDIS_URL = os.environ.get('REDIS_URL', '')
 
     # ── Session security ─────────────────────────────────────────────────
     SESSION_COOKIE_HTTPONLY = True
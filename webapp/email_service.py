@@ -9,107 +9,282 @@ Set the following env vars in Railway (or your hosting platform):
   RESEND_API_KEY     — your Resend API key (starts with ``re_``)
   RESEND_FROM_EMAIL  — sender address, e.g. ``Numiko <noreply@numiko.com>``
 """
+import atexit
+import functools
 import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
 from typing import Optional
 
 import httpx
-from flask import url_for
+from cachetools import TTLCache
+import orjson
+from flask import current_app, url_for
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
 
 from config import Config
 
 logger = logging.getLogger(__name__)
 
-_RESEND_SEND_URL = 'https://api.resend.com/emails'
+_RESEND_BASE_URL = 'https://api.resend.com'
 
+# Shared HTTP/2 client so consecutive sends reuse one TLS connection.
+# Built lazily so Config (and the API key) is read at first send.
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
 
-def _get_serializer() -> URLSafeTimedSerializer:
-    return URLSafeTimedSerializer(Config.SECRET_KEY)
+# Background sender so the Resend round-trip is not on the request path.
+# The URL and HTML are built in the request (url_for needs its context);
+# only the HTTP POST runs on the pool.
+_EMAIL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='resend')
+
+
+# ---------------------------------------------------------------------------
+# Email bodies — parsed once at import; only $name and $url vary per send
+# ---------------------------------------------------------------------------
+_ACTIVATION_HTML = Template("""\
+<div style="font-family: Arial, sans-serif; max-width: 520px; margin: 0 auto; padding: 32px 0;">
+  <h2 style="color: #0F172A; margin-bottom: 8px;">Welcome to the SEO-GEO Toolkit</h2>
+  <p style="color: #64748B; font-size: 15px; line-height: 1.6;">
+    Hi $name,
+  </p>
+  <p style="color: #64748B; font-size: 15px; line-height: 1.6;">
+    Click the button below to activate your account. This link expires in 48 hours.
+  </p>
+  <p style="margin: 28px 0;">
+    <a href="$url"
+       style="display: inline-block; background: #F46A1B; color: #fff;
+              padding: 12px 28px; border-radius: 5px; font-weight: 600;
+              font-size: 15px; text-decoration: none;">
+      Activate Account
+    </a>
+  </p>
+  <p style="color: #94A3B8; font-size: 13px; line-height: 1.5;">
+    If the button doesn't work, copy and paste this link into your browser:<br>
+    <a href="$url" style="color: #F46A1B;">$url</a>
+  </p>
+  <hr style="border: none; border-top: 1px solid #E2D5C8; margin: 28px 0;">
+  <p style="color: #94A3B8; font-size: 12px;">
+    Numiko SEO-GEO Toolkit &mdash; This email was sent because someone registered
+    with this address. If that wasn't you, you can safely ignore this email.
+  </p>
+</div>""")
+
+_PASSWORD_RESET_HTML = Template("""\
+<div style="font-family: Arial, sans-serif; max-width: 520px; margin: 0 auto; padding: 32px 0;">
+  <h2 style="color: #0F172A; margin-bottom: 8px;">Reset your password</h2>
+  <p style="color: #64748B; font-size: 15px; line-height: 1.6;">
+    Hi $name,
+  </p>
+  <p style="color: #64748B; font-size: 15px; line-height: 1.6;">
+    We received a request to reset the password for your SEO-GEO Toolkit account.
+    Click the button below to choose a new password. This link expires in
+    <strong>15&nbsp;minutes</strong>.
+  </p>
+  <p style="margin: 28px 0;">
+    <a href="$url"
+       style="display: inline-block; background: #F46A1B; color: #fff;
+              padding: 12px 28px; border-radius: 5px; font-weight: 600;
+              font-size: 15px; text-decoration: none;">
+      Reset Password
+    </a>
+  </p>
+  <p style="color: #94A3B8; font-size: 13px; line-height: 1.5;">
+    If the button doesn't work, copy and paste this link into your browser:<br>
+    <a href="$url" style="color: #F46A1B;">$url</a>
+  </p>
+  <hr style="border: none; border-top: 1px solid #E2D5C8; margin: 28px 0;">
+  <p style="color: #94A3B8; font-size: 12px;">
+    If you didn't request a password reset, you can safely ignore this email.
+    Your password will not change.
+  </p>
+</div>""")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_serializer(secret_key: str, salt: str) -> URLSafeTimedSerializer:
+    """Return a serializer bound to *salt*, built once per (key, salt) pair.
+
+    Keying the cache on the secret means a rotated ``SECRET_KEY`` simply
+    gets a fresh serializer; no explicit invalidation is needed.
+    """
+    return URLSafeTimedSerializer(secret_key, salt=salt)
 
 
 def generate_activation_token(email: str) -> str:
     """Create a time-limited activation token for *email*."""
-    s = _get_serializer()
-    return s.dumps(email, salt=Config.ACTIVATION_TOKEN_SALT)
+    s = _get_serializer(Config.SECRET_KEY, Config.ACTIVATION_TOKEN_SALT)
+    return s.dumps(email)
 
 
 def verify_activation_token(token: str) -> Optional[str]:
     """Decode *token* and return the email address, or ``None`` on failure."""
-    s = _get_serializer()
+    s = _get_serializer(Config.SECRET_KEY, Config.ACTIVATION_TOKEN_SALT)
     try:
-        email = s.loads(token, salt=Config.ACTIVATION_TOKEN_SALT,
-                        max_age=Config.ACTIVATION_TOKEN_MAX_AGE)
+        email = s.loads(token, max_age=Config.ACTIVATION_TOKEN_MAX_AGE)
         return email
     except (SignatureExpired, BadSignature):
         return None
 
 
+# Tokens that have already been acted on (account activated / password
+# changed).  A repeat click is answered from here without touching the
+# database.  Per-process and best-effort: entries outlive the longest token.
+_USED_TOKENS = TTLCache(maxsize=10_000, ttl=Config.ACTIVATION_TOKEN_MAX_AGE)
+_USED_TOKENS_LOCK = threading.Lock()
+
+
+def mark_token_used(token: str) -> None:
+    """Remember that *token* has been consumed."""
+    with _USED_TOKENS_LOCK:
+        _USED_TOKENS[token] = True
+
+
+def is_token_used(token: str) -> bool:
+    """True if *token* was consumed recently by this process."""
+    with _USED_TOKENS_LOCK:
+        return token in _USED_TOKENS
+
+
 def generate_password_reset_token(email: str) -> str:
     """Create a short-lived (15-minute) password reset token for *email*.
 
     Uses a different salt from activation tokens so they cannot be
     used interchangeably.
     """
-    s = _get_serializer()
-    return s.dumps(email, salt=Config.PASSWORD_RESET_TOKEN_SALT)
+    s = _get_serializer(Config.SECRET_KEY, Config.PASSWORD_RESET_TOKEN_SALT)
+    return s.dumps(email)
 
 
 def verify_password_reset_token(token: str) -> Optional[str]:
     """Decode *token* and return the email address, or ``None`` on failure."""
-    s = _get_serializer()
+    s = _get_serializer(Config.SECRET_KEY, Config.PASSWORD_RESET_TOKEN_SALT)
     try:
-        email = s.loads(token, salt=Config.PASSWORD_RESET_TOKEN_SALT,
-                        max_age=Config.PASSWORD_RESET_TOKEN_MAX_AGE)
+        email = s.loads(token, max_age=Config.PASSWORD_RESET_TOKEN_MAX_AGE)
         return email
     except (SignatureExpired, BadSignature):
         return None
 
 
+def _get_client() -> httpx.Client:
+    """Return the process-wide Resend client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    base_url=_RESEND_BASE_URL,
+                    headers={
+                        'Authorization': f'Bearer {Config.RESEND_API_KEY}',
+                        'Content-Type': 'application/json',
+                    },
+                    # retries= covers connection failures; HTTP-level
+                    # 429/5xx are retried in _send_via_resend
+                    transport=httpx.HTTPTransport(
+                        http2=True,
+                        retries=3,
+                        limits=httpx.Limits(max_keepalive_connections=32,
+                                            max_connections=64),
+                    ),
+                    timeout=10.0,
+                )
+                atexit.register(_client.close)
+    return _client
+
+
+# Transient upstream statuses worth another attempt
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_SEND_ATTEMPTS = 4
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before the next attempt (honours ``Retry-After``)."""
+    retry_after = resp.headers.get('Retry-After')
+    if retry_after:
+        try:
+            return min(float(retry_after), 30.0)
+        except ValueError:
+            pass
+    return min(2 ** attempt, 8) + random.uniform(0, 0.5)
+
+
 def _send_via_resend(to_email: str, subject: str, html_body: str) -> bool:
     """Send an email via the Resend API.
 
     Returns ``True`` on success, ``False`` on failure (logged but not raised).
     """
-    api_key = Config.RESEND_API_KEY
-    from_email = Config.RESEND_FROM_EMAIL
-
-    if not api_key:
+    if not Config.RESEND_API_KEY:
         return False
 
     try:
-        resp = httpx.post(
-            _RESEND_SEND_URL,
-            headers={
-                'Authorization': f'Bearer {api_key}',
-                'Content-Type': 'application/json',
-            },
-            json={
-                'from': from_email,
-                'to': [to_email],
-                'subject': subject,
-                'html': html_body,
-            },
-            timeout=10.0,
-        )
+        # Serialised with orjson; the client already sends the JSON content type
+        payload = orjson.dumps({
+            'from': Config.RESEND_FROM_EMAIL,
+            'to': [to_email],
+            'subject': subject,
+            'html': html_body,
+        })
+        for attempt in range(_MAX_SEND_ATTEMPTS):
+            resp = _get_client().post('/emails', content=payload)
+            if (resp.status_code not in _RETRY_STATUSES
+                    or attempt == _MAX_SEND_ATTEMPTS - 1):
+                break
+            delay = _retry_delay(resp, attempt)
+            logger.warning('Resend returned %s for %s; retrying in %.1fs',
+                           resp.status_code, to_email, delay)
+            time.sleep(delay)
         if resp.status_code in (200, 201):
-            data = resp.json()
+            data = orjson.loads(resp.content)
             print(f'[EMAIL] Sent "{subject}" to {to_email} (id={data.get("id", "?")})')
             return True
         else:
-            print(f'[EMAIL] Resend API error {resp.status_code} sending to {to_email}: {resp.text}')
+            # Cap the logged body; error pages can be large
+            body = resp.content[:512].decode('utf-8', 'replace')
+            print(f'[EMAIL] Resend API error {resp.status_code} sending to {to_email}: {body}')
             return False
     except Exception as exc:
         print(f'[EMAIL] Exception sending to {to_email}: {exc}')
         return False
 
 
+def _log_send_failure(future) -> None:
+    """Done-callback for background sends: surface anything that escaped."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error('Background email send raised', exc_info=exc)
+    elif future.result() is False:
+        logger.warning('Background email send failed (see [EMAIL] output above)')
+
+
+def _dispatch_email(to_email: str, subject: str, html_body: str) -> None:
+    """Hand a send to the background pool (inline when testing)."""
+    if current_app.config.get('TESTING'):
+        _send_via_resend(to_email=to_email, subject=subject, html_body=html_body)
+        return
+    future = _EMAIL_EXECUTOR.submit(
+        _send_via_resend, to_email=to_email, subject=subject, html_body=html_body,
+    )
+    future.add_done_callback(_log_send_failure)
+
+
+def _token_url(template_key: str, endpoint: str, token: str) -> str:
+    """Absolute link for *token*, from the app's pre-built template if any."""
+    template = current_app.config.get(template_key)
+    if template:
+        return template.format(token=token)
+    return url_for(endpoint, token=token, _external=True)
+
+
 def send_activation_email(user, token: str) -> None:
     """Send the activation link for *user*.
 
     When ``RESEND_API_KEY`` is configured, sends a branded HTML email via
     Resend.  Always logs the activation URL to the console as a fallback.
     """
-    activation_url = url_for('auth.activate', token=token, _external=True)
+    activation_url = _token_url('_ACTIVATION_URL_TEMPLATE', 'auth.activate', token)
 
     # ── Console output (always — useful for dev and as a fallback) ────────
     logger.info(
@@ -124,34 +299,8 @@ def send_activation_email(user, token: str) -> None:
 
     # ── Send via Resend if configured ─────────────────────────────────────
     if Config.RESEND_API_KEY:
-        html_body = f"""\
-<div style="font-family: Arial, sans-serif; max-width: 520px; margin: 0 auto; padding: 32px 0;">
-  <h2 style="color: #0F172A; margin-bottom: 8px;">Welcome to the SEO-GEO Toolkit</h2>
-  <p style="color: #64748B; font-size: 15px; line-height: 1.6;">
-    Hi {user.name},
-  </p>
-  <p style="color: #64748B; font-size: 15px; line-height: 1.6;">
-    Click the button below to activate your account. This link expires in 48 hours.
-  </p>
-  <p style="margin: 28px 0;">
-    <a href="{activation_url}"
-       style="display: inline-block; background: #F46A1B; color: #fff;
-              padding: 12px 28px; border-radius: 5px; font-weight: 600;
-              font-size: 15px; text-decoration: none;">
-      Activate Account
-    </a>
-  </p>
-  <p style="color: #94A3B8; font-size: 13px; line-height: 1.5;">
-    If the button doesn't work, copy and paste this link into your browser:<br>
-    <a href="{activation_url}" style="color: #F46A1B;">{activation_url}</a>
-  </p>
-  <hr style="border: none; border-top: 1px solid #E2D5C8; margin: 28px 0;">
-  <p style="color: #94A3B8; font-size: 12px;">
-    Numiko SEO-GEO Toolkit &mdash; This email was sent because someone registered
-    with this address. If that wasn't you, you can safely ignore this email.
-  </p>
-</div>"""
-        _send_via_resend(
+        html_body = _ACTIVATION_HTML.substitute(name=user.name, url=activation_url)
+        _dispatch_email(
             to_email=user.email,
             subject='Activate your SEO-GEO Toolkit account',
             html_body=html_body,
@@ -167,7 +316,7 @@ def send_password_reset_email(user, token: str) -> None:
     Link expires in 15 minutes.  Falls back to console logging when
     ``RESEND_API_KEY`` is not set.
     """
-    reset_url = url_for('auth.reset_password', token=token, _external=True)
+    reset_url = _token_url('_PASSWORD_RESET_URL_TEMPLATE', 'auth.reset_password', token)
 
     # ── Console output (always — appears in Railway deploy logs) ─────────
     print(
@@ -178,36 +327,8 @@ def send_password_reset_email(user, token: str) -> None:
     )
 
     if Config.RESEND_API_KEY:
-        html_body = f"""\
-<div style="font-family: Arial, sans-serif; max-width: 520px; margin: 0 auto; padding: 32px 0;">
-  <h2 style="color: #0F172A; margin-bottom: 8px;">Reset your password</h2>
-  <p style="color: #64748B; font-size: 15px; line-height: 1.6;">
-    Hi {user.name},
-  </p>
-  <p style="color: #64748B; font-size: 15px; line-height: 1.6;">
-    We received a request to reset the password for your SEO-GEO Toolkit account.
-    Click the button below to choose a new password. This link expires in
-    <strong>15&nbsp;minutes</strong>.
-  </p>
-  <p style="margin: 28px 0;">
-    <a href="{reset_url}"
-       style="display: inline-block; background: #F46A1B; color: #fff;
-              padding: 12px 28px; border-radius: 5px; font-weight: 600;
-              font-size: 15px; text-decoration: none;">
-      Reset Password
-    </a>
-  </p>
-  <p style="color: #94A3B8; font-size: 13px; line-height: 1.5;">
-    If the button doesn't work, copy and paste this link into your browser:<br>
-    <a href="{reset_url}" style="color: #F46A1B;">{reset_url}</a>
-  </p>
-  <hr style="border: none; border-top: 1px solid #E2D5C8; margin: 28px 0;">
-  <p style="color: #94A3B8; font-size: 12px;">
-    If you didn't request a password reset, you can safely ignore this email.
-    Your password will not change.
-  </p>
-</div>"""
-        _send_via_resend(
+        html_body = _PASSWORD_RESET_HTML.substitute(name=user.name, url=reset_url)
+        _dispatch_email(
             to_email=user.email,
             subject='Reset your SEO-GEO Toolkit password',
             html_body=html_body,
@@ -7,10 +7,16 @@ between app.py ↔ models.py ↔ auth.py.
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_migrate import Migrate
+from flask_session import Session
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 
 db = SQLAlchemy()
 login_manager = LoginManager()
 migrate = Migrate()
+server_session = Session()
+# Storage backend is read from RATELIMIT_STORAGE_URI at init_app time
+limiter = Limiter(get_remote_address, default_limits=["120 per minute"])
 
 # Redirect unauthenticated users to the login page
 login_manager.login_view = 'auth.login'
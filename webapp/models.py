@@ -1,19 +1,117 @@
 """
 SQLAlchemy models for user authentication, management, and client data.
 """
-from datetime import datetime, timezone
-
+import hashlib
+import os
+import re
+import threading
+import uuid
+from datetime import timezone
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from flask_login import UserMixin
+from sqlalchemy import DateTime, TypeDecorator, and_, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.orm import validates
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
 
 from extensions import db
 
+# argon2id (native, memory-hard).  Parameters are tunable per deployment;
+# hashes made with other parameters — or legacy werkzeug pbkdf2 hashes —
+# are upgraded transparently on the next successful login.
+_PASSWORD_HASHER = PasswordHasher(
+    time_cost=int(os.environ.get('ARGON2_TIME_COST', '2')),
+    memory_cost=int(os.environ.get('ARGON2_MEMORY_COST', '19456')),
+    parallelism=1,
+)
+
+# Verified against when the login email is unknown, so that branch costs the
+# same as a wrong password and response time does not reveal which accounts exist.
+_DUMMY_PASSWORD_HASH = _PASSWORD_HASHER.hash('dummy-password')
+
+# Successful verifications from the last few seconds, so an immediate
+# re-submit skips the KDF.  Only *successes* are cached: a fast "wrong
+# password" would let a caller tell real accounts from unknown ones (those
+# always pay the dummy hash).  Keys are keyed-BLAKE2b digests under a
+# per-process random key, never the password itself.
+_VERIFY_CACHE = TTLCache(maxsize=1024, ttl=5)
+_VERIFY_CACHE_LOCK = threading.Lock()
+_VERIFY_CACHE_KEY = os.urandom(32)
+
+# Cheap structural check (one '@', a dot in the domain, no whitespace).
+# Rejects junk before it costs an INSERT + constraint error round-trip.
+EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+class UTCDateTime(TypeDecorator):
+    """Naive ``DateTime`` column that always holds UTC.
+
+    Aware values are converted to UTC on the way in; values read back are
+    tagged with ``timezone.utc`` so callers never see a naive datetime.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+
+class utcnow(FunctionElement):
+    """The database clock's current time as a naive UTC timestamp.
+
+    For ``UTCDateTime`` columns: PostgreSQL's ``now()`` written into a
+    ``timestamp without time zone`` column lands in the session's TimeZone,
+    not UTC.  SQLite's CURRENT_TIMESTAMP is already UTC.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
+
+
+@compiles(utcnow, 'postgresql')
+def _utcnow_postgresql(element, compiler, **kw):
+    return "timezone('utc', CURRENT_TIMESTAMP)"
+
+
+def check_dummy_password(password: str) -> None:
+    """Burn one password verification's worth of CPU (timing equalisation)."""
+    try:
+        _PASSWORD_HASHER.verify(_DUMMY_PASSWORD_HASH, password)
+    except VerificationError:
+        pass
+
 
 class User(UserMixin, db.Model):
     """Registered user account."""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        # Admin listing filters on account state and sorts by signup date
+        db.Index('ix_users_active', 'is_active_user', 'deactivated_at'),
+        db.Index('ix_users_created_at', 'created_at'),
+        # Small index covering only non-revoked accounts (the login path)
+        db.Index('ix_users_active_partial', 'is_active_user',
+                 postgresql_where=text('deactivated_at IS NULL'),
+                 sqlite_where=text('deactivated_at IS NULL')),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(255), unique=True, nullable=False, index=True)
@@ -23,33 +121,70 @@ class User(UserMixin, db.Model):
     is_active_user = db.Column(db.Boolean, default=False, nullable=False)
     is_admin = db.Column(db.Boolean, default=False, nullable=False)
 
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
-    activated_at = db.Column(db.DateTime, nullable=True)
-    last_login = db.Column(db.DateTime, nullable=True)
-    deactivated_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(UTCDateTime, server_default=utcnow(), nullable=False)
+    activated_at = db.Column(UTCDateTime, nullable=True)
+    last_login = db.Column(UTCDateTime, nullable=True)
+    deactivated_at = db.Column(UTCDateTime, nullable=True)
 
     # ── Email normalisation ───────────────────────────────────────────────
 
     @validates('email')
     def _normalize_email(self, _key, value):
-        """Always store emails as lowercase."""
-        return value.strip().lower() if value else value
+        """Always store emails as lowercase; reject malformed addresses."""
+        if not value:
+            return value
+        value = value.strip().lower()
+        if not EMAIL_RE.fullmatch(value):
+            raise ValueError(f'Invalid email address: {value!r}')
+        return value
 
     # ── Password helpers ─────────────────────────────────────────────────
 
     def set_password(self, password: str) -> None:
-        self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
+        self.password_hash = _PASSWORD_HASHER.hash(password)
 
     def check_password(self, password: str) -> bool:
-        return check_password_hash(self.password_hash, password)
+        cache_key = hashlib.blake2b(
+            self.password_hash.encode() + b'\0' + password.encode(),
+            key=_VERIFY_CACHE_KEY,
+        ).digest()
+        with _VERIFY_CACHE_LOCK:
+            if cache_key in _VERIFY_CACHE:
+                return True
+
+        ok = self._verify_password(password)
+        if ok:
+            with _VERIFY_CACHE_LOCK:
+                _VERIFY_CACHE[cache_key] = True
+        return ok
+
+    def _verify_password(self, password: str) -> bool:
+        if not self.password_hash.startswith('$argon2'):
+            # Legacy werkzeug (pbkdf2/scrypt) hash from before argon2id
+            return check_password_hash(self.password_hash, password)
+        try:
+            return _PASSWORD_HASHER.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def password_needs_rehash(self) -> bool:
+        """True for legacy hashes or argon2 hashes with outdated parameters."""
+        if not self.password_hash.startswith('$argon2'):
+            return True
+        return _PASSWORD_HASHER.check_needs_rehash(self.password_hash)
 
     # ── Flask-Login integration ──────────────────────────────────────────
 
-    @property
+    @hybrid_property
     def is_active(self) -> bool:
         """Account is active only when explicitly activated AND not revoked."""
         return self.is_active_user and self.deactivated_at is None
 
+    @is_active.inplace.expression
+    @classmethod
+    def _is_active_expression(cls):
+        return and_(cls.is_active_user.is_(True), cls.deactivated_at.is_(None))
+
     def __repr__(self) -> str:
         return f'<User {self.email}>'
 
@@ -58,32 +193,62 @@ class Client(db.Model):
     """SEO/GEO client record — replaces the legacy clients.json flat file."""
 
     __tablename__ = 'clients'
+    __table_args__ = (
+        db.Index('ix_clients_name', 'name'),
+        db.Index('ix_clients_created', 'created'),
+    )
 
-    id = db.Column(db.String(32), primary_key=True)   # uuid hex
+    # Native UUID on PostgreSQL (16 bytes), CHAR(32) hex elsewhere
+    id = db.Column(db.Uuid, primary_key=True, default=uuid.uuid4)
     name = db.Column(db.String(255), nullable=False)
     domain = db.Column(db.String(255), nullable=True, default='')
     project_name = db.Column(db.String(255), nullable=True, default='')
     cms = db.Column(db.String(100), nullable=True, default='')
     location_code = db.Column(db.Integer, nullable=True, default=2826)
     notes = db.Column(db.Text, nullable=True, default='')
-    created = db.Column(db.DateTime, nullable=False,
-                        default=lambda: datetime.now(timezone.utc))
+    created = db.Column(UTCDateTime, nullable=False, server_default=utcnow())
 
     def to_dict(self) -> dict:
         """Return a plain dict matching the legacy clients.json schema."""
         return {
-            'id': self.id,
+            'id': self.id.hex,
             'name': self.name,
             'domain': self.domain or '',
             'project_name': self.project_name or '',
             'cms': self.cms or '',
             'location_code': self.location_code or 2826,
             'notes': self.notes or '',
-            'created': (
-                self.created.isoformat()
-                if self.created else datetime.now(timezone.utc).isoformat()
-            ),
+            'created': self.created.isoformat(),
         }
 
+    @classmethod
+    def bulk_to_dict(cls, session) -> list:
+        """Return every client as a ``to_dict()``-shaped dict, oldest first.
+
+        Selects plain columns rather than ORM entities, so rows skip
+        identity-map registration and attribute instrumentation, and streams
+        them in batches of 500 to keep memory flat.
+        """
+        c = cls.__table__.c
+        stmt = (
+            select(c.id, c.name, c.domain, c.project_name, c.cms,
+                   c.location_code, c.notes, c.created)
+            .order_by(c.created.asc())
+            .execution_options(yield_per=500)
+        )
+        return [
+            {
+                'id': r.id.hex,
+                'name': r.name,
+                'domain': r.domain or '',
+                'project_name': r.project_name or '',
+                'cms': r.cms or '',
+                'location_code': r.location_code or 2826,
+                'notes': r.notes or '',
+                'created': r.created.isoformat(),
+            }
+            for r in session.execute(stmt)
+        ]
+
     def __repr__(self) -> str:
         return f'<Client {self.name}>'
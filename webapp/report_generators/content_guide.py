@@ -10,18 +10,21 @@ params dict keys:
   cms           - e.g. "Drupal"             (used in section 3 headings)
   logo_path     - absolute path to logo image (optional, falls back to agency logo)
 """
+import functools
+import io
 import os
 import logging
-from datetime import datetime
+import re
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
 
 from docx import Document
 
 from .docx_helpers import (
     BLACK, DARK, GRAY, LIGHT_GRAY, WHITE, RED, GREEN, RULE_BLUE, TIP_AMBER,
-    add_styled_para, add_heading, add_bullet, add_table,
-    add_callout_box, add_tip_box, add_example_box, add_golden_rule, add_checklist_item,
+    add_styled_para, add_italic_hint, add_heading, add_bullets, add_table,
+    add_callout_box, add_tip_box, add_example_box, add_golden_rule, add_checklist_items,
     create_document,
 )
 
@@ -31,15 +34,218 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 DEFAULT_LOGO = os.path.join(BASE_DIR, 'fonts', 'numiko_logo.png')
 
 
+# ---------------------------------------------------------------------------
+# Fixed content (module-level so it is built once, not per call)
+# ---------------------------------------------------------------------------
+
+_AI_WANTS_AVOIDS_HEADERS = ('What AI Engines Want', 'What They Avoid')
+_AI_WANTS_AVOIDS = (
+    ('Direct answers to questions', 'Vague introductions'),
+    ('Statistics and data points', 'Claims without evidence'),
+    ('Expert quotes with attribution', 'Anonymous assertions'),
+    ('Links to authoritative sources', 'Unsupported statements'),
+    ('Confident, expert language', 'Marketing fluff'),
+    ('Clear definitions', 'Jargon without explanation'),
+)
+
+_GOLDEN_RULES = (
+    ('Answer the question first', '+20% to +30%', (
+        'Lead with a clear definition or direct answer in the first two sentences. Write as '
+        'if someone has just asked \u201cWhat is [your topic]?\u201d The opening paragraph should give '
+        'them the answer immediately \u2014 not a welcome message, not background context, not a '
+        'mission statement. The definition comes first, the detail follows. AI engines extract '
+        'the first few sentences as their answer. Make those sentences count.'
+    )),
+    ('Back it up with numbers', '+37%', (
+        'Include at least two statistics or data points on every page. Numbers make content '
+        '37% more likely to be cited by AI. Examples: staff numbers, incident counts, dates, '
+        'percentages, budgets, programme participation figures, timelines. Even approximate or '
+        'publicly-available figures are vastly better than none.'
+    )),
+    ('Quote the experts', '+30%', (
+        'Add at least one attributed quote per page. Good sources: leadership statements, '
+        'oversight reports, partner organisation leaders, employee testimonials, academic experts, '
+        'government reviews. Format: \u201cQuote text\u201d \u2014 Name, Role, Organisation. Quotes add '
+        'authority, break up text, and give AI engines a human voice to cite.'
+    )),
+    ('Cite your sources', '+40%', (
+        'Link to authoritative external references \u2014 at least three per page. This is the '
+        'single highest-impact method, boosting AI visibility by 40%. Good citation sources: '
+        'government reports, legislation, partner organisations, academic research, and '
+        'reputable news coverage. Use inline links in rich text. Every claim should have a source.'
+    )),
+    ('Write like an authority, not a brochure', '+25%', (
+        'Use confident, definitive language. Include technical terms but define them on first '
+        'use. Avoid marketing fluff, vague aspirations, and repetitive slogans. Vary your '
+        'vocabulary: unique words boost visibility by 15%.'
+    )),
+)
+
+_QUICK_REF_RULES_HEADERS = ('Rule', 'What to Do', 'Boost')
+_QUICK_REF_RULES = (
+    ('1. Answer first', 'Definition or direct answer in the first 2 sentences', '+20\u201330%'),
+    ('2. Use numbers', 'At least 2 statistics or data points per page', '+37%'),
+    ('3. Quote experts', 'At least 1 attributed quote per page', '+30%'),
+    ('4. Cite sources', 'At least 3 links to authoritative references', '+40%'),
+    ('5. Be the authority', 'Confident language, define technical terms', '+25%'),
+)
+
+_QUICK_REF_COMPONENTS_HEADERS = ('Component', 'Use When...', 'GEO Boost')
+_QUICK_REF_COMPONENTS = (
+    ('FAQ/Accordion', 'A reader might ask a question about this', '+40%'),
+    ('Quote', 'You have an expert statement', '+30%'),
+    ('Statistics', 'You have numbers or metrics', '+37%'),
+    ('Key Fact', 'There is a headline data point', '+37%'),
+    ('Rich Text', 'Writing narrative with inline source links', '+40%'),
+)
+
+_QUICK_REF_MINIMUMS_HEADERS = ('Requirement', 'Minimum', 'Component')
+_QUICK_REF_MINIMUMS = (
+    ('Statistics / data points', '2 per page', 'Statistics or Key Fact'),
+    ('Expert quotes', '1 per page', 'Quote component'),
+    ('External citations', '3 per page', 'Inline links in body text'),
+    ('FAQ questions', '3 per page', 'FAQ/Accordion component'),
+    ('Definition in opening', 'First 2 sentences', 'Opening body text'),
+)
+
+_HOME_CHECKLIST = (
+    'Opening definition of the organisation within the first 2 sentences',
+    'Founding date and brief history',
+    'Staff count and key locations',
+    'Core missions or services (3\u20135 bullet points)',
+    'Oversight or governance structure',
+    'At least 1 quote from a leader or trusted source',
+    'Links to: key reports, legislation, partner organisations',
+)
+
+_HOME_COMPONENTS = (
+    'FAQ/Accordion: \u201cWhat is [organisation]?\u201d, \u201cWhat does it do?\u201d, \u201cWho oversees it?\u201d',
+    'Quote: Leadership statement on mission',
+    'Key Fact: Founded date, staff count, key locations',
+    'Statistics: Key metrics and impact data',
+)
+
+_NEWS_CHECKLIST = (
+    'Headline finding or announcement in the first sentence',
+    'Date of publication or event',
+    'Key statistic from the report or announcement',
+    'Expert quote providing commentary',
+    'Link to full publication or source document',
+    'Context: why this matters, what it means for the audience',
+)
+
+_CAREER_CHECKLIST = (
+    'Role title and 1-sentence description in the opening',
+    'Salary range (where publishable)',
+    'Locations and working arrangements',
+    'Key responsibilities (3\u20135 bullet points)',
+    'Required qualifications and skills',
+    'Benefits and development opportunities',
+    'At least 1 employee testimonial or quote',
+)
+
+_CHECK_STRUCTURE = (
+    'Page title: Clear, descriptive, under 60 characters',
+    'Meta description: Compelling summary, under 155 characters',
+    'H1 heading: One per page, matches what people search for',
+    'URL: Clean and descriptive',
+)
+
+_CHECK_OPENING = (
+    'First sentence directly answers \u201cWhat is [topic]?\u201d',
+    'Definition or key fact within the first 50 words',
+    'No \u201cwelcome to\u201d or \u201cthis page is about\u201d preambles',
+)
+
+_CHECK_GEO = (
+    'At least 2 statistics or data points',
+    'At least 1 expert quote with attribution',
+    'At least 3 links to authoritative external sources',
+    'FAQ section with 3+ questions',
+    'Technical terms are defined on first use',
+)
+
+_CHECK_QUALITY = (
+    'No keyword or phrase repeated more than 3 times',
+    'Content reads naturally when spoken aloud (fluency test)',
+    'No marketing fluff or vague claims without evidence',
+    'Vocabulary is varied (no repetitive phrasing)',
+    'Content is current and up-to-date (no outdated references)',
+    'All claims are supported by a citation or data point',
+)
+
+
+# ---------------------------------------------------------------------------
+# Skeleton cache
+# ---------------------------------------------------------------------------
+# The guide is ~200 fixed paragraphs with a handful of per-client strings.
+# It is composed once per process with {{TOKEN}} sentinels in place of those
+# strings, saved to bytes, and each request reloads the bytes and fills in
+# the sentinels — instead of re-running every python-docx helper.
+
+_SENTINELS = {
+    'client_name': '{{CLIENT_NAME}}',
+    'cms': '{{CMS}}',
+    'cover_sub': '{{COVER_SUB}}',
+    'site_ref': '{{SITE_REF}}',
+}
+_TOKEN_RE = re.compile('|'.join(re.escape(t) for t in _SENTINELS.values()))
+
+
+@functools.lru_cache(maxsize=1)
+def _skeleton_bytes() -> bytes:
+    """Serialised guide with sentinels in place of every per-client string."""
+    doc = _compose(**_SENTINELS)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def _substitute(doc: Document, values: dict) -> None:
+    """Replace every sentinel in the body and cover footer with *values*."""
+    by_token = {_SENTINELS[k]: v for k, v in values.items()}
+
+    def _lookup(match):
+        return by_token.get(match.group(0), match.group(0))
+
+    parts = [doc.element.body]
+    if doc.sections and not doc.sections[0].first_page_footer.is_linked_to_previous:
+        parts.append(doc.sections[0].first_page_footer._element)
+    for part in parts:
+        for t in part.iter(qn('w:t')):
+            text = t.text
+            if text and '{{' in text:
+                t.text = _TOKEN_RE.sub(_lookup, text)
+
+
 def build_content_guide(params: dict) -> Document:
     client_name = params.get('client_name') or 'Client'
     client_domain = params.get('client_domain') or ''
     project_name = params.get('project_name') or ''
-    date_str = params.get('date') or datetime.now().strftime('%B %Y')
     cms = params.get('cms') or 'Drupal'
+
+    doc = Document(io.BytesIO(_skeleton_bytes()))
+    _substitute(doc, {
+        'client_name': client_name,
+        'cms': cms,
+        # Cover subtitle — project name if given, else the domain
+        'cover_sub': project_name or client_domain,
+        'site_ref': client_domain or 'your site',
+    })
+    return doc
+
+
+def _build_and_serialize(params: dict) -> bytes:
+    """Report-pool worker entry point: guide as .docx bytes."""
+    buf = io.BytesIO()
+    build_content_guide(params).save(buf)
+    return buf.getvalue()
+
+
+def _compose(client_name: str, cms: str, cover_sub: str, site_ref: str) -> Document:
+    """Build the full guide from scratch with the given display strings."""
     # Build cover page title — use client name as title, project name as subtitle
     cover_title = f'SEO & GEO Content Guide — {client_name}'
-    cover_sub = project_name or client_domain
     doc = create_document(title=cover_title, subtitle=cover_sub)
 
     # ── 1. WHY THIS MATTERS ──────────────────────────────────────────────────
@@ -62,18 +268,11 @@ def build_content_guide(params: dict) -> Document:
     ))
 
     add_heading(doc, 'The Opportunity', level=2)
-    if client_name and client_domain:
-        add_styled_para(doc, (
-            f'Making {client_domain} visible to AI crawlers is only the first step. Visibility '
-            f'alone is not enough. AI engines only cite content that is well-structured, '
-            f'evidence-based, and directly answers questions. That is where you come in.'
-        ))
-    else:
-        add_styled_para(doc, (
-            'Making your site visible to AI crawlers is only the first step. Visibility '
-            'alone is not enough. AI engines only cite content that is well-structured, '
-            'evidence-based, and directly answers questions. That is where you come in.'
-        ))
+    add_styled_para(doc, (
+        f'Making {site_ref} visible to AI crawlers is only the first step. Visibility '
+        f'alone is not enough. AI engines only cite content that is well-structured, '
+        f'evidence-based, and directly answers questions. That is where you come in.'
+    ))
 
     add_heading(doc, 'What AI Engines Look For', level=2)
     add_styled_para(doc, (
@@ -83,16 +282,7 @@ def build_content_guide(params: dict) -> Document:
         'page you write.'
     ))
 
-    add_table(doc,
-              ['What AI Engines Want', 'What They Avoid'],
-              [
-                  ['Direct answers to questions', 'Vague introductions'],
-                  ['Statistics and data points', 'Claims without evidence'],
-                  ['Expert quotes with attribution', 'Anonymous assertions'],
-                  ['Links to authoritative sources', 'Unsupported statements'],
-                  ['Confident, expert language', 'Marketing fluff'],
-                  ['Clear definitions', 'Jargon without explanation'],
-              ])
+    add_table(doc, _AI_WANTS_AVOIDS_HEADERS, _AI_WANTS_AVOIDS)
 
     add_tip_box(doc, (
         'Every page you write is competing with Wikipedia, government reports, and news '
@@ -110,40 +300,8 @@ def build_content_guide(params: dict) -> Document:
         'cited by AI engines.'
     ))
 
-    add_golden_rule(doc, 1, 'Answer the question first', '+20% to +30%', (
-        'Lead with a clear definition or direct answer in the first two sentences. Write as '
-        'if someone has just asked \u201cWhat is [your topic]?\u201d The opening paragraph should give '
-        'them the answer immediately \u2014 not a welcome message, not background context, not a '
-        'mission statement. The definition comes first, the detail follows. AI engines extract '
-        'the first few sentences as their answer. Make those sentences count.'
-    ))
-
-    add_golden_rule(doc, 2, 'Back it up with numbers', '+37%', (
-        'Include at least two statistics or data points on every page. Numbers make content '
-        '37% more likely to be cited by AI. Examples: staff numbers, incident counts, dates, '
-        'percentages, budgets, programme participation figures, timelines. Even approximate or '
-        'publicly-available figures are vastly better than none.'
-    ))
-
-    add_golden_rule(doc, 3, 'Quote the experts', '+30%', (
-        'Add at least one attributed quote per page. Good sources: leadership statements, '
-        'oversight reports, partner organisation leaders, employee testimonials, academic experts, '
-        'government reviews. Format: \u201cQuote text\u201d \u2014 Name, Role, Organisation. Quotes add '
-        'authority, break up text, and give AI engines a human voice to cite.'
-    ))
-
-    add_golden_rule(doc, 4, 'Cite your sources', '+40%', (
-        'Link to authoritative external references \u2014 at least three per page. This is the '
-        'single highest-impact method, boosting AI visibility by 40%. Good citation sources: '
-        'government reports, legislation, partner organisations, academic research, and '
-        'reputable news coverage. Use inline links in rich text. Every claim should have a source.'
-    ))
-
-    add_golden_rule(doc, 5, 'Write like an authority, not a brochure', '+25%', (
-        'Use confident, definitive language. Include technical terms but define them on first '
-        'use. Avoid marketing fluff, vague aspirations, and repetitive slogans. Vary your '
-        'vocabulary: unique words boost visibility by 15%.'
-    ))
+    for number, (title, boost, description) in enumerate(_GOLDEN_RULES, start=1):
+        add_golden_rule(doc, number, title, boost, description)
 
     add_callout_box(doc, 'Anti-Rule: Never Stuff Keywords (\u221210%)', [
         'Repeating the same keyword or phrase hurts your AI visibility. AI engines actively '
@@ -162,8 +320,7 @@ def build_content_guide(params: dict) -> Document:
     ))
 
     add_heading(doc, 'FAQ / Accordion Component     +40%', level=3)
-    add_styled_para(doc, 'Ask yourself: \u201cWould a reader ask a question about this topic?\u201d',
-                    italic=True, color=GRAY)
+    add_italic_hint(doc, 'Ask yourself: \u201cWould a reader ask a question about this topic?\u201d')
     add_styled_para(doc, (
         'FAQ or accordion components create expandable question-and-answer sections. Behind the '
         'scenes, these are marked up as FAQ schema \u2014 a special code that tells AI engines '
@@ -171,8 +328,7 @@ def build_content_guide(params: dict) -> Document:
     ))
 
     add_heading(doc, 'Quote Component     +30%', level=3)
-    add_styled_para(doc, 'Ask yourself: \u201cDo I have a statement from a leader, expert, or partner?\u201d',
-                    italic=True, color=GRAY)
+    add_italic_hint(doc, 'Ask yourself: \u201cDo I have a statement from a leader, expert, or partner?\u201d')
     add_styled_para(doc, (
         'A quote component displays an attributed quotation with the speaker\u2019s name, role, and '
         'organisation. AI engines value expert quotes because they add human authority to '
@@ -180,24 +336,21 @@ def build_content_guide(params: dict) -> Document:
     ))
 
     add_heading(doc, 'Statistics Component     +37%', level=3)
-    add_styled_para(doc, 'Ask yourself: \u201cDo I have a number, metric, or data point?\u201d',
-                    italic=True, color=GRAY)
+    add_italic_hint(doc, 'Ask yourself: \u201cDo I have a number, metric, or data point?\u201d')
     add_styled_para(doc, (
         'A statistics component presents data in a visually prominent format. Even approximate '
         'numbers are better than none. Specific figures are far more citable than vague claims.'
     ))
 
     add_heading(doc, 'Key Fact Component     +37%', level=3)
-    add_styled_para(doc, 'Ask yourself: \u201cIs there a headline data point that deserves prominence?\u201d',
-                    italic=True, color=GRAY)
+    add_italic_hint(doc, 'Ask yourself: \u201cIs there a headline data point that deserves prominence?\u201d')
     add_styled_para(doc, (
         'Similar to the statistics component but designed for single, standout facts. These '
         'give AI engines the definitive facts they need to answer questions accurately.'
     ))
 
     add_heading(doc, 'Rich Text / Body Content     +40%', level=3)
-    add_styled_para(doc, 'Ask yourself: \u201cMain content area \u2014 where I write narrative with inline links\u201d',
-                    italic=True, color=GRAY)
+    add_italic_hint(doc, 'Ask yourself: \u201cMain content area \u2014 where I write narrative with inline links\u201d')
     add_styled_para(doc, (
         'Your primary writing area. The key GEO benefit here is inline links to authoritative '
         'sources. Every time you reference a report, a law, or a partner organisation, link to it. '
@@ -222,59 +375,36 @@ def build_content_guide(params: dict) -> Document:
     add_heading(doc, 'Home / About Pages', level=2)
     add_styled_para(doc, 'Goal: Define who you are and what you do, with evidence.', bold=True, color=BLACK)
     add_styled_para(doc, 'Opening sentence structure:', space_after=Pt(2))
-    add_styled_para(doc,
-                    f'"{client_name} is [definition]. Founded in [year], it [core mission]."'
-                    if client_name else '"[Organisation] is [definition]. Founded in [year], it [core mission]."',
-                    italic=True, color=GRAY)
+    add_italic_hint(doc, f'"{client_name} is [definition]. Founded in [year], it [core mission]."')
 
     add_heading(doc, 'Content Checklist', level=3)
-    add_bullet(doc, 'Opening definition of the organisation within the first 2 sentences')
-    add_bullet(doc, 'Founding date and brief history')
-    add_bullet(doc, 'Staff count and key locations')
-    add_bullet(doc, 'Core missions or services (3\u20135 bullet points)')
-    add_bullet(doc, 'Oversight or governance structure')
-    add_bullet(doc, 'At least 1 quote from a leader or trusted source')
-    add_bullet(doc, 'Links to: key reports, legislation, partner organisations')
+    add_bullets(doc, _HOME_CHECKLIST)
 
     add_heading(doc, 'Recommended Components', level=3)
-    add_bullet(doc, 'FAQ/Accordion: \u201cWhat is [organisation]?\u201d, \u201cWhat does it do?\u201d, \u201cWho oversees it?\u201d')
-    add_bullet(doc, 'Quote: Leadership statement on mission')
-    add_bullet(doc, 'Key Fact: Founded date, staff count, key locations')
-    add_bullet(doc, 'Statistics: Key metrics and impact data')
+    add_bullets(doc, _HOME_COMPONENTS)
 
     add_heading(doc, 'News / Publication Pages', level=2)
     add_styled_para(doc, 'Goal: Lead with the key finding, supported by data and expert commentary.',
                     bold=True, color=BLACK)
     add_styled_para(doc, 'Opening sentence structure:', space_after=Pt(2))
-    add_styled_para(doc, (
+    add_italic_hint(doc, (
         '"[Key finding or announcement] according to [source/date]. [Supporting statistic]."'
-    ), italic=True, color=GRAY)
+    ))
 
     add_heading(doc, 'Content Checklist', level=3)
-    add_bullet(doc, 'Headline finding or announcement in the first sentence')
-    add_bullet(doc, 'Date of publication or event')
-    add_bullet(doc, 'Key statistic from the report or announcement')
-    add_bullet(doc, 'Expert quote providing commentary')
-    add_bullet(doc, 'Link to full publication or source document')
-    add_bullet(doc, 'Context: why this matters, what it means for the audience')
+    add_bullets(doc, _NEWS_CHECKLIST)
 
     add_heading(doc, 'Career / Role Pages', level=2)
     add_styled_para(doc, 'Goal: Provide structured, specific role information that AI assistants can cite.',
                     bold=True, color=BLACK)
     add_styled_para(doc, 'Opening sentence structure:', space_after=Pt(2))
-    add_styled_para(doc, (
+    add_italic_hint(doc, (
         '"[Role Title] at [organisation] [1-sentence description]. '
         'Based in [locations], the role offers [key benefits]."'
-    ), italic=True, color=GRAY)
+    ))
 
     add_heading(doc, 'Content Checklist', level=3)
-    add_bullet(doc, 'Role title and 1-sentence description in the opening')
-    add_bullet(doc, 'Salary range (where publishable)')
-    add_bullet(doc, 'Locations and working arrangements')
-    add_bullet(doc, 'Key responsibilities (3\u20135 bullet points)')
-    add_bullet(doc, 'Required qualifications and skills')
-    add_bullet(doc, 'Benefits and development opportunities')
-    add_bullet(doc, 'At least 1 employee testimonial or quote')
+    add_bullets(doc, _CAREER_CHECKLIST)
 
     doc.add_page_break()
 
@@ -286,30 +416,16 @@ def build_content_guide(params: dict) -> Document:
     ))
 
     add_heading(doc, 'Structure & Metadata', level=2)
-    add_checklist_item(doc, 'Page title: Clear, descriptive, under 60 characters')
-    add_checklist_item(doc, 'Meta description: Compelling summary, under 155 characters')
-    add_checklist_item(doc, 'H1 heading: One per page, matches what people search for')
-    add_checklist_item(doc, 'URL: Clean and descriptive')
+    add_checklist_items(doc, _CHECK_STRUCTURE)
 
     add_heading(doc, 'Opening Content', level=2)
-    add_checklist_item(doc, 'First sentence directly answers \u201cWhat is [topic]?\u201d')
-    add_checklist_item(doc, 'Definition or key fact within the first 50 words')
-    add_checklist_item(doc, 'No \u201cwelcome to\u201d or \u201cthis page is about\u201d preambles')
+    add_checklist_items(doc, _CHECK_OPENING)
 
     add_heading(doc, 'GEO Requirements', level=2)
-    add_checklist_item(doc, 'At least 2 statistics or data points')
-    add_checklist_item(doc, 'At least 1 expert quote with attribution')
-    add_checklist_item(doc, 'At least 3 links to authoritative external sources')
-    add_checklist_item(doc, 'FAQ section with 3+ questions')
-    add_checklist_item(doc, 'Technical terms are defined on first use')
+    add_checklist_items(doc, _CHECK_GEO)
 
     add_heading(doc, 'Content Quality', level=2)
-    add_checklist_item(doc, 'No keyword or phrase repeated more than 3 times')
-    add_checklist_item(doc, 'Content reads naturally when spoken aloud (fluency test)')
-    add_checklist_item(doc, 'No marketing fluff or vague claims without evidence')
-    add_checklist_item(doc, 'Vocabulary is varied (no repetitive phrasing)')
-    add_checklist_item(doc, 'Content is current and up-to-date (no outdated references)')
-    add_checklist_item(doc, 'All claims are supported by a citation or data point')
+    add_checklist_items(doc, _CHECK_QUALITY)
 
     add_tip_box(doc, (
         'The fluency test: read your content aloud. If it sounds like a brochure or a '
@@ -357,37 +473,13 @@ def build_content_guide(params: dict) -> Document:
     add_styled_para(doc, 'Print this page and keep it beside your screen while writing.')
 
     add_heading(doc, 'The 5 Golden Rules', level=2)
-    add_table(doc,
-              ['Rule', 'What to Do', 'Boost'],
-              [
-                  ['1. Answer first', 'Definition or direct answer in the first 2 sentences', '+20\u201330%'],
-                  ['2. Use numbers', 'At least 2 statistics or data points per page', '+37%'],
-                  ['3. Quote experts', 'At least 1 attributed quote per page', '+30%'],
-                  ['4. Cite sources', 'At least 3 links to authoritative references', '+40%'],
-                  ['5. Be the authority', 'Confident language, define technical terms', '+25%'],
-              ])
+    add_table(doc, _QUICK_REF_RULES_HEADERS, _QUICK_REF_RULES)
 
     add_heading(doc, 'Content Components', level=2)
-    add_table(doc,
-              ['Component', 'Use When...', 'GEO Boost'],
-              [
-                  ['FAQ/Accordion', 'A reader might ask a question about this', '+40%'],
-                  ['Quote', 'You have an expert statement', '+30%'],
-                  ['Statistics', 'You have numbers or metrics', '+37%'],
-                  ['Key Fact', 'There is a headline data point', '+37%'],
-                  ['Rich Text', 'Writing narrative with inline source links', '+40%'],
-              ])
+    add_table(doc, _QUICK_REF_COMPONENTS_HEADERS, _QUICK_REF_COMPONENTS)
 
     add_heading(doc, 'Per-Page Minimums', level=2)
-    add_table(doc,
-              ['Requirement', 'Minimum', 'Component'],
-              [
-                  ['Statistics / data points', '2 per page', 'Statistics or Key Fact'],
-                  ['Expert quotes', '1 per page', 'Quote component'],
-                  ['External citations', '3 per page', 'Inline links in body text'],
-                  ['FAQ questions', '3 per page', 'FAQ/Accordion component'],
-                  ['Definition in opening', 'First 2 sentences', 'Opening body text'],
-              ])
+    add_table(doc, _QUICK_REF_MINIMUMS_HEADERS, _QUICK_REF_MINIMUMS)
 
     add_callout_box(doc, 'The One Thing to Avoid', [
         'Keyword stuffing: repeating the same phrase more than 2\u20133 times on a page '
@@ -2,16 +2,23 @@
 Shared python-docx utility functions extracted from the original generators.
 Import these in all report generator modules instead of duplicating them.
 """
+import copy
+import functools
 import io
+import itertools
 import os
 import logging
 import zipfile
+from datetime import date
+from xml.sax.saxutils import escape
 from docx import Document
 from docx.shared import Pt, RGBColor, Cm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn, nsdecls
-from docx.oxml import parse_xml
+from docx.oxml import OxmlElement, parse_xml
+from docx.table import Table
+from docx.text.paragraph import Paragraph
 
 logger = logging.getLogger(__name__)
 
@@ -30,15 +37,67 @@ AMBER = RGBColor(180, 120, 20)
 RULE_BLUE = RGBColor(0, 114, 187)
 TIP_AMBER = RGBColor(200, 150, 30)
 
+# Character style carrying the default body-run formatting (Modern Era,
+# 10 pt, DARK).  Plain body runs reference it instead of repeating the
+# same <w:rPr> children on every run.
+BODY_RUN_STYLE = 'Geo Body'
+
+# Point sizes used by the paragraph/run helpers, built once
+_PT0, _PT2, _PT3, _PT4, _PT6 = Pt(0), Pt(2), Pt(3), Pt(4), Pt(6)
+
 # Path to Numiko .dotx template
 _BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 _NUMIKO_TEMPLATE = os.path.join(_BASE_DIR, 'fonts', 'numiko_template.dotx')
 
+# WordprocessingML namespace declaration used by the parse_xml templates
+_W_NS = nsdecls('w')
+# <w:tcBorders> children, in the order the schema requires
+_BORDER_SIDES = ('top', 'left', 'bottom', 'right')
+
+# Clark-notation tags/attributes for the cell-property helpers
+_QN_TCBORDERS = qn('w:tcBorders')
+_QN_SIDES = {side: qn(f'w:{side}') for side in _BORDER_SIDES}
+_QN_VAL = qn('w:val')
+_QN_FILL = qn('w:fill')
+_QN_SZ = qn('w:sz')
+_QN_SPACE = qn('w:space')
+_QN_COLOR = qn('w:color')
+# One border side, for markup nested inside a declared <w:tcBorders>
+_BORDER_XML = ('<w:{side} w:val="{style}" w:sz="{size}" '
+               'w:space="0" w:color="{color}"/>')
+_NO_BORDERS_TEMPLATE = parse_xml(
+    f'<w:tcBorders {_W_NS}>'
+    + ''.join(_BORDER_XML.format(side=side, style='none', size='0', color='FFFFFF')
+              for side in _BORDER_SIDES)
+    + '</w:tcBorders>'
+)
+
+# Run/cell formatting for add_table(), pre-rendered as WordprocessingML
+_TABLE_HEADER_RPR = f'<w:rPr><w:b/><w:color w:val="{WHITE}"/><w:sz w:val="18"/></w:rPr>'
+_TABLE_BODY_RPR = f'<w:rPr><w:color w:val="{DARK}"/><w:sz w:val="18"/></w:rPr>'
+_TABLE_HEADER_SHD = '<w:shd w:fill="1A1A1A" w:val="clear"/>'
+_TABLE_STRIPE_SHD = '<w:shd w:fill="F5F5F5" w:val="clear"/>'
+
 # Content type strings
 _TEMPLATE_CT = 'application/vnd.openxmlformats-officedocument.wordprocessingml.template.main+xml'
 _DOCUMENT_CT = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml'
 
 
+# (local date, formatted string) — see default_report_date()
+_report_date_cache = (None, '')
+
+
+def default_report_date() -> str:
+    """Today's date as 'Month YYYY', re-formatted only when the day changes."""
+    global _report_date_cache
+    today = date.today()
+    cached_day, cached = _report_date_cache
+    if cached_day != today:
+        cached = today.strftime('%B %Y')
+        _report_date_cache = (today, cached)
+    return cached
+
+
 def _dotx_to_docx_stream(dotx_path: str) -> io.BytesIO:
     """Convert a .dotx template to an in-memory .docx stream.
 
@@ -62,11 +121,49 @@ def _dotx_to_docx_stream(dotx_path: str) -> io.BytesIO:
     return buf
 
 
+@functools.lru_cache(maxsize=4)
+def _template_docx_bytes(dotx_path: str, mtime_ns: int) -> bytes:
+    """Converted template bytes, cached per file version (path + mtime)."""
+    return _dotx_to_docx_stream(dotx_path).getvalue()
+
+
+def _pin_rfonts(rpr) -> None:
+    """Point *rpr*'s <w:rFonts> at the brand font, dropping theme-font links
+    (which would otherwise take precedence over w:ascii/w:hAnsi)."""
+    rfonts = rpr.get_or_add_rFonts()
+    for attr in ('w:asciiTheme', 'w:hAnsiTheme'):
+        rfonts.attrib.pop(qn(attr), None)
+    rfonts.set(qn('w:ascii'), FONT_NAME)
+    rfonts.set(qn('w:hAnsi'), FONT_NAME)
+
+
+def _set_default_font(doc: Document) -> None:
+    """Make the brand font the document default (docDefaults and Normal), so
+    helper-generated runs can omit their own <w:rFonts>."""
+    styles_el = doc.styles.element
+    defaults = styles_el.find(qn('w:docDefaults'))
+    if defaults is None:
+        defaults = OxmlElement('w:docDefaults')
+        styles_el.insert(0, defaults)
+    rpr_default = defaults.find(qn('w:rPrDefault'))
+    if rpr_default is None:
+        rpr_default = OxmlElement('w:rPrDefault')
+        defaults.insert(0, rpr_default)
+    rpr = rpr_default.find(qn('w:rPr'))
+    if rpr is None:
+        rpr = OxmlElement('w:rPr')
+        rpr_default.append(rpr)
+    _pin_rfonts(rpr)
+    _pin_rfonts(doc.styles['Normal'].element.get_or_add_rPr())
+
+
 def _ensure_required_styles(doc: Document) -> None:
     """Add any paragraph styles the report generators rely on but which may
     be absent from the branded template (e.g. 'List Bullet')."""
     from docx.enum.style import WD_STYLE_TYPE
 
+    _set_default_font(doc)
+
     existing = {s.name for s in doc.styles}
     if 'List Bullet' not in existing:
         bullet_style = doc.styles.add_style('List Bullet', WD_STYLE_TYPE.PARAGRAPH)
@@ -77,7 +174,6 @@ def _ensure_required_styles(doc: Document) -> None:
         fmt.space_before = Pt(2)
         fmt.space_after = Pt(2)
         # Register the bullet numbering via XML so Word renders the bullet glyph
-        from docx.oxml import OxmlElement
         numPr = OxmlElement('w:numPr')
         ilvl = OxmlElement('w:ilvl')
         ilvl.set(qn('w:val'), '0')
@@ -87,6 +183,12 @@ def _ensure_required_styles(doc: Document) -> None:
         numPr.append(numId)
         bullet_style.element.find(qn('w:pPr')).append(numPr)
 
+    if BODY_RUN_STYLE not in existing:
+        body_style = doc.styles.add_style(BODY_RUN_STYLE, WD_STYLE_TYPE.CHARACTER)
+        body_style.font.name = FONT_NAME
+        body_style.font.size = Pt(10)
+        body_style.font.color.rgb = DARK
+
 
 def _set_cover_page_text(doc: Document, title: str, subtitle: str) -> None:
     """Replace 'Document Title' and 'Subtitle' placeholders in the first-page
@@ -131,10 +233,16 @@ def create_document(title: str = '', subtitle: str = '') -> Document:
     Falls back to a blank Document if the template is not found, applying
     basic Modern Era styling as before.
     """
-    if os.path.exists(_NUMIKO_TEMPLATE):
+    try:
+        template_mtime = os.stat(_NUMIKO_TEMPLATE).st_mtime_ns
+    except OSError:
+        template_mtime = None
+
+    if template_mtime is not None:
         try:
             logger.info('Creating document from Numiko template: %s', _NUMIKO_TEMPLATE)
-            stream = _dotx_to_docx_stream(_NUMIKO_TEMPLATE)
+            # The template is read and re-zipped once per file version, not per report
+            stream = io.BytesIO(_template_docx_bytes(_NUMIKO_TEMPLATE, template_mtime))
             doc = Document(stream)
 
             body = doc.element.body
@@ -185,39 +293,77 @@ def create_document(title: str = '', subtitle: str = '') -> Document:
     doc = Document()
     # Apply basic styling fallback
     style = doc.styles['Normal']
-    style.font.name = FONT_NAME
     style.font.size = Pt(10)
     style.font.color.rgb = DARK
+    _ensure_required_styles(doc)
     return doc
 
 
 def set_cell_shading(cell, color_hex):
     """Set background shading on a table cell."""
-    shading = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}" w:val="clear"/>')
-    cell._tc.get_or_add_tcPr().append(shading)
+    cell._tc.get_or_add_tcPr().append(
+        OxmlElement('w:shd', {_QN_FILL: color_hex, _QN_VAL: 'clear'}))
 
 
 def set_cell_border(cell, side, color_hex, size='12', style='single'):
     """Set a specific border on a table cell."""
     tc_pr = cell._tc.get_or_add_tcPr()
-    borders = tc_pr.find(qn('w:tcBorders'))
+    borders = tc_pr.find(_QN_TCBORDERS)
     if borders is None:
-        borders = parse_xml(f'<w:tcBorders {nsdecls("w")}/>')
+        borders = OxmlElement('w:tcBorders')
         tc_pr.append(borders)
-    border_el = parse_xml(
-        f'<w:{side} {nsdecls("w")} w:val="{style}" w:sz="{size}" '
-        f'w:space="0" w:color="{color_hex}"/>'
-    )
-    existing = borders.find(qn(f'w:{side}'))
+    existing = borders.find(_QN_SIDES[side])
     if existing is not None:
         borders.remove(existing)
-    borders.append(border_el)
+    borders.append(OxmlElement(f'w:{side}', {
+        _QN_VAL: style, _QN_SZ: size, _QN_SPACE: '0', _QN_COLOR: color_hex,
+    }))
+
+
+def _replace_cell_borders(cell, template):
+    """Swap the cell's <w:tcBorders> for a copy of *template*."""
+    tc_pr = cell._tc.get_or_add_tcPr()
+    existing = tc_pr.find(_QN_TCBORDERS)
+    if existing is not None:
+        tc_pr.remove(existing)
+    tc_pr.append(copy.deepcopy(template))
 
 
 def remove_cell_borders(cell):
     """Remove all borders from a cell."""
-    for side in ('top', 'bottom', 'left', 'right'):
-        set_cell_border(cell, side, 'FFFFFF', size='0', style='none')
+    _replace_cell_borders(cell, _NO_BORDERS_TEMPLATE)
+
+
+_ON_OFF = {True: '', False: ' w:val="0"'}
+
+
+@functools.lru_cache(maxsize=128)
+def _rpr_xml(half_points, bold, italic, color_hex, ns=''):
+    """<w:rPr> markup for one run-formatting preset.
+
+    The brand font comes from the document defaults (``_set_default_font``).
+
+    *bold*/*italic* are tri-state like ``Font.bold``: None leaves them unset.
+    """
+    parts = [f'<w:rPr{ns}>']
+    if bold is not None:
+        parts.append(f'<w:b{_ON_OFF[bold]}/>')
+    if italic is not None:
+        parts.append(f'<w:i{_ON_OFF[italic]}/>')
+    parts.append(f'<w:color w:val="{color_hex}"/><w:sz w:val="{half_points}"/></w:rPr>')
+    return ''.join(parts)
+
+
+@functools.lru_cache(maxsize=128)
+def _rpr_template(half_points, bold, italic, color_hex):
+    """Parsed form of ``_rpr_xml``; callers insert a deepcopy."""
+    return parse_xml(_rpr_xml(half_points, bold, italic, color_hex, ns=' ' + _W_NS))
+
+
+def _apply_rpr(run, size, color, bold=None, italic=None):
+    """Give a freshly added *run* its full <w:rPr> in one insert."""
+    run._r.insert(0, copy.deepcopy(
+        _rpr_template(int(round(size * 2)), bold, italic, str(color))))
 
 
 def add_styled_para(doc, text, size=10, bold=False, italic=False, color=None,
@@ -226,16 +372,15 @@ def add_styled_para(doc, text, size=10, bold=False, italic=False, color=None,
     if color is None:
         color = DARK
     if space_after is None:
-        space_after = Pt(6)
+        space_after = _PT6
     if space_before is None:
-        space_before = Pt(0)
+        space_before = _PT0
     p = doc.add_paragraph()
     run = p.add_run(text)
-    run.font.size = Pt(size)
-    run.font.bold = bold
-    run.font.italic = italic
-    run.font.color.rgb = color
-    run.font.name = FONT_NAME
+    if size == 10 and not bold and not italic and color == DARK:
+        run.style = BODY_RUN_STYLE
+    else:
+        _apply_rpr(run, size, color, bold=bold, italic=italic)
     if alignment:
         p.alignment = alignment
     p.paragraph_format.space_after = space_after
@@ -243,6 +388,87 @@ def add_styled_para(doc, text, size=10, bold=False, italic=False, color=None,
     return p
 
 
+def add_italic_hint(doc, text):
+    """Add an italic grey prompt/example line (body size, default spacing).
+
+    Fast path for the most common non-default ``add_styled_para`` shape.
+    """
+    p = doc.add_paragraph()
+    _apply_rpr(p.add_run(text), 10, GRAY, italic=True)
+    fmt = p.paragraph_format
+    fmt.space_after = _PT6
+    fmt.space_before = _PT0
+    return p
+
+
+def styled_para_xml(text, size=10, bold=False, italic=False, color=DARK,
+                    space_after=_PT6, space_before=_PT0):
+    """``add_styled_para`` as a <w:p> markup string, for ``append_xml_block``."""
+    rpr = _rpr_xml(int(round(size * 2)), bold, italic, str(color))
+    return (f'<w:p><w:pPr><w:spacing w:before="{space_before.twips}" '
+            f'w:after="{space_after.twips}"/></w:pPr>{_run_xml(text, rpr)}</w:p>')
+
+
+def append_xml_block(doc, xml):
+    """Parse a run of body-level markup (e.g. several ``styled_para_xml``
+    paragraphs) once and add it to the end of the document body."""
+    _append_body_elements(doc, list(parse_xml(f'<w:body {_W_NS}>{xml}</w:body>')))
+
+
+def _append_body_elements(doc, elements):
+    """Add block-level *elements* at the end of the body, ahead of <w:sectPr>.
+
+    Goes to the detached fragment instead while a batch is open (see
+    ``begin_batched_body``).
+    """
+    _insert_before_sectpr(doc._body._element, elements)
+
+
+def _insert_before_sectpr(body, elements):
+    sect_pr = body.sectPr
+    for el in elements:
+        if sect_pr is not None:
+            sect_pr.addprevious(el)
+        else:
+            body.append(el)
+
+
+def begin_batched_body(doc):
+    """Route body additions into a detached <w:body> until ``end_batched_body``.
+
+    python-docx inserts every new paragraph/table ahead of <w:sectPr>, which
+    scans all existing body children; building each section in a small
+    fragment and flushing it at section breaks keeps those scans short.
+    """
+    body = doc._body
+    body._batch_target = body._element
+    body._element = body._body = OxmlElement('w:body')
+
+
+def flush_batched_body(doc):
+    """Move everything built since the last flush into the real body."""
+    body = doc._body
+    target = getattr(body, '_batch_target', None)
+    if target is not None:
+        _insert_before_sectpr(target, list(body._element))
+
+
+def end_batched_body(doc):
+    """Flush and return to writing straight into the document body."""
+    flush_batched_body(doc)
+    body = doc._body
+    target = getattr(body, '_batch_target', None)
+    if target is not None:
+        body._element = body._body = target
+        del body._batch_target
+
+
+def add_section_break(doc):
+    """Page break that also flushes a batched body (a natural section boundary)."""
+    doc.add_page_break()
+    flush_batched_body(doc)
+
+
 def add_heading(doc, text, level=1):
     """Add a heading with Numiko styling."""
     h = doc.add_heading(text, level=level)
@@ -256,91 +482,180 @@ def add_bullet(doc, text, bold_prefix=None):
     """Add a bullet point."""
     p = doc.add_paragraph(style='List Bullet')
     if bold_prefix:
-        run = p.add_run(bold_prefix)
-        run.font.bold = True
-        run.font.size = Pt(10)
-        run.font.color.rgb = DARK
-        run.font.name = FONT_NAME
-        run = p.add_run(text)
-    else:
-        run = p.add_run(text)
-    run.font.size = Pt(10)
-    run.font.color.rgb = DARK
-    run.font.name = FONT_NAME
-    p.paragraph_format.space_after = Pt(2)
+        _apply_rpr(p.add_run(bold_prefix), 10, DARK, bold=True)
+    run = p.add_run(text)
+    run.style = BODY_RUN_STYLE
+    p.paragraph_format.space_after = _PT2
     return p
 
 
+def _clone_paragraphs(first, texts, run_index):
+    """Append one copy of paragraph *first* per entry of *texts*.
+
+    Each copy is a deep copy of the already-formatted ``<w:p>`` element
+    (one C-level tree copy) with the text of run *run_index* swapped,
+    instead of rebuilding the paragraph and run properties from scratch.
+    """
+    paras = [first]
+    prev = first._p
+    for text in texts:
+        p_el = copy.deepcopy(first._p)
+        prev.addnext(p_el)
+        p = Paragraph(p_el, first._parent)
+        p.runs[run_index].text = text
+        paras.append(p)
+        prev = p_el
+    return paras
+
+
+def add_bullets(doc, items):
+    """Add a bullet point for each string in *items*; returns the paragraphs."""
+    items = list(items)
+    if not items:
+        return []
+    return _clone_paragraphs(add_bullet(doc, items[0]), items[1:], 0)
+
+
+def _run_xml(text: str, rpr: str) -> str:
+    """<w:r> markup for *text*, with newlines/tabs as <w:br/>/<w:tab/> like Run.text."""
+    if not text:
+        return f'<w:r>{rpr}</w:r>'
+    text = escape(text)
+    if '\n' in text or '\t' in text:
+        text = (text.replace('\t', '</w:t><w:tab/><w:t xml:space="preserve">')
+                    .replace('\n', '</w:t><w:br/><w:t xml:space="preserve">'))
+    return f'<w:r>{rpr}<w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def _add_spacer(doc):
+    """Append an empty spacer <w:p> to the body (no Paragraph wrapper).
+
+    CT_Body.add_p() keeps the paragraph ahead of the trailing <w:sectPr>.
+    """
+    doc._body._element.add_p()
+
+
 def add_table(doc, headers, rows):
-    """Add a formatted table."""
-    table = doc.add_table(rows=1 + len(rows), cols=len(headers))
+    """Add a formatted table.
+
+    The header and body rows are rendered as one WordprocessingML string and
+    parsed in a single pass rather than built cell by cell through python-docx.
+    """
+    ncols = len(headers)
+    table = doc.add_table(rows=0, cols=ncols)
     table.alignment = WD_TABLE_ALIGNMENT.LEFT
     table.style = 'Table Grid'
+    tc_pr = [
+        f'<w:tcW w:type="dxa" w:w="{col.w.twips}"/>'
+        for col in table._tbl.tblGrid.gridCol_lst
+    ]
 
+    parts = [f'<w:tbl {_W_NS}><w:tr>']
     for i, h in enumerate(headers):
-        cell = table.rows[0].cells[i]
-        cell.text = ''
-        p = cell.paragraphs[0]
-        run = p.add_run(h)
-        run.font.size = Pt(9)
-        run.font.bold = True
-        run.font.color.rgb = WHITE
-        run.font.name = FONT_NAME
-        set_cell_shading(cell, '1A1A1A')
+        parts.append(
+            f'<w:tc><w:tcPr>{tc_pr[i]}{_TABLE_HEADER_SHD}</w:tcPr>'
+            f'<w:p>{_run_xml(h, _TABLE_HEADER_RPR)}</w:p></w:tc>'
+        )
+    parts.append('</w:tr>')
 
     for row_idx, row in enumerate(rows):
-        for col_idx, val in enumerate(row):
-            if col_idx >= len(headers):
-                break
-            cell = table.rows[row_idx + 1].cells[col_idx]
-            cell.text = ''
-            p = cell.paragraphs[0]
-            run = p.add_run(val)
-            run.font.size = Pt(9)
-            run.font.name = FONT_NAME
-            run.font.color.rgb = DARK
-            if row_idx % 2 == 1:
-                set_cell_shading(cell, 'F5F5F5')
-
-    doc.add_paragraph()
+        shd = _TABLE_STRIPE_SHD if row_idx % 2 == 1 else ''
+        values = list(itertools.islice(row, ncols))
+        parts.append('<w:tr>')
+        for col_idx, val in enumerate(values):
+            parts.append(
+                f'<w:tc><w:tcPr>{tc_pr[col_idx]}{shd}</w:tcPr>'
+                f'<w:p>{_run_xml(val, _TABLE_BODY_RPR)}</w:p></w:tc>'
+            )
+        # Short rows keep plain empty cells, as python-docx would create
+        for col_idx in range(len(values), ncols):
+            parts.append(f'<w:tc><w:tcPr>{tc_pr[col_idx]}</w:tcPr><w:p/></w:tc>')
+        parts.append('</w:tr>')
+    parts.append('</w:tbl>')
+
+    tbl = table._tbl
+    for tr in list(parse_xml(''.join(parts))):
+        tbl.append(tr)
+
+    _add_spacer(doc)
     return table
 
 
+@functools.lru_cache(maxsize=64)
+def _rgb_from_hex(hex_str: str) -> RGBColor:
+    """RGBColor for an 'RRGGBB' string; the few accent colours are memoised."""
+    v = int(hex_str, 16)
+    return RGBColor((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+
+
+# Copies of constant tables' <w:tbl>, keyed on content and block width —
+# see add_static_table()
+_static_tables = {}
+
+
+def add_static_table(doc, headers, rows):
+    """``add_table`` for constant content (*headers*/*rows* as tuples).
+
+    The first call per layout width builds the table normally and keeps a
+    copy of its <w:tbl>; later calls deep-copy that element instead.
+    """
+    key = (headers, rows, doc._block_width)
+    cached = _static_tables.get(key)
+    if cached is None:
+        table = add_table(doc, headers, rows)
+        _static_tables[key] = copy.deepcopy(table._tbl)
+        return table
+    tbl = copy.deepcopy(cached)
+    _append_body_elements(doc, [tbl])
+    _add_spacer(doc)
+    return Table(tbl, doc._body)
+
+
+@functools.lru_cache(maxsize=64)
+def _callout_cell_props(accent_hex: str, bg_hex: str) -> str:
+    """tcBorders + shd markup for a callout cell: thick accent left edge, the
+    other sides drawn in the background colour."""
+    borders = ''.join(
+        _BORDER_XML.format(side=side, style='single',
+                           size='24' if side == 'left' else '4',
+                           color=accent_hex if side == 'left' else bg_hex)
+        for side in _BORDER_SIDES
+    )
+    return (f'<w:tcBorders>{borders}</w:tcBorders>'
+            f'<w:shd w:fill="{bg_hex}" w:val="clear"/>')
+
+
 def add_callout_box(doc, heading, body_lines, accent_hex, bg_hex, heading_color=None):
-    """Add a callout box as a single-cell table with left border accent."""
+    """Add a callout box as a single-cell table with left border accent.
+
+    The cell (borders, shading, heading and body paragraphs) is rendered as
+    markup and parsed once into the python-docx table shell.
+    """
     if heading_color is None:
-        heading_color = RGBColor(
-            int(accent_hex[0:2], 16),
-            int(accent_hex[2:4], 16),
-            int(accent_hex[4:6], 16),
-        )
+        heading_color = _rgb_from_hex(accent_hex)
 
-    table = doc.add_table(rows=1, cols=1)
+    table = doc.add_table(rows=0, cols=1)
     table.alignment = WD_TABLE_ALIGNMENT.LEFT
-    cell = table.rows[0].cells[0]
-    set_cell_shading(cell, bg_hex)
-    set_cell_border(cell, 'left', accent_hex, size='24')
-    set_cell_border(cell, 'top', bg_hex, size='4')
-    set_cell_border(cell, 'bottom', bg_hex, size='4')
-    set_cell_border(cell, 'right', bg_hex, size='4')
-
-    p = cell.paragraphs[0]
-    run = p.add_run(heading)
-    run.font.size = Pt(10)
-    run.font.bold = True
-    run.font.color.rgb = heading_color
-    run.font.name = FONT_NAME
-    p.paragraph_format.space_after = Pt(4)
-
+    tbl = table._tbl
+    width = tbl.tblGrid.gridCol_lst[0].w.twips
+
+    heading_rpr = _rpr_xml(20, True, None, str(heading_color))
+    body_rpr = _rpr_xml(18, None, None, str(DARK))
+    parts = [
+        f'<w:tbl {_W_NS}><w:tr><w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/>',
+        _callout_cell_props(accent_hex, bg_hex),
+        '</w:tcPr>',
+        f'<w:p><w:pPr><w:spacing w:after="{_PT4.twips}"/></w:pPr>',
+        _run_xml(heading, heading_rpr),
+        '</w:p>',
+    ]
     for line in body_lines:
-        p = cell.add_paragraph()
-        run = p.add_run(line)
-        run.font.size = Pt(9)
-        run.font.color.rgb = DARK
-        run.font.name = FONT_NAME
-        p.paragraph_format.space_after = Pt(3)
+        parts.append(f'<w:p><w:pPr><w:spacing w:after="{_PT3.twips}"/></w:pPr>'
+                     f'{_run_xml(line, body_rpr)}</w:p>')
+    parts.append('</w:tc></w:tr></w:tbl>')
+    tbl.append(parse_xml(''.join(parts))[0])
 
-    doc.add_paragraph()
+    _add_spacer(doc)
     return table
 
 
@@ -372,14 +687,16 @@ def add_golden_rule(doc, number, title, boost, description):
 def add_checklist_item(doc, text):
     """Checkbox-style item."""
     p = doc.add_paragraph()
-    run = p.add_run('[ ]  ')
-    run.font.size = Pt(10)
-    run.font.color.rgb = GRAY
-    run.font.name = FONT_NAME
-    run = p.add_run(text)
-    run.font.size = Pt(10)
-    run.font.color.rgb = DARK
-    run.font.name = FONT_NAME
-    p.paragraph_format.space_after = Pt(2)
+    _apply_rpr(p.add_run('[ ]  '), 10, GRAY)
+    _apply_rpr(p.add_run(text), 10, DARK)
+    p.paragraph_format.space_after = _PT2
     p.paragraph_format.left_indent = Cm(0.5)
     return p
+
+
+def add_checklist_items(doc, items):
+    """Add a checkbox-style item for each string in *items*."""
+    items = list(items)
+    if not items:
+        return []
+    return _clone_paragraphs(add_checklist_item(doc, items[0]), items[1:], 1)
@@ -17,18 +17,21 @@ audit dict keys (from audit_service.run_audit()):
   robots_exists, ai_bots, ai_bots_blocked, has_sitemap, sitemap_url, score,
   backlinks_rank, referring_domains, total_backlinks
 """
+import io
 import os
 import logging
-from datetime import datetime
-from docx.shared import Pt, Cm
+from bisect import bisect_right
+from docx.shared import Pt, Cm, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from docx import Document
 
 from .docx_helpers import (
     BLACK, DARK, GRAY, LIGHT_GRAY, WHITE, RED, GREEN, AMBER,
-    add_styled_para, add_heading, add_bullet, add_table,
-    add_callout_box, set_cell_shading, create_document,
+    add_styled_para, add_italic_hint, add_heading, add_bullet, add_table,
+    add_callout_box, set_cell_shading, create_document, default_report_date,
+    add_static_table, append_xml_block, styled_para_xml,
+    begin_batched_body, end_batched_body, add_section_break,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,44 +40,314 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__fil
 DEFAULT_LOGO = os.path.join(BASE_DIR, 'fonts', 'numiko_logo.png')
 
 
+# Score bands: [0, 41) weak, [41, 71) moderate, [71, ∞) good — indexed by
+# bisect_right(_SCORE_BANDS, score)
+_SCORE_BANDS = (41, 71)
+_SCORE_COLORS = ('B42828', 'C87814', '167832')
+_SCORE_RGBS = tuple(RGBColor.from_string(h) for h in _SCORE_COLORS)
+_GEO_METHOD_COUNTS = ('0–2', '3–5', '6–9')
+_TIER_STATUSES = ('Weak', 'Moderate', 'Good')
+_SUMMARY_RATINGS = ('a weak', 'a moderate', 'a strong')
+_SUMMARY_OUTLOOKS = (
+    'The site has significant GEO gaps that limit its visibility in AI-generated '
+    'answers. Immediate action is needed on technical fundamentals — schema markup, '
+    'meta tags, AI bot access — before content optimisation can be effective.',
+    'The site has some GEO foundations in place but significant gaps remain. '
+    'Priority areas include schema markup, AI bot access, and content enrichment '
+    'with the Princeton GEO methods to improve AI citation visibility.',
+    'The site has a solid GEO foundation. Key strengths include good meta tag '
+    'coverage, structured data, and fast page load times. The priority is '
+    'enriching content with the Princeton GEO methods — statistics, expert quotes, '
+    'citations, and FAQ formatting — to maximise AI citation rates.',
+)
+_STATUS_COLORS = {
+    (True, False): GREEN, (True, True): GREEN,
+    (False, True): AMBER, (False, False): RED,
+}
+_YES_NO = ('No', 'Yes')
+
+# Backlink metric assessments — (moderate, strong) lower bounds for _classify()
+_STRENGTH = ('Weak', 'Moderate', 'Strong')
+_RANK_THRESHOLDS = (10, 30)
+_REFERRING_DOMAIN_THRESHOLDS = (50, 500)
+_BACKLINK_THRESHOLDS = (200, 5000)
+
+# Text-signal status by (present, passes check) — see _meta_status()
+_META_STATUS = {
+    (True, True): 'Good', (True, False): 'Weak',
+    (False, True): 'Missing', (False, False): 'Missing',
+}
+
+# Fixed body paragraphs, rendered to markup once and batched in with
+# append_xml_block()
+_FRAMEWORK_INTRO_XML = styled_para_xml(
+    'This audit is based on the Princeton University GEO research framework '
+    '(arXiv:2311.09735, KDD 2024), which identified 9 content optimisation methods '
+    'that improve AI visibility by up to 40%. GEO (Generative Engine Optimization) is '
+    'the practice of optimising website content to be cited by AI search engines — '
+    'ChatGPT, Perplexity, Google AI Overview, Microsoft Copilot, and Claude.'
+)
+_WHAT_IS_GEO_XML = styled_para_xml(
+    'Generative Engine Optimization (GEO) is the practice of optimising website content to be '
+    'cited by AI search engines — ChatGPT, Perplexity, Google AI Overview, Microsoft Copilot, '
+    'and Claude. Unlike traditional SEO where the goal is to rank on a results page, GEO focuses '
+    'on being the source that AI platforms quote when answering user questions.'
+)
+_FRAMEWORK_METHODS_XML = styled_para_xml(
+    'This audit is based on the Princeton University GEO research framework (arXiv:2311.09735, '
+    'accepted KDD 2024), which identified 9 methods that improve AI visibility by up to 40%.'
+)
+
+
+# AI crawlers reported individually in the bot-access table
+_AI_BOTS = (
+    ('GPTBot', 'ChatGPT / OpenAI'),
+    ('ChatGPT-User', 'ChatGPT browsing'),
+    ('ClaudeBot', 'Claude / Anthropic'),
+    ('anthropic-ai', 'Claude (legacy)'),
+    ('PerplexityBot', 'Perplexity'),
+)
+_STANDARD_BOT_ROWS = (
+    ('Googlebot', 'Google AI Overview', 'Standard', 'Implicitly allowed (standard)'),
+    ('Bingbot', 'Copilot / Bing', 'Standard', 'Implicitly allowed (standard)'),
+)
+
+# Content-recommendation callouts (Section 6), identical in every report
+_CONTENT_PRIORITY_CALLOUTS = (
+    ('Priority: Add Statistics and Data Points (+37% boost)', (
+        'Include specific, factual numbers throughout key pages. Examples:',
+        '• Years in business, number of clients, project counts',
+        '• Awards, accreditations, qualifications held',
+        '• Customer satisfaction scores or testimonials with specifics',
+        '• Pricing ranges, timelines, quantities',
+        'Even approximate data is better than none. '
+        '"Over 200 projects delivered" is far more citable than "extensive experience."',
+    )),
+    ('Priority: Add Expert Quotes (+30% boost)', (
+        'Include named quotes from team members, clients, or industry bodies. Format:',
+        '"[Quote text]" — Name, Role/Organisation',
+        '',
+        'AI engines treat attributed quotes as high-quality, citable content. '
+        'Anonymous testimonials have less impact. '
+        'Client quotes are particularly valuable — they provide social proof and '
+        'factual evidence that AI engines can extract and cite.',
+    )),
+    ('Priority: Create FAQ Content (+40% boost)', (
+        'Add a FAQ section to key pages answering common questions. Structure them as:',
+        'Q: [Common question your audience would ask an AI]',
+        'A: [Direct, factual, concise answer]',
+        '',
+        'FAQ content with FAQPage schema provides the single highest AI visibility boost '
+        '(+40%) in the Princeton research. Target the exact questions people ask AI engines '
+        'about your product, service, or area of expertise.',
+    )),
+)
+
+# Recommendations section: (gap key, heading, body). The gap key names the
+# failed check that triggers the entry; None means it is always included.
+_CRITICAL_RECOMMENDATIONS = (
+    ('title', 'Add a page title',
+     'Every page must have a unique <title> tag. '
+     'This is the most basic SEO/GEO requirement and is currently missing.'),
+    ('h1', 'Add an H1 heading',
+     'Every page needs exactly one H1 heading that clearly describes the page topic.'),
+    ('schema', 'Implement JSON-LD schema markup',
+     'No structured data was detected. '
+     'Add at minimum an Organization/LocalBusiness schema to every page, '
+     'and FAQPage schema to key content pages.'),
+)
+
+_HIGH_IMPACT_RECOMMENDATIONS = (
+    ('description', 'Write meta descriptions for all pages',
+     'Add a 120–155 character meta description to every page. Include the primary keyword '
+     'and a clear value proposition. AI engines use meta descriptions as summary signals.'),
+    ('og_tags', 'Add Open Graph tags',
+     'Implement og:title, og:description, og:url, og:image on all pages. '
+     'These are used by social platforms and AI engines for rich content interpretation.'),
+    ('ai_bots', 'Configure AI bot access in robots.txt',
+     'Add explicit Allow directives for GPTBot, ClaudeBot, PerplexityBot, and '
+     'ChatGPT-User. This signals that AI crawlers are welcome and may improve '
+     'crawl priority for your content.'),
+    ('sitemap', 'Create an XML sitemap',
+     'Generate a sitemap.xml and reference it in robots.txt. '
+     'This helps AI crawlers discover all your pages efficiently.'),
+    (None, 'Add FAQPage schema to key pages',
+     'Implement FAQPage JSON-LD on your most important content pages. '
+     'Structure 4–8 Q&A pairs per page answering the questions your audience '
+     'asks AI engines about your product or service. '
+     'This provides the single highest AI visibility boost (+40%) in the Princeton research.'),
+)
+
+_CONTENT_RECOMMENDATIONS = (
+    (None, 'Add statistics to key pages (+37% boost)',
+     'Enrich content with specific, verifiable numbers. '
+     'Years in business, client counts, project counts, awards, accreditations. '
+     'Statistics are the second highest-impact GEO method in the Princeton research.'),
+    (None, 'Add expert and client quotes (+30% boost)',
+     'Include named, attributed quotes on product/service pages and the homepage. '
+     'Format: "[Quote]" — Name, Title/Organisation. '
+     'Client testimonials with specifics ("X saved us Y hours per week") are particularly citable.'),
+    (None, 'Structure content for answer extraction',
+     'Rewrite key pages in an "answer-first" format: lead with the key fact or definition, '
+     'then expand with supporting detail. AI engines prefer content structured as direct '
+     'answers to questions over marketing copy or narrative prose.'),
+)
+
+_TECHNICAL_RECOMMENDATIONS = (
+    (None, 'Implement IndexNow for Bing/Copilot',
+     'IndexNow notifies Bing instantly when new content is published, '
+     'ensuring Microsoft Copilot indexes fresh content quickly. '
+     'Most CMS platforms have IndexNow plugins available.'),
+    (None, 'Register in Google Search Console',
+     'Verify the site in Google Search Console to monitor Core Web Vitals, '
+     'crawl errors, and schema validation. Check the Rich Results Test for '
+     'structured data issues: search.google.com/test/rich-results'),
+)
+
+# Constant tables, built once per layout width by add_static_table()
+_METHODS_HEADERS = ('Method', 'AI Visibility Boost', 'Description')
+_METHODS_ROWS = (
+    ('Cite Sources', '+40%', 'Add authoritative citations and references'),
+    ('Statistics Addition', '+37%', 'Include specific numbers and data points'),
+    ('Quotation Addition', '+30%', 'Add expert quotes with attribution'),
+    ('Authoritative Tone', '+25%', 'Use confident, expert language'),
+    ('Easy-to-understand', '+20%', 'Simplify complex concepts'),
+    ('Technical Terms', '+18%', 'Include domain-specific terminology'),
+    ('Unique Words', '+15%', 'Increase vocabulary diversity'),
+    ('Fluency Optimization', '+15–30%', 'Improve readability and flow'),
+    ('Keyword Stuffing', '−10%', 'AVOID — hurts AI visibility'),
+)
+
+_SCHEMA_HEADERS = ('Schema Type', 'Where', 'Priority', 'Key Properties')
+_SCHEMA_ROWS = (
+    ('Organization / LocalBusiness', 'All pages (sitewide)', 'High',
+     'Name, address, phone, opening hours, social profiles, logo'),
+    ('WebPage', 'All pages', 'High',
+     'Name, description, breadcrumb, dateModified'),
+    ('FAQPage', 'Key content pages', 'Critical',
+     '+40% AI visibility boost — highest impact schema type'),
+    ('BreadcrumbList', 'All pages', 'Medium',
+     'Navigation structure for AI engines'),
+    ('Article / BlogPosting', 'Blog / news', 'Medium',
+     'datePublished, author, publisher for E-E-A-T'),
+    ('Product / Service', 'Product / service pages', 'High',
+     'Name, description, offers, review, aggregateRating'),
+)
+
+_CWV_HEADERS = ('Metric', 'What it measures', 'Good threshold')
+_CWV_ROWS = (
+    ('LCP (Largest Contentful Paint)', 'Main content load speed', '< 2.5 seconds'),
+    ('INP (Interaction to Next Paint)', 'Interactivity responsiveness', '< 200ms'),
+    ('CLS (Cumulative Layout Shift)', 'Visual stability', '< 0.1'),
+    ('TTFB (Time to First Byte)', 'Server response speed', '< 800ms'),
+)
+
+_AUTHORITY_HEADERS = (
+    'Authority Level', 'Referring Domains', 'ChatGPT Cite Probability', 'Priority',
+)
+_AUTHORITY_ROWS = (
+    ('High Authority', '500+', 'High — frequently cited', 'Already strong'),
+    ('Medium Authority', '50–500', 'Moderate — cited for niche queries', 'Build further'),
+    ('Low Authority', '< 50', 'Low — rarely cited unprompted', 'Priority gap'),
+)
+
+_LEGEND_HEADERS = ('Score', 'Rating', 'Meaning')
+_LEGEND_ROWS = (
+    ('71–100', 'GEO Ready', 'Strong technical foundation. Focus on content enrichment.'),
+    ('41–70', 'Needs Work', 'Some foundations in place. Address priority gaps systematically.'),
+    ('0–40', 'Poor', 'Significant technical gaps. Prioritise schema, meta tags, and bot access.'),
+)
+
+_METHODS_REFERENCE_ROWS = (
+    ('Cite Sources', '+40%', 'Add authoritative citations and external references'),
+    ('Statistics Addition', '+37%', 'Include specific numbers and data points'),
+    ('Quotation Addition', '+30%', 'Add expert quotes with clear attribution'),
+    ('Authoritative Tone', '+25%', 'Use confident, definitive, expert language'),
+    ('Easy-to-understand', '+20%', 'Simplify complex concepts — plain English first'),
+    ('Technical Terms', '+18%', 'Include relevant domain-specific terminology'),
+    ('Unique Words', '+15%', 'Increase vocabulary diversity — avoid repetition'),
+    ('Fluency Optimization', '+15–30%', 'Improve readability and logical flow'),
+    ('Keyword Stuffing', '−10%', 'AVOID — unnatural repetition hurts AI visibility'),
+)
+
+_PLATFORM_HEADERS = ('Platform', 'Primary Index', 'Key Requirement', 'Unique Factor')
+_PLATFORM_ROWS = (
+    ('ChatGPT', 'Bing / Web', 'Domain Authority', 'Content-Answer Fit'),
+    ('Perplexity', 'Own + Google', 'FAQ Schema', 'PDF indexing, semantic search'),
+    ('Google AI Overview', 'Google', 'E-E-A-T signals', 'Knowledge Graph + schema'),
+    ('Microsoft Copilot', 'Bing', 'Bing Webmaster', 'IndexNow for freshness'),
+    ('Claude', 'Brave Search', 'Factual density', 'Brave Search indexing'),
+)
+
+
+def _score_band(score: int) -> int:
+    return bisect_right(_SCORE_BANDS, score)
+
+
 def _score_color(score: int) -> str:
-    if score >= 71:
-        return '167832'
-    if score >= 41:
-        return 'C87814'
-    return 'B42828'
+    return _SCORE_COLORS[_score_band(score)]
 
 
 def _status_color(ok: bool, warn: bool = False):
-    if ok:
-        return GREEN
-    if warn:
-        return AMBER
-    return RED
+    return _STATUS_COLORS[bool(ok), bool(warn)]
 
 
 def _yes_no(val) -> str:
-    return 'Yes' if val else 'No'
+    return _YES_NO[bool(val)]
+
+
+def _classify(value, thresholds) -> str:
+    """Weak/Moderate/Strong for *value* against ascending (moderate, strong) cut-offs."""
+    return _STRENGTH[bisect_right(thresholds, value)]
+
+
+def _trunc(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit] + '…'
+
+
+def _meta_status(value, ok) -> str:
+    """'Good' / 'Weak' (present but failing its check) / 'Missing'."""
+    return _META_STATUS[bool(value), bool(ok)]
+
+
+def _text_finding(label: str, text: str, limit: int, ok) -> list:
+    """Key-findings row for a text signal: truncated value and status."""
+    return [label, _trunc(text, limit) if text else 'Missing', _meta_status(text, ok)]
+
+
+def _scorecard_row(label: str, points: int, present, rating: str, detail: str) -> list:
+    """One scorecard row: full points when *present*, otherwise zero."""
+    return [label, f'{points if present else 0}/{points}', rating, detail]
+
+
+def _add_recommendations(doc, recs, gaps, rec_num: int, accent_hex: str, bg_hex: str) -> int:
+    """Add a numbered callout for each entry whose gap is open; return the next number."""
+    for gap, heading, body in recs:
+        if gaps[gap]:
+            add_callout_box(doc, f'Recommendation {rec_num}: {heading}', [body],
+                            accent_hex, bg_hex)
+            rec_num += 1
+    return rec_num
 
 
 def _geo_method_present(score: int) -> str:
     """Map raw audit data to a rough content-method count."""
-    if score >= 71:
-        return '6–9'
-    if score >= 41:
-        return '3–5'
-    return '0–2'
+    return _GEO_METHOD_COUNTS[_score_band(score)]
 
 
 def build_geo_audit_report(params: dict, audit: dict) -> Document:
     client_name = params.get('client_name') or 'Client'
     client_domain = params.get('client_domain') or audit.get('url', '')
     project_name = params.get('project_name') or ''
-    date_str = params.get('date') or datetime.now().strftime('%B %Y')
+    date_str = params.get('date') or default_report_date()
     # Convenience aliases
     score = audit.get('score', 0)
     title = audit.get('title') or ''
+    title_ok = audit.get('title_ok')
+    title_length = audit.get('title_length', len(title))
     description = audit.get('description') or ''
+    description_ok = audit.get('description_ok')
+    description_length = audit.get('description_length', len(description))
     h1 = audit.get('h1') or ''
     og_tags = audit.get('og_tags', False)
     jsonld_count = audit.get('jsonld_count', 0)
@@ -90,55 +363,28 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     referring_domains = audit.get('referring_domains')
     total_backlinks = audit.get('total_backlinks')
 
-    score_hex = _score_color(score)
-    score_rgb = (int(score_hex[0:2], 16), int(score_hex[2:4], 16), int(score_hex[4:6], 16))
-    from docx.shared import RGBColor
-    SCORE_COLOR = RGBColor(*score_rgb)
+    band = _score_band(score)
+    # Labels repeated across the findings, scorecard and appendix tables
+    jsonld_plural = '' if jsonld_count == 1 else 's'
+    jsonld_label = f'{jsonld_count} block{jsonld_plural}'
+    load_time_label = f'{load_time}s' if load_time else 'Not measured'
+    SCORE_COLOR = _SCORE_RGBS[band]
 
     # Build cover page title — use client name as title, project name as subtitle
     cover_title = f'GEO Audit Report — {client_name}'
     cover_subtitle = project_name or client_domain
 
     doc = create_document(title=cover_title, subtitle=cover_subtitle)
+    # Sections are built in a detached fragment, flushed at each page break
+    begin_batched_body(doc)
 
     # ── EXECUTIVE SUMMARY ───────────────────────────────────────────────────
     add_heading(doc, 'Executive Summary', level=1)
 
-    if score >= 71:
-        summary_rating = 'a strong'
-        summary_outlook = (
-            'The site has a solid GEO foundation. Key strengths include good meta tag '
-            'coverage, structured data, and fast page load times. The priority is '
-            'enriching content with the Princeton GEO methods — statistics, expert quotes, '
-            'citations, and FAQ formatting — to maximise AI citation rates.'
-        )
-    elif score >= 41:
-        summary_rating = 'a moderate'
-        summary_outlook = (
-            'The site has some GEO foundations in place but significant gaps remain. '
-            'Priority areas include schema markup, AI bot access, and content enrichment '
-            'with the Princeton GEO methods to improve AI citation visibility.'
-        )
-    else:
-        summary_rating = 'a weak'
-        summary_outlook = (
-            'The site has significant GEO gaps that limit its visibility in AI-generated '
-            'answers. Immediate action is needed on technical fundamentals — schema markup, '
-            'meta tags, AI bot access — before content optimisation can be effective.'
-        )
-
-    add_styled_para(doc, (
+    append_xml_block(doc, styled_para_xml(
         f'{client_name} ({client_domain}) scores {score}/100 for GEO readiness — '
-        f'{summary_rating} foundation for AI search visibility. {summary_outlook}'
-    ))
-
-    add_styled_para(doc, (
-        'This audit is based on the Princeton University GEO research framework '
-        '(arXiv:2311.09735, KDD 2024), which identified 9 content optimisation methods '
-        'that improve AI visibility by up to 40%. GEO (Generative Engine Optimization) is '
-        'the practice of optimising website content to be cited by AI search engines — '
-        'ChatGPT, Perplexity, Google AI Overview, Microsoft Copilot, and Claude.'
-    ))
+        f'{_SUMMARY_RATINGS[band]} foundation for AI search visibility. {_SUMMARY_OUTLOOKS[band]}'
+    ) + _FRAMEWORK_INTRO_XML)
 
     # Score box
     p = doc.add_paragraph()
@@ -154,17 +400,14 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     # Key findings table
     add_heading(doc, 'Key Findings at a Glance', level=2)
 
-    findings = []
-    findings.append(['Page Title', title[:60] + ('…' if len(title) > 60 else '') if title else 'Missing',
-                     'Good' if (title and audit.get('title_ok')) else ('Weak' if title else 'Missing')])
-    findings.append(['Meta Description',
-                     description[:60] + ('…' if len(description) > 60 else '') if description else 'Missing',
-                     'Good' if (description and audit.get('description_ok')) else ('Weak' if description else 'Missing')])
-    findings.append(['H1 Heading', h1[:50] + ('…' if len(h1) > 50 else '') if h1 else 'Missing',
-                     'Good' if h1 else 'Missing'])
+    findings = [
+        _text_finding('Page Title', title, 60, title_ok),
+        _text_finding('Meta Description', description, 60, description_ok),
+        _text_finding('H1 Heading', h1, 50, True),
+    ]
     findings.append(['OG / Social Tags', 'Present' if og_tags else 'Missing',
                      'Good' if og_tags else 'Missing'])
-    findings.append(['JSON-LD Schema', f'{jsonld_count} block{"s" if jsonld_count != 1 else ""}',
+    findings.append(['JSON-LD Schema', jsonld_label,
                      'Good' if jsonld_count > 0 else 'Missing'])
     findings.append(['Page Load Time', f'{load_time}s' if load_time else 'Unknown',
                      'Good' if load_time_ok else ('Weak' if load_time else 'Missing')])
@@ -196,48 +439,28 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
 
     add_table(doc, ['Check', 'Value', 'Status'], findings)
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── WHAT IS GEO ─────────────────────────────────────────────────────────
     add_heading(doc, 'What is GEO?', level=1)
 
-    add_styled_para(doc, (
-        'Generative Engine Optimization (GEO) is the practice of optimising website content to be '
-        'cited by AI search engines — ChatGPT, Perplexity, Google AI Overview, Microsoft Copilot, '
-        'and Claude. Unlike traditional SEO where the goal is to rank on a results page, GEO focuses '
-        'on being the source that AI platforms quote when answering user questions.'
-    ))
-
-    add_styled_para(doc, (
-        'Being cited is the new "ranking #1." When a user asks an AI engine a question relevant to '
-        f'{client_name}\'s services, the AI synthesises an answer from multiple sources. Sites that '
-        'provide extractable facts — statistics, expert quotes, structured data, citations — are the '
-        'ones that get cited. Marketing copy, no matter how well-written, is rarely cited directly.'
-    ))
+    append_xml_block(doc, ''.join((
+        _WHAT_IS_GEO_XML,
+        styled_para_xml(
+            'Being cited is the new "ranking #1." When a user asks an AI engine a question relevant to '
+            f'{client_name}\'s services, the AI synthesises an answer from multiple sources. Sites that '
+            'provide extractable facts — statistics, expert quotes, structured data, citations — are the '
+            'ones that get cited. Marketing copy, no matter how well-written, is rarely cited directly.'
+        ),
+        _FRAMEWORK_METHODS_XML,
+    )))
 
-    add_styled_para(doc, (
-        'This audit is based on the Princeton University GEO research framework (arXiv:2311.09735, '
-        'accepted KDD 2024), which identified 9 methods that improve AI visibility by up to 40%.'
-    ))
-
-    add_table(doc,
-              ['Method', 'AI Visibility Boost', 'Description'],
-              [
-                  ['Cite Sources', '+40%', 'Add authoritative citations and references'],
-                  ['Statistics Addition', '+37%', 'Include specific numbers and data points'],
-                  ['Quotation Addition', '+30%', 'Add expert quotes with attribution'],
-                  ['Authoritative Tone', '+25%', 'Use confident, expert language'],
-                  ['Easy-to-understand', '+20%', 'Simplify complex concepts'],
-                  ['Technical Terms', '+18%', 'Include domain-specific terminology'],
-                  ['Unique Words', '+15%', 'Increase vocabulary diversity'],
-                  ['Fluency Optimization', '+15–30%', 'Improve readability and flow'],
-                  ['Keyword Stuffing', '−10%', 'AVOID — hurts AI visibility'],
-              ])
+    add_static_table(doc, _METHODS_HEADERS, _METHODS_ROWS)
 
     add_styled_para(doc, 'Best combination: Fluency + Statistics = Maximum boost',
                     bold=True, color=BLACK)
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 1. META TAGS & ON-PAGE FUNDAMENTALS ─────────────────────────────────
     add_heading(doc, '1. Meta Tags & On-Page Fundamentals', level=1)
@@ -252,9 +475,9 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     add_heading(doc, 'Page Title', level=2)
     if title:
         add_styled_para(doc, f'Found: "{title}"')
-        add_styled_para(doc, f'Length: {audit.get("title_length", len(title))} characters '
-                        f'({"good — under 60" if audit.get("title_ok") else "too long — aim for under 60 characters"})')
-        if not audit.get('title_ok'):
+        add_styled_para(doc, f'Length: {title_length} characters '
+                        f'({"good — under 60" if title_ok else "too long — aim for under 60 characters"})')
+        if not title_ok:
             add_callout_box(doc, 'Recommendation', [
                 'Shorten the page title to under 60 characters. '
                 'AI engines truncate long titles and may misrepresent the page topic. '
@@ -272,8 +495,8 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     add_heading(doc, 'Meta Description', level=2)
     if description:
         add_styled_para(doc, f'Found: "{description[:120]}{"…" if len(description) > 120 else ""}"')
-        add_styled_para(doc, f'Length: {audit.get("description_length", len(description))} characters '
-                        f'({"good — under 155" if audit.get("description_ok") else "too long — aim for under 155 characters"})')
+        add_styled_para(doc, f'Length: {description_length} characters '
+                        f'({"good — under 155" if description_ok else "too long — aim for under 155 characters"})')
     else:
         add_styled_para(doc, 'No meta description found.', bold=True, color=RED)
         add_callout_box(doc, 'Recommendation: Add Meta Description', [
@@ -313,7 +536,7 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
             'These are used by social platforms, AI search engines, and link preview systems.'
         ], 'C87814', 'FFF8E6')
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 2. SCHEMA MARKUP ────────────────────────────────────────────────────
     add_heading(doc, '2. Schema Markup (JSON-LD)', level=1)
@@ -355,22 +578,7 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
         'the Princeton GEO research framework:'
     ))
 
-    schema_rows = [
-        ['Organization / LocalBusiness', 'All pages (sitewide)', 'High',
-         'Name, address, phone, opening hours, social profiles, logo'],
-        ['WebPage', 'All pages', 'High',
-         'Name, description, breadcrumb, dateModified'],
-        ['FAQPage', 'Key content pages', 'Critical',
-         '+40% AI visibility boost — highest impact schema type'],
-        ['BreadcrumbList', 'All pages', 'Medium',
-         'Navigation structure for AI engines'],
-        ['Article / BlogPosting', 'Blog / news', 'Medium',
-         'datePublished, author, publisher for E-E-A-T'],
-        ['Product / Service', 'Product / service pages', 'High',
-         'Name, description, offers, review, aggregateRating'],
-    ]
-
-    add_table(doc, ['Schema Type', 'Where', 'Priority', 'Key Properties'], schema_rows)
+    add_static_table(doc, _SCHEMA_HEADERS, _SCHEMA_ROWS)
 
     add_heading(doc, 'FAQPage Schema — Highest Impact', level=2)
 
@@ -386,7 +594,7 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     add_bullet(doc, 'Target questions your audience would ask an AI: "What is X?", "How does Y work?", "How much does Z cost?"')
     add_bullet(doc, 'Each answer should be concise, factual, and directly answer the question')
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 3. AI BOT ACCESS ────────────────────────────────────────────────────
     add_heading(doc, '3. AI Bot Access', level=1)
@@ -412,24 +620,23 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
 
     add_heading(doc, 'AI Bot Directives', level=2)
 
+    allowed = frozenset(ai_bots)
+    blocked = frozenset(ai_bots_blocked)
+    known = allowed | blocked
+    unlisted_status = 'Implicitly allowed (not mentioned)' if robots_exists else 'Unknown'
+
     def _bot_status(bot):
-        if bot in ai_bots:
+        if bot in allowed:
             return 'Explicitly allowed'
-        if bot in ai_bots_blocked:
+        if bot in blocked:
             return 'BLOCKED — remove Disallow'
-        if robots_exists:
-            return 'Implicitly allowed (not mentioned)'
-        return 'Unknown'
+        return unlisted_status
 
     bot_rows = [
-        ['GPTBot', 'ChatGPT / OpenAI', 'Yes' if 'GPTBot' in ai_bots or 'GPTBot' in ai_bots_blocked else 'No', _bot_status('GPTBot')],
-        ['ChatGPT-User', 'ChatGPT browsing', 'Yes' if 'ChatGPT-User' in ai_bots or 'ChatGPT-User' in ai_bots_blocked else 'No', _bot_status('ChatGPT-User')],
-        ['ClaudeBot', 'Claude / Anthropic', 'Yes' if 'ClaudeBot' in ai_bots or 'ClaudeBot' in ai_bots_blocked else 'No', _bot_status('ClaudeBot')],
-        ['anthropic-ai', 'Claude (legacy)', 'Yes' if 'anthropic-ai' in ai_bots or 'anthropic-ai' in ai_bots_blocked else 'No', _bot_status('anthropic-ai')],
-        ['PerplexityBot', 'Perplexity', 'Yes' if 'PerplexityBot' in ai_bots or 'PerplexityBot' in ai_bots_blocked else 'No', _bot_status('PerplexityBot')],
-        ['Googlebot', 'Google AI Overview', 'Standard', 'Implicitly allowed (standard)'],
-        ['Bingbot', 'Copilot / Bing', 'Standard', 'Implicitly allowed (standard)'],
+        [bot, platform, 'Yes' if bot in known else 'No', _bot_status(bot)]
+        for bot, platform in _AI_BOTS
     ]
+    bot_rows.extend(_STANDARD_BOT_ROWS)
 
     add_table(doc, ['Bot', 'Platform', 'In robots.txt', 'Status'], bot_rows)
 
@@ -488,7 +695,7 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
             'simple_sitemap for Drupal, etc.) and submit it to Google Search Console.',
         ], 'B42828', 'FFF0F0')
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 4. PERFORMANCE ──────────────────────────────────────────────────────
     add_heading(doc, '4. Technical Performance', level=1)
@@ -529,16 +736,9 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
         'sites with good Core Web Vitals scores.'
     ))
 
-    add_table(doc,
-              ['Metric', 'What it measures', 'Good threshold'],
-              [
-                  ['LCP (Largest Contentful Paint)', 'Main content load speed', '< 2.5 seconds'],
-                  ['INP (Interaction to Next Paint)', 'Interactivity responsiveness', '< 200ms'],
-                  ['CLS (Cumulative Layout Shift)', 'Visual stability', '< 0.1'],
-                  ['TTFB (Time to First Byte)', 'Server response speed', '< 800ms'],
-              ])
+    add_static_table(doc, _CWV_HEADERS, _CWV_ROWS)
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 5. DOMAIN AUTHORITY ──────────────────────────────────────────────────
     add_heading(doc, '5. Domain Authority & Backlinks', level=1)
@@ -555,13 +755,13 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
         bl_rows = []
         if backlinks_rank is not None:
             bl_rows.append(['Domain Rank', str(backlinks_rank),
-                            'Strong' if backlinks_rank and backlinks_rank >= 30 else 'Moderate' if backlinks_rank and backlinks_rank >= 10 else 'Weak'])
+                            _classify(backlinks_rank, _RANK_THRESHOLDS)])
         if referring_domains is not None:
             bl_rows.append(['Referring Domains', f'{referring_domains:,}',
-                            'Strong' if referring_domains >= 500 else 'Moderate' if referring_domains >= 50 else 'Weak'])
+                            _classify(referring_domains, _REFERRING_DOMAIN_THRESHOLDS)])
         if total_backlinks is not None:
             bl_rows.append(['Total Backlinks', f'{total_backlinks:,}',
-                            'Strong' if total_backlinks >= 5000 else 'Moderate' if total_backlinks >= 200 else 'Weak'])
+                            _classify(total_backlinks, _BACKLINK_THRESHOLDS)])
         add_table(doc, ['Metric', 'Value', 'Assessment'], bl_rows)
 
         if referring_domains is not None and referring_domains < 50:
@@ -586,15 +786,9 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
 
     add_heading(doc, 'Why Backlinks Matter for GEO', level=2)
 
-    add_table(doc,
-              ['Authority Level', 'Referring Domains', 'ChatGPT Cite Probability', 'Priority'],
-              [
-                  ['High Authority', '500+', 'High — frequently cited', 'Already strong'],
-                  ['Medium Authority', '50–500', 'Moderate — cited for niche queries', 'Build further'],
-                  ['Low Authority', '< 50', 'Low — rarely cited unprompted', 'Priority gap'],
-              ])
+    add_static_table(doc, _AUTHORITY_HEADERS, _AUTHORITY_ROWS)
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 6. CONTENT ANALYSIS ─────────────────────────────────────────────────
     add_heading(doc, '6. Content Analysis: Princeton GEO Methods', level=1)  # noqa
@@ -605,11 +799,11 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
         'based on what was accessible during the crawl.'
     ))
 
-    add_styled_para(doc, (
+    add_italic_hint(doc, (
         'Note: This automated audit assesses technical signals only. A full content audit '
         'requires manual review of key pages against the Princeton GEO methods. '
         'Refer to the Content Guide for detailed editorial guidance.'
-    ), italic=True, color=GRAY)
+    ))
 
     # Technical GEO signals we can actually detect
     add_heading(doc, 'Detected GEO Signals', level=2)
@@ -619,7 +813,7 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     # Schema → cite sources / structured data
     geo_rows.append(['Cite Sources / Structured Data', '+40%',
                      'Partial' if jsonld_count > 0 else 'No',
-                     f'{jsonld_count} JSON-LD block{"s" if jsonld_count != 1 else ""} detected'
+                     f'{jsonld_count} JSON-LD block{jsonld_plural} detected'
                      if jsonld_count > 0 else 'No JSON-LD schema found — major gap'])
 
     # Meta signals → authoritative tone (proxy)
@@ -651,37 +845,10 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
 
     add_heading(doc, 'Content Recommendations', level=2)
 
-    add_callout_box(doc, 'Priority: Add Statistics and Data Points (+37% boost)', [
-        'Include specific, factual numbers throughout key pages. Examples:',
-        '• Years in business, number of clients, project counts',
-        '• Awards, accreditations, qualifications held',
-        '• Customer satisfaction scores or testimonials with specifics',
-        '• Pricing ranges, timelines, quantities',
-        'Even approximate data is better than none. '
-        '"Over 200 projects delivered" is far more citable than "extensive experience."'
-    ], '167832', 'EBF9F0')
-
-    add_callout_box(doc, 'Priority: Add Expert Quotes (+30% boost)', [
-        'Include named quotes from team members, clients, or industry bodies. Format:',
-        '"[Quote text]" — Name, Role/Organisation',
-        '',
-        'AI engines treat attributed quotes as high-quality, citable content. '
-        'Anonymous testimonials have less impact. '
-        'Client quotes are particularly valuable — they provide social proof and '
-        'factual evidence that AI engines can extract and cite.'
-    ], '167832', 'EBF9F0')
-
-    add_callout_box(doc, 'Priority: Create FAQ Content (+40% boost)', [
-        'Add a FAQ section to key pages answering common questions. Structure them as:',
-        'Q: [Common question your audience would ask an AI]',
-        'A: [Direct, factual, concise answer]',
-        '',
-        'FAQ content with FAQPage schema provides the single highest AI visibility boost '
-        '(+40%) in the Princeton research. Target the exact questions people ask AI engines '
-        'about your product, service, or area of expertise.'
-    ], '167832', 'EBF9F0')
+    for heading, lines in _CONTENT_PRIORITY_CALLOUTS:
+        add_callout_box(doc, heading, lines, '167832', 'EBF9F0')
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 6. AI PLATFORM ASSESSMENT ───────────────────────────────────────────
     add_heading(doc, '7. AI Platform Assessment', level=1)
@@ -695,11 +862,11 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
               ['Platform', 'Primary Index', 'Key Factor', f'{client_domain} Status'],
               [
                   ['ChatGPT', 'Bing / Web', 'Domain Authority + Content Quality',
-                   'Good' if score >= 71 else ('Moderate' if score >= 41 else 'Weak')],
+                   _TIER_STATUSES[band]],
                   ['Perplexity', 'Own + Google', 'FAQ Schema + Semantic Relevance',
                    'Good' if jsonld_count > 0 and ai_bots else ('Moderate' if jsonld_count > 0 or ai_bots else 'Weak')],
                   ['Google AI Overview', 'Google', 'E-E-A-T + Structured Data',
-                   'Good' if score >= 71 else ('Moderate' if score >= 41 else 'Weak')],
+                   _TIER_STATUSES[band]],
                   ['Microsoft Copilot', 'Bing', 'Bing Index + Entity Clarity',
                    'Moderate' if robots_exists else 'Weak'],
                   ['Claude', 'Brave Search', 'Factual Density + Source Authority',
@@ -728,54 +895,18 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
                   ['E-E-A-T (Experience, Expertise, Authority, Trust)',
                    'Moderate' if title and description else 'Weak'],
                   ['Structured data (JSON-LD)',
-                   f'{jsonld_count} block{"s" if jsonld_count != 1 else ""} — {"good" if jsonld_count > 0 else "missing"}'],
+                   f'{jsonld_label} — {"good" if jsonld_count > 0 else "missing"}'],
                   ['Topical authority', 'Unknown — requires content depth review'],
                   ['Page speed', f'{load_time}s — {"fast" if load_time_ok else "slow"}' if load_time else 'Unknown'],
                   ['Knowledge Graph inclusion', 'Unknown — check Google Search Console'],
               ])
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 7. SCORECARD ────────────────────────────────────────────────────────
     add_heading(doc, '8. GEO Readiness Scorecard', level=1)
 
-    scorecard_rows = []
-
-    # Title
-    t_score = 15 if title else 0
-    scorecard_rows.append(['Page Title', f'{t_score}/15',
-                            'Good' if title and audit.get('title_ok') else ('Weak' if title else 'Missing'),
-                            'Present and correct length' if (title and audit.get('title_ok'))
-                            else ('Present but too long' if title else 'Missing — critical gap')])
-
-    # Description
-    d_score = 10 if description else 0
-    scorecard_rows.append(['Meta Description', f'{d_score}/10',
-                            'Good' if description and audit.get('description_ok') else ('Weak' if description else 'Missing'),
-                            'Present and good length' if (description and audit.get('description_ok'))
-                            else ('Present but too long' if description else 'Missing')])
-
-    # OG
-    og_score = 5 if og_tags else 0
-    scorecard_rows.append(['OG / Social Tags', f'{og_score}/5',
-                            'Good' if og_tags else 'Missing',
-                            'Present' if og_tags else 'Not detected'])
-
-    # H1
-    h1_score = 10 if h1 else 0
-    scorecard_rows.append(['H1 Heading', f'{h1_score}/10',
-                            'Good' if h1 else 'Missing',
-                            'Present' if h1 else 'Missing — weakens page structure'])
-
-    # Schema
-    schema_score = 20 if jsonld_count > 0 else 0
-    scorecard_rows.append(['JSON-LD Schema', f'{schema_score}/20',
-                            'Good' if jsonld_count > 0 else 'Missing',
-                            f'{jsonld_count} block{"s" if jsonld_count != 1 else ""}'
-                            if jsonld_count > 0 else 'No structured data — major gap'])
-
     # AI bots
-    bots_score = 15 if ai_bots else 0
     if ai_bots and ai_bots_blocked:
         bots_detail = f'{len(ai_bots)} allowed, {len(ai_bots_blocked)} blocked'
         bots_rating = 'Partial'
@@ -785,23 +916,35 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     elif ai_bots_blocked:
         bots_detail = f'{len(ai_bots_blocked)} bot{"s" if len(ai_bots_blocked) != 1 else ""} explicitly blocked'
         bots_rating = 'Blocked'
-        bots_score = 0
     else:
         bots_detail = 'No AI bot directives in robots.txt'
         bots_rating = 'Missing'
-    scorecard_rows.append(['AI Bot Access', f'{bots_score}/15', bots_rating, bots_detail])
-
-    # Sitemap
-    sitemap_score = 10 if has_sitemap else 0
-    scorecard_rows.append(['XML Sitemap', f'{sitemap_score}/10',
-                            'Good' if has_sitemap else 'Missing',
-                            'Found at /sitemap.xml' if has_sitemap else 'Not found'])
 
-    # Load time
-    lt_score = 15 if load_time_ok else 0
-    scorecard_rows.append(['Page Load Time', f'{lt_score}/15',
-                            'Good' if load_time_ok else 'Weak',
-                            f'{load_time}s' if load_time else 'Not measured'])
+    scorecard_rows = [
+        _scorecard_row('Page Title', 15, title, _meta_status(title, title_ok),
+                       'Present and correct length' if (title and title_ok)
+                       else ('Present but too long' if title else 'Missing — critical gap')),
+        _scorecard_row('Meta Description', 10, description, _meta_status(description, description_ok),
+                       'Present and good length' if (description and description_ok)
+                       else ('Present but too long' if description else 'Missing')),
+        _scorecard_row('OG / Social Tags', 5, og_tags,
+                       'Good' if og_tags else 'Missing',
+                       'Present' if og_tags else 'Not detected'),
+        _scorecard_row('H1 Heading', 10, h1,
+                       'Good' if h1 else 'Missing',
+                       'Present' if h1 else 'Missing — weakens page structure'),
+        _scorecard_row('JSON-LD Schema', 20, jsonld_count > 0,
+                       'Good' if jsonld_count > 0 else 'Missing',
+                       jsonld_label if jsonld_count > 0 else 'No structured data — major gap'),
+        _scorecard_row('AI Bot Access', 15, ai_bots,
+                       bots_rating, bots_detail),
+        _scorecard_row('XML Sitemap', 10, has_sitemap,
+                       'Good' if has_sitemap else 'Missing',
+                       'Found at /sitemap.xml' if has_sitemap else 'Not found'),
+        _scorecard_row('Page Load Time', 15, load_time_ok,
+                       'Good' if load_time_ok else 'Weak',
+                       load_time_label),
+    ]
 
     add_table(doc, ['Category', 'Score', 'Rating', 'Detail'], scorecard_rows)
 
@@ -817,103 +960,43 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     p.paragraph_format.space_after = Pt(8)
 
     # Score legend
-    legend_rows = [
-        ['71–100', 'GEO Ready', 'Strong technical foundation. Focus on content enrichment.'],
-        ['41–70', 'Needs Work', 'Some foundations in place. Address priority gaps systematically.'],
-        ['0–40', 'Poor', 'Significant technical gaps. Prioritise schema, meta tags, and bot access.'],
-    ]
-    add_table(doc, ['Score', 'Rating', 'Meaning'], legend_rows)
+    add_static_table(doc, _LEGEND_HEADERS, _LEGEND_ROWS)
 
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── 8. RECOMMENDATIONS ──────────────────────────────────────────────────
     add_heading(doc, '9. Recommendations', level=1)
 
     rec_num = 1
 
-    # Priority 0 — Critical blockers only if needed
-    critical = []
-    if not title:
-        critical.append(('Add a page title', 'Every page must have a unique <title> tag. '
-                         'This is the most basic SEO/GEO requirement and is currently missing.'))
-    if not h1:
-        critical.append(('Add an H1 heading', 'Every page needs exactly one H1 heading that '
-                         'clearly describes the page topic.'))
-    if jsonld_count == 0:
-        critical.append(('Implement JSON-LD schema markup', 'No structured data was detected. '
-                         'Add at minimum an Organization/LocalBusiness schema to every page, '
-                         'and FAQPage schema to key content pages.'))
+    # Checks that gate a recommendation; keys match the first field of the
+    # _*_RECOMMENDATIONS entries (None there means always shown).
+    gaps = {
+        'title': not title,
+        'h1': not h1,
+        'schema': jsonld_count == 0,
+        'description': not description,
+        'og_tags': not og_tags,
+        'ai_bots': not ai_bots,
+        'sitemap': not has_sitemap,
+        None: True,
+    }
 
+    # Priority 0 — Critical blockers only if needed
+    critical = [rec for rec in _CRITICAL_RECOMMENDATIONS if gaps[rec[0]]]
     if critical:
         add_heading(doc, 'Priority 0 — Critical (Must Fix First)', level=2)
-        for title_text, body in critical:
-            add_callout_box(doc, f'Recommendation {rec_num}: {title_text}', [body],
-                            'B42828', 'FFF0F0')
-            rec_num += 1
+        rec_num = _add_recommendations(doc, critical, gaps, rec_num, 'B42828', 'FFF0F0')
 
     # Priority 1 — High impact
     add_heading(doc, 'Priority 1 — High Impact', level=2)
-
-    if not description:
-        add_callout_box(doc, f'Recommendation {rec_num}: Write meta descriptions for all pages', [
-            'Add a 120–155 character meta description to every page. Include the primary keyword '
-            'and a clear value proposition. AI engines use meta descriptions as summary signals.'
-        ], '0072BB', 'EDF6FC')
-        rec_num += 1
-
-    if not og_tags:
-        add_callout_box(doc, f'Recommendation {rec_num}: Add Open Graph tags', [
-            'Implement og:title, og:description, og:url, og:image on all pages. '
-            'These are used by social platforms and AI engines for rich content interpretation.'
-        ], '0072BB', 'EDF6FC')
-        rec_num += 1
-
-    if not ai_bots:
-        add_callout_box(doc, f'Recommendation {rec_num}: Configure AI bot access in robots.txt', [
-            'Add explicit Allow directives for GPTBot, ClaudeBot, PerplexityBot, and '
-            'ChatGPT-User. This signals that AI crawlers are welcome and may improve '
-            'crawl priority for your content.'
-        ], '0072BB', 'EDF6FC')
-        rec_num += 1
-
-    if not has_sitemap:
-        add_callout_box(doc, f'Recommendation {rec_num}: Create an XML sitemap', [
-            'Generate a sitemap.xml and reference it in robots.txt. '
-            'This helps AI crawlers discover all your pages efficiently.'
-        ], '0072BB', 'EDF6FC')
-        rec_num += 1
-
-    add_callout_box(doc, f'Recommendation {rec_num}: Add FAQPage schema to key pages', [
-        'Implement FAQPage JSON-LD on your most important content pages. '
-        'Structure 4–8 Q&A pairs per page answering the questions your audience '
-        'asks AI engines about your product or service. '
-        'This provides the single highest AI visibility boost (+40%) in the Princeton research.'
-    ], '0072BB', 'EDF6FC')
-    rec_num += 1
+    rec_num = _add_recommendations(doc, _HIGH_IMPACT_RECOMMENDATIONS, gaps, rec_num,
+                                   '0072BB', 'EDF6FC')
 
     # Priority 2 — Content
     add_heading(doc, 'Priority 2 — Content Enrichment', level=2)
-
-    add_callout_box(doc, f'Recommendation {rec_num}: Add statistics to key pages (+37% boost)', [
-        'Enrich content with specific, verifiable numbers. '
-        'Years in business, client counts, project counts, awards, accreditations. '
-        'Statistics are the second highest-impact GEO method in the Princeton research.'
-    ], '167832', 'EBF9F0')
-    rec_num += 1
-
-    add_callout_box(doc, f'Recommendation {rec_num}: Add expert and client quotes (+30% boost)', [
-        'Include named, attributed quotes on product/service pages and the homepage. '
-        'Format: "[Quote]" — Name, Title/Organisation. '
-        'Client testimonials with specifics ("X saved us Y hours per week") are particularly citable.'
-    ], '167832', 'EBF9F0')
-    rec_num += 1
-
-    add_callout_box(doc, f'Recommendation {rec_num}: Structure content for answer extraction', [
-        'Rewrite key pages in an "answer-first" format: lead with the key fact or definition, '
-        'then expand with supporting detail. AI engines prefer content structured as direct '
-        'answers to questions over marketing copy or narrative prose.'
-    ], '167832', 'EBF9F0')
-    rec_num += 1
+    rec_num = _add_recommendations(doc, _CONTENT_RECOMMENDATIONS, gaps, rec_num,
+                                   '167832', 'EBF9F0')
 
     # Priority 3 — Technical
     add_heading(doc, 'Priority 3 — Technical Improvements', level=2)
@@ -926,37 +1009,14 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
         ], 'C87814', 'FFF8E6')
         rec_num += 1
 
-    add_callout_box(doc, f'Recommendation {rec_num}: Implement IndexNow for Bing/Copilot', [
-        'IndexNow notifies Bing instantly when new content is published, '
-        'ensuring Microsoft Copilot indexes fresh content quickly. '
-        'Most CMS platforms have IndexNow plugins available.'
-    ], 'C87814', 'FFF8E6')
-    rec_num += 1
+    _add_recommendations(doc, _TECHNICAL_RECOMMENDATIONS, gaps, rec_num, 'C87814', 'FFF8E6')
 
-    add_callout_box(doc, f'Recommendation {rec_num}: Register in Google Search Console', [
-        'Verify the site in Google Search Console to monitor Core Web Vitals, '
-        'crawl errors, and schema validation. Check the Rich Results Test for '
-        'structured data issues: search.google.com/test/rich-results'
-    ], 'C87814', 'FFF8E6')
-
-    doc.add_page_break()
+    add_section_break(doc)
 
     # ── APPENDIX A ──────────────────────────────────────────────────────────
     add_heading(doc, 'Appendix A: Princeton GEO Methods Reference', level=1)
 
-    add_table(doc,
-              ['Method', 'AI Visibility Boost', 'Description'],
-              [
-                  ['Cite Sources', '+40%', 'Add authoritative citations and external references'],
-                  ['Statistics Addition', '+37%', 'Include specific numbers and data points'],
-                  ['Quotation Addition', '+30%', 'Add expert quotes with clear attribution'],
-                  ['Authoritative Tone', '+25%', 'Use confident, definitive, expert language'],
-                  ['Easy-to-understand', '+20%', 'Simplify complex concepts — plain English first'],
-                  ['Technical Terms', '+18%', 'Include relevant domain-specific terminology'],
-                  ['Unique Words', '+15%', 'Increase vocabulary diversity — avoid repetition'],
-                  ['Fluency Optimization', '+15–30%', 'Improve readability and logical flow'],
-                  ['Keyword Stuffing', '−10%', 'AVOID — unnatural repetition hurts AI visibility'],
-              ])
+    add_static_table(doc, _METHODS_HEADERS, _METHODS_REFERENCE_ROWS)
 
     add_styled_para(doc, (
         'Source: Princeton University, IIT Delhi, Georgia Tech, Allen Institute for AI. '
@@ -966,15 +1026,7 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
     # ── APPENDIX B ──────────────────────────────────────────────────────────
     add_heading(doc, 'Appendix B: AI Platform Quick Reference', level=1)
 
-    add_table(doc,
-              ['Platform', 'Primary Index', 'Key Requirement', 'Unique Factor'],
-              [
-                  ['ChatGPT', 'Bing / Web', 'Domain Authority', 'Content-Answer Fit'],
-                  ['Perplexity', 'Own + Google', 'FAQ Schema', 'PDF indexing, semantic search'],
-                  ['Google AI Overview', 'Google', 'E-E-A-T signals', 'Knowledge Graph + schema'],
-                  ['Microsoft Copilot', 'Bing', 'Bing Webmaster', 'IndexNow for freshness'],
-                  ['Claude', 'Brave Search', 'Factual density', 'Brave Search indexing'],
-              ])
+    add_static_table(doc, _PLATFORM_HEADERS, _PLATFORM_ROWS)
 
     # ── APPENDIX C ──────────────────────────────────────────────────────────
     add_heading(doc, 'Appendix C: Audit Data', level=1)
@@ -986,13 +1038,13 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
               [
                   ['URL audited', url, 'Direct crawl'],
                   ['Page title', title or 'Not found', 'HTML <title> tag extraction'],
-                  ['Title length', f'{audit.get("title_length", 0)} characters', 'Character count'],
+                  ['Title length', f'{title_length} characters', 'Character count'],
                   ['Meta description', (description[:80] + '…' if len(description) > 80 else description) or 'Not found',
                    'HTML meta[name=description] extraction'],
                   ['H1 heading', h1 or 'Not found', 'HTML <h1> extraction'],
                   ['OG tags', _yes_no(og_tags), 'HTML meta[property=og:*] detection'],
                   ['JSON-LD blocks', str(jsonld_count), 'application/ld+json script detection'],
-                  ['Load time', f'{load_time}s' if load_time else 'Not measured', 'urllib HTTP request timer'],
+                  ['Load time', load_time_label, 'urllib HTTP request timer'],
                   ['robots.txt', 'Found' if robots_exists else 'Not found', 'GET /robots.txt'],
                   ['AI bots allowed', ', '.join(ai_bots) or 'None', 'robots.txt Allow directive parsing'],
                   ['AI bots blocked', ', '.join(ai_bots_blocked) or 'None', 'robots.txt Disallow directive parsing'],
@@ -1004,4 +1056,12 @@ def build_geo_audit_report(params: dict, audit: dict) -> Document:
                   ['Audit date', date_str, 'Report generation date'],
               ])
 
+    end_batched_body(doc)
     return doc
+
+
+def _build_and_serialize(params: dict, audit: dict) -> bytes:
+    """Report-pool worker entry point: report as .docx bytes."""
+    buf = io.BytesIO()
+    build_geo_audit_report(params, audit).save(buf)
+    return buf.getvalue()
@@ -1,8 +1,31 @@
 import sys
 import os
+import importlib.abc
+import importlib.util
 
-# Put scripts/ on path so seo_audit.py and dataforseo_api.py can be imported
-_SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'scripts')
-_SCRIPTS_DIR = os.path.abspath(_SCRIPTS_DIR)
-if _SCRIPTS_DIR not in sys.path:
-    sys.path.insert(0, _SCRIPTS_DIR)
+# Resolve the shared modules in scripts/ (seo_audit.py, dataforseo_api.py and
+# the credential.py it depends on) through a finder scoped to those names,
+# rather than putting the whole scripts/ directory on sys.path.
+_SCRIPT_MODULES = frozenset({'seo_audit', 'dataforseo_api', 'credential'})
+
+
+class _ScriptsFinder(importlib.abc.MetaPathFinder):
+    """Locate the scripts/ modules on demand; every other import falls through."""
+
+    _scripts_dir = None
+
+    def find_spec(self, name, path=None, target=None):
+        if name not in _SCRIPT_MODULES:
+            return None
+        if self._scripts_dir is None:
+            type(self)._scripts_dir = os.path.abspath(
+                os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+        location = os.path.join(self._scripts_dir, name + '.py')
+        if not os.path.isfile(location):
+            # Fall through so a missing script is a normal ModuleNotFoundError
+            return None
+        return importlib.util.spec_from_file_location(name, location)
+
+
+if not any(isinstance(f, _ScriptsFinder) for f in sys.meta_path):
+    sys.meta_path.append(_ScriptsFinder())
@@ -1,13 +1,39 @@
+import copy
+import functools
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cachetools import TTLCache
 
 from dataforseo_api import api_post, get_result, format_count
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for the DataForSEO calls behind run_ai_visibility.  They are
+# I/O-bound (urllib releases the GIL while waiting), so threads suffice.
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='dataforseo')
+
+# Recent complete results keyed on the normalised inputs, so a page refresh
+# does not repeat ~10 paid API calls.  Per-process and best-effort; results
+# with any failed call are never stored, so transient errors are not pinned.
+# Entries are private copies; every caller gets its own deep copy.
+_RESULT_CACHE = TTLCache(maxsize=512, ttl=15 * 60)
+_RESULT_CACHE_LOCK = threading.Lock()
+
+# DataForSEO item types: ChatGPT scraper answers / cited sources, and the
+# message item of an llm_responses result
+_CHATGPT_ANSWER_TYPES = frozenset({'chatgpt_answer', 'message', 'answer'})
+_CHATGPT_SOURCE_TYPES = frozenset({'source', 'organic', 'link', 'citation'})
+_LLM_MESSAGE_TYPES = frozenset({'message', 'answer', 'response'})
+
+# ai_overview value when Google returned no overview or the call failed
+_EMPTY_AI_OVERVIEW = {'text': None, 'references': [], 'domain_mentioned': False}
+
 # Location options exposed to the template for the location selector.
 # (code, label) — ordered by likely usage for a UK-based agency.
-LOCATION_OPTIONS = [
+LOCATION_OPTIONS = (
     (2826, "United Kingdom"),
     (2840, "United States"),
     (2036, "Australia"),
@@ -16,21 +42,38 @@ LOCATION_OPTIONS = [
     (2250, "France"),
     (2724, "Spain"),
     (2380, "Italy"),
-]
+)
 
 
+_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
 def _clean_domain(domain: str) -> str:
     """Strip protocol and trailing slash; remove www prefix."""
-    d = re.sub(r'^https?://', '', domain, flags=re.IGNORECASE)
-    if d.startswith('www.'):
-        d = d[4:]
-    return d.rstrip('/')
+    return _SCHEME_RE.sub('', domain, count=1).removeprefix('www.').rstrip('/')
+
+
+@functools.lru_cache(maxsize=256)
+def _mention_pattern(clean_domain: str, brand_query: str) -> re.Pattern:
+    """One case-insensitive alternation of every needle _domain_mentioned
+    looks for, so a response is scanned once instead of up to three times."""
+    needles = [re.escape(clean_domain)]
+    if '.' in clean_domain:
+        name_only = clean_domain.rsplit('.', 1)[0]
+        if len(name_only) >= 4:
+            needles.append(r'\b' + re.escape(name_only) + r'\b')
+    if brand_query:
+        first_word = brand_query.strip().split()[0]
+        if len(first_word) >= 4:
+            needles.append(r'\b' + re.escape(first_word) + r'\b')
+    return re.compile('|'.join(needles), re.IGNORECASE)
 
 
 def _domain_mentioned(text: str, clean_domain: str, brand_query: str = '') -> bool:
     """Return True if the domain / brand appears to be referenced in *text*.
 
-    Three checks in order of specificity:
+    Matches any of:
     1. Bare domain string  (e.g. "numiko.com")
     2. Domain name without TLD  (e.g. "numiko")  — only if >= 4 chars
     3. First word of brand_query  (e.g. "Numiko")  — only if >= 4 chars
@@ -40,25 +83,7 @@ def _domain_mentioned(text: str, clean_domain: str, brand_query: str = '') -> bo
     """
     if not text:
         return False
-    text_lower = text.lower()
-
-    # 1. Full domain (e.g. numiko.com)
-    if clean_domain.lower() in text_lower:
-        return True
-
-    # 2. Name-part only (e.g. "numiko" from "numiko.com")
-    if '.' in clean_domain:
-        name_only = clean_domain.rsplit('.', 1)[0]
-        if len(name_only) >= 4 and re.search(r'\b' + re.escape(name_only.lower()) + r'\b', text_lower):
-            return True
-
-    # 3. First word of brand_query (e.g. "Numiko" from "Numiko digital agency")
-    if brand_query:
-        first_word = brand_query.strip().split()[0]
-        if len(first_word) >= 4 and re.search(r'\b' + re.escape(first_word.lower()) + r'\b', text_lower):
-            return True
-
-    return False
+    return _mention_pattern(clean_domain, brand_query).search(text) is not None
 
 
 def _clean_answer_snippet(raw: str, max_chars: int = 200) -> str:
@@ -78,47 +103,54 @@ def _clean_answer_snippet(raw: str, max_chars: int = 200) -> str:
     return cleaned[:max_chars]
 
 
-_UGC_DOMAINS = {
+# Source-type lookup tables for _classify_domain_type
+_UGC_DOMAINS = frozenset({
     'reddit.com', 'quora.com', 'stackoverflow.com', 'stackexchange.com',
     'tripadvisor.co.uk', 'tripadvisor.com', 'trustpilot.com', 'yelp.com',
-    'mumsnet.com', 'netmums.com', 'forums.', 'community.',
-}
-_AUTHORITY_DOMAINS = {
-    'gov.uk', '.gov', 'wikipedia.org', 'w3.org', 'bbc.co.uk', 'bbc.com',
-    'nhs.uk', 'ico.org.uk', 'nominet.uk', 'ofcom.org.uk',
-}
-_DIRECTORY_DOMAINS = {
+    'mumsnet.com', 'netmums.com',
+})
+# Any of these as a dot-separated label (e.g. forums.example.com) marks UGC
+_UGC_LABELS = frozenset({
+    'forums', 'community', 'reddit', 'quora', 'stackoverflow',
+    'stackexchange', 'tripadvisor', 'trustpilot', 'yelp',
+    'mumsnet', 'netmums',
+})
+_AUTHORITY_SUFFIXES = ('gov.uk', 'gov', 'nhs.uk', 'ac.uk')
+_AUTHORITY_DOMAINS = frozenset({
+    'wikipedia.org', 'w3.org', 'bbc.co.uk', 'bbc.com',
+    'ico.org.uk', 'nominet.uk', 'ofcom.org.uk',
+})
+_DIRECTORY_DOMAINS = (
     'clutch.co', 'g2.com', 'capterra.com', 'whatcms.org', 'builtwith.com',
     'crunchbase.com', 'companieshouse.gov.uk',
-}
+)
 
 
 def _classify_domain_type(domain: str) -> str:
     """Return a source type label for a domain: UGC, Authority, Directory, or Editorial."""
     d = domain.lower()
-    parts = set(d.split('.'))
-    # Check subdomain prefixes for UGC markers
-    ugc_prefixes = {'forums', 'community', 'reddit', 'quora', 'stackoverflow',
-                    'stackexchange', 'tripadvisor', 'trustpilot', 'yelp',
-                    'mumsnet', 'netmums'}
-    ugc_domains = {'reddit.com', 'quora.com', 'stackoverflow.com', 'stackexchange.com',
-                   'tripadvisor.co.uk', 'tripadvisor.com', 'trustpilot.com', 'yelp.com',
-                   'mumsnet.com', 'netmums.com'}
-    if d in ugc_domains or any(p in ugc_prefixes for p in d.split('.')):
+    if d in _UGC_DOMAINS or not _UGC_LABELS.isdisjoint(d.split('.')):
         return 'UGC'
-    authority_tlds = {'gov.uk', 'gov', 'nhs.uk', 'ac.uk'}
-    authority_domains = {'wikipedia.org', 'w3.org', 'bbc.co.uk', 'bbc.com',
-                         'ico.org.uk', 'nominet.uk', 'ofcom.org.uk'}
-    if d in authority_domains or any(d.endswith('.' + a) or d == a for a in authority_tlds):
+    if d in _AUTHORITY_DOMAINS or any(d.endswith('.' + a) or d == a for a in _AUTHORITY_SUFFIXES):
         return 'Authority'
-    if any(d == di or d.endswith('.' + di) for di in {
-        'clutch.co', 'g2.com', 'capterra.com', 'whatcms.org', 'builtwith.com',
-        'crunchbase.com', 'companieshouse.gov.uk'
-    }):
+    if any(d == di or d.endswith('.' + di) for di in _DIRECTORY_DOMAINS):
         return 'Directory'
     return 'Editorial'
 
 
+_POSITIVE_WORDS = (
+    'excellent', 'outstanding', 'highly recommend', 'award-winning',
+    'trusted', 'leading', 'expertise', 'specialist', 'renowned',
+    'well-regarded', 'strong reputation', 'impressive',
+    'highly rated', 'best in class', 'highly regarded',
+)
+_NEGATIVE_WORDS = (
+    'poor', 'disappointing', 'complaint', 'issue', 'problem', 'bad',
+    'avoid', 'warning', 'negative', 'failed', 'lawsuit', 'scandal',
+    'controversy', 'misleading', 'overpriced', 'unreliable',
+)
+
+
 def _classify_sentiment(text: str, domain: str, brand_query: str = '') -> str:
     """
     Basic sentiment classification for an LLM response about a brand.
@@ -128,19 +160,8 @@ def _classify_sentiment(text: str, domain: str, brand_query: str = '') -> str:
     if not text:
         return 'neutral'
     t = text.lower()
-    positive_words = [
-        'excellent', 'outstanding', 'highly recommend', 'award-winning',
-        'trusted', 'leading', 'expertise', 'specialist', 'renowned',
-        'well-regarded', 'strong reputation', 'impressive',
-        'highly rated', 'best in class', 'highly regarded',
-    ]
-    negative_words = [
-        'poor', 'disappointing', 'complaint', 'issue', 'problem', 'bad',
-        'avoid', 'warning', 'negative', 'failed', 'lawsuit', 'scandal',
-        'controversy', 'misleading', 'overpriced', 'unreliable',
-    ]
-    pos = sum(1 for w in positive_words if w in t)
-    neg = sum(1 for w in negative_words if w in t)
+    pos = sum(1 for w in _POSITIVE_WORDS if w in t)
+    neg = sum(1 for w in _NEGATIVE_WORDS if w in t)
     if pos > neg + 1:
         return 'positive'
     elif neg > pos:
@@ -300,10 +321,232 @@ def _generate_recommendations(result: dict) -> list[dict]:
     return recs
 
 
+def _first_result(resp: dict):
+    """Return the first task result of a DataForSEO response, or None."""
+    results = get_result(resp)
+    if not results:
+        return None
+    return results[0] if isinstance(results, list) else results
+
+
+def _fetch_aggregated_metrics(clean_domain: str, location_code: int) -> list:
+    """Totals (mentions, ai_search_volume, impressions) per platform."""
+    raw = _first_result(api_post('ai_optimization/llm_mentions/aggregated_metrics/live', [{
+        'target': [{'domain': clean_domain, 'search_filter': 'include'}],
+        'location_code': location_code,
+        'language_code': 'en',
+    }]))
+    if raw is None:
+        return []
+    return [
+        {
+            'platform': item.get('platform', ''),
+            'mentions': item.get('mentions', 0),
+            'ai_search_volume': item.get('ai_search_volume', 0),
+            'impressions': item.get('impressions', 0),
+        }
+        for item in raw.get('items') or []
+    ]
+
+
+def _fetch_top_domains(clean_domain: str, location_code: int) -> list:
+    """Domains most cited by LLMs alongside / instead of the target domain."""
+    raw = _first_result(api_post('ai_optimization/llm_mentions/top_domains/live', [{
+        'target': [{'domain': clean_domain, 'search_filter': 'include'}],
+        'location_code': location_code,
+        'language_code': 'en',
+        'limit': 10,
+    }]))
+    if raw is None:
+        return []
+    target = clean_domain.lower()
+    top = []
+    for item in raw.get('items') or []:
+        d = item.get('domain', '')
+        top.append({
+            'domain': d,
+            'mentions': item.get('mentions', 0),
+            'ai_search_volume': item.get('ai_search_volume', 0),
+            'is_target': d.lower() == target,
+            'domain_type': _classify_domain_type(d),
+        })
+    return top
+
+
+def _fetch_competitor_comparison(clean_domain: str, location_code: int,
+                                 competitor_domains: list) -> list:
+    """Compare the target against up to three competitors via
+    cross_aggregated_metrics; target first, then by mentions desc."""
+    targets = [{'domain': clean_domain, 'search_filter': 'include'}]
+    for cd in competitor_domains[:3]:
+        cd_clean = _clean_domain(cd)
+        if cd_clean and re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z]{2,})+$', cd_clean):
+            targets.append({'domain': cd_clean, 'search_filter': 'include'})
+
+    raw = _first_result(api_post('ai_optimization/llm_mentions/cross_aggregated_metrics/live', [{
+        'target': targets,
+        'location_code': location_code,
+        'language_code': 'en',
+    }]))
+    if raw is None:
+        return []
+    target = clean_domain.lower()
+    comp_data = []
+    for item in raw.get('items') or []:
+        d = item.get('domain', '')
+        comp_data.append({
+            'domain': d,
+            'mentions': item.get('mentions', 0),
+            'ai_search_volume': item.get('ai_search_volume', 0),
+            'is_target': d.lower() == target,
+        })
+    comp_data.sort(key=lambda x: (not x['is_target'], -x['mentions']))
+    return comp_data
+
+
+def _fetch_mentions(clean_domain: str, location_code: int) -> list:
+    """Questions / AI answers where the domain was cited as a source."""
+    raw = _first_result(api_post('ai_optimization/llm_mentions/search/live', [{
+        'target': [{'domain': clean_domain, 'search_filter': 'include'}],
+        'location_code': location_code,
+        'language_code': 'en',
+        'limit': 10,
+    }]))
+    if raw is None:
+        return []
+    return [
+        {
+            'question': item.get('question', ''),
+            'answer_snippet': _clean_answer_snippet(item.get('answer') or '', max_chars=200),
+            'ai_search_volume': item.get('ai_search_volume', 0),
+            'platform': item.get('platform', 'google'),
+            'source_domains': [
+                s.get('domain', '') for s in (item.get('sources') or [])[:5]
+            ],
+        }
+        for item in raw.get('items') or []
+    ]
+
+
+def _fetch_ai_overview(clean_domain: str, brand_query: str, location_code: int) -> dict:
+    """What Google's AI Overview says about the brand query + which pages it cites."""
+    raw = _first_result(api_post('serp/google/organic/live/advanced', [{
+        'keyword': brand_query or clean_domain,
+        'location_code': location_code,
+        'language_code': 'en',
+        'expand_ai_overview': True,
+    }]))
+    items = (raw.get('items') or []) if raw is not None else []
+    item = next((i for i in items if i.get('type') == 'ai_overview'), None)
+    if item is None:
+        return dict(_EMPTY_AI_OVERVIEW, references=[])
+    overview_text = item.get('markdown') or item.get('text') or ''
+    refs = item.get('references') or []
+    ref_text = ' '.join([f"{r.get('domain', '')} {r.get('url', '')}" for r in refs])
+    return {
+        'text': overview_text,
+        'references': [
+            {
+                'title': r.get('title', ''),
+                'url': r.get('url', ''),
+                'domain': r.get('domain', ''),
+            }
+            for r in refs[:10]
+        ],
+        'domain_mentioned': _domain_mentioned(
+            overview_text + ' ' + ref_text,
+            clean_domain,
+            brand_query,
+        ),
+    }
+
+
+def _fetch_chatgpt(clean_domain: str, brand_query: str, location_code: int) -> dict | None:
+    """ChatGPT search scraper: the answer text plus the sources it cited."""
+    raw = _first_result(api_post('ai_optimization/chat_gpt/llm_scraper/live/advanced', [{
+        'keyword': brand_query,
+        'location_code': location_code,
+        'language_code': 'en',
+    }]))
+    if raw is None:
+        return None
+    answer_text = None
+    sources = []
+    for item in raw.get('items') or []:
+        item_type = item.get('type', '')
+        if item_type in _CHATGPT_ANSWER_TYPES:
+            answer_text = (
+                item.get('text')
+                or item.get('description')
+                or item.get('content')
+            )
+        elif item_type in _CHATGPT_SOURCE_TYPES:
+            sources.append({
+                'title': item.get('title', ''),
+                'url': item.get('url', '') or item.get('link', ''),
+                'domain': item.get('domain', ''),
+            })
+    source_text = ' '.join([f"{s['url']} {s['domain']} {s['title']}" for s in sources])
+    return {
+        'answer': answer_text,
+        'sources': sources[:10],
+        'domain_mentioned': _domain_mentioned(
+            (answer_text or '') + ' ' + source_text,
+            clean_domain,
+            brand_query,
+        ),
+    }
+
+
+# (platform, llm_responses endpoint, model) — one concurrent call each
+_LLM_PLATFORMS = (
+    ('ChatGPT',    'ai_optimization/chat_gpt/llm_responses/live',  'gpt-4.1-mini'),
+    ('Claude',     'ai_optimization/claude/llm_responses/live',     'claude-3-5-haiku-20241022'),
+    ('Gemini',     'ai_optimization/gemini/llm_responses/live',     'gemini-2.0-flash'),
+    ('Perplexity', 'ai_optimization/perplexity/llm_responses/live', 'sonar'),
+)
+
+
+def _fetch_llm(clean_domain: str, brand_query: str, platform_name: str,
+               endpoint: str, model_name: str) -> dict | None:
+    """Ask one LLM platform the brand query; None if it gave no answer."""
+    raw = _first_result(api_post(endpoint, [{
+        'user_prompt': brand_query,
+        'model_name': model_name,
+    }]))
+    if raw is None:
+        return None
+    item = next((i for i in raw.get('items') or [] if i.get('type') in _LLM_MESSAGE_TYPES), None)
+    if item is None:
+        return None
+    sections = item.get('sections') or []
+    if sections:
+        response_text = '\n\n'.join(
+            s.get('text', '') for s in sections if s.get('text')
+        )
+    else:
+        response_text = item.get('text') or item.get('description')
+    if not response_text:
+        return None
+    return {
+        'platform': platform_name,
+        'response': response_text,
+        'domain_mentioned': _domain_mentioned(
+            response_text, clean_domain, brand_query
+        ),
+        'sentiment': _classify_sentiment(response_text, clean_domain, brand_query),
+    }
+
+
 def run_ai_visibility(domain: str, brand_query: str, location_code: int = 2826,
-                      competitor_domains: list | None = None) -> dict:
+                      competitor_domains: list | None = None,
+                      force_refresh: bool = False) -> dict:
     """Check AI visibility for a domain/brand across LLM platforms.
 
+    Complete results (no failed calls) are reused for 15 minutes for the same
+    domain, brand query, location and competitors; pass ``force_refresh=True``
+    to bypass the cache.
+
     Returns a dict with:
       - aggregated_metrics: per-platform totals (mentions, ai_search_volume, impressions)
       - top_domains: domains most co-cited alongside the target
@@ -325,6 +568,18 @@ def run_ai_visibility(domain: str, brand_query: str, location_code: int = 2826,
       - ai_optimization/{platform}/llm_responses/live  (per platform)
       - ai_optimization/llm_mentions/cross_aggregated_metrics/live  (if competitors)
     """
+    cache_key = (
+        domain.strip().lower(),
+        brand_query.strip().lower(),
+        location_code,
+        tuple(d.strip().lower() for d in competitor_domains or ()),
+    )
+    if not force_refresh:
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
     result = {
         'domain': domain,
         'brand_query': brand_query,
@@ -343,267 +598,55 @@ def run_ai_visibility(domain: str, brand_query: str, location_code: int = 2826,
 
     clean_domain = _clean_domain(domain)
 
-    # ── Aggregated Metrics ─────────────────────────────────────────────────
-    # Returns totals (mentions, ai_search_volume, impressions) per platform.
-    try:
-        resp = api_post('ai_optimization/llm_mentions/aggregated_metrics/live', [{
-            'target': [{'domain': clean_domain, 'search_filter': 'include'}],
-            'location_code': location_code,
-            'language_code': 'en',
-        }])
-        agg_results = get_result(resp)
-        if agg_results:
-            raw = agg_results[0] if isinstance(agg_results, list) else agg_results
-            items = raw.get('items') or []
-            result['aggregated_metrics'] = [
-                {
-                    'platform': item.get('platform', ''),
-                    'mentions': item.get('mentions', 0),
-                    'ai_search_volume': item.get('ai_search_volume', 0),
-                    'impressions': item.get('impressions', 0),
-                }
-                for item in items
-            ]
-        else:
-            result['aggregated_metrics'] = []
-    except Exception as exc:
-        logger.warning('Aggregated Metrics fetch failed: %s', exc)
-        result['errors'].append(f'Aggregated Metrics: {exc}')
-
-    # ── Top Domains ────────────────────────────────────────────────────────
-    # Domains most cited by LLMs alongside / instead of the target domain.
-    try:
-        resp = api_post('ai_optimization/llm_mentions/top_domains/live', [{
-            'target': [{'domain': clean_domain, 'search_filter': 'include'}],
-            'location_code': location_code,
-            'language_code': 'en',
-            'limit': 10,
-        }])
-        top_results = get_result(resp)
-        if top_results:
-            raw = top_results[0] if isinstance(top_results, list) else top_results
-            items = raw.get('items') or []
-            result['top_domains'] = [
-                {
-                    'domain': item.get('domain', ''),
-                    'mentions': item.get('mentions', 0),
-                    'ai_search_volume': item.get('ai_search_volume', 0),
-                    'is_target': item.get('domain', '').lower() == clean_domain.lower(),
-                    'domain_type': _classify_domain_type(item.get('domain', '')),
-                }
-                for item in items
-            ]
-        else:
-            result['top_domains'] = []
-    except Exception as exc:
-        logger.warning('Top Domains fetch failed: %s', exc)
-        result['errors'].append(f'Top Domains: {exc}')
-
-    # ── Competitor Cross-Comparison ──────────────────────────────────────
-    # Uses cross_aggregated_metrics to compare target against competitors.
-    # Only runs if competitor_domains were provided.
+    # The DataForSEO calls are independent and each blocks for hundreds of
+    # ms to several seconds, so they all go out at once on the shared pool.
+    # Results and errors are collected in submission order, so the output
+    # matches the old sequential run.
+    # (result key, log label, error label, callable, args)
+    sections = [
+        ('aggregated_metrics', 'Aggregated Metrics', 'Aggregated Metrics',
+         _fetch_aggregated_metrics, (clean_domain, location_code)),
+        ('top_domains', 'Top Domains', 'Top Domains',
+         _fetch_top_domains, (clean_domain, location_code)),
+    ]
     if competitor_domains:
+        sections.append(('competitor_comparison', 'Competitor Cross-Comparison',
+                         'Competitor Comparison', _fetch_competitor_comparison,
+                         (clean_domain, location_code, competitor_domains)))
+    sections += [
+        ('mentions', 'LLM Mentions', 'LLM Mentions',
+         _fetch_mentions, (clean_domain, location_code)),
+        ('ai_overview', 'SERP AI Overview', 'Google AI Overview',
+         _fetch_ai_overview, (clean_domain, brand_query, location_code)),
+        ('chatgpt', 'ChatGPT Search', 'ChatGPT Search',
+         _fetch_chatgpt, (clean_domain, brand_query, location_code)),
+    ]
+
+    futures = [_API_EXECUTOR.submit(fn, *args) for _, _, _, fn, args in sections]
+    llm_futures = [_API_EXECUTOR.submit(_fetch_llm, clean_domain, brand_query, *platform)
+                   for platform in _LLM_PLATFORMS]
+
+    for (key, log_label, error_label, _, _), future in zip(sections, futures):
         try:
-            targets = [{'domain': clean_domain, 'search_filter': 'include'}]
-            for cd in competitor_domains[:3]:
-                cd_clean = _clean_domain(cd)
-                if cd_clean and re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z]{2,})+$', cd_clean):
-                    targets.append({'domain': cd_clean, 'search_filter': 'include'})
-
-            resp = api_post('ai_optimization/llm_mentions/cross_aggregated_metrics/live', [{
-                'target': targets,
-                'location_code': location_code,
-                'language_code': 'en',
-            }])
-            comp_results = get_result(resp)
-            if comp_results:
-                raw = comp_results[0] if isinstance(comp_results, list) else comp_results
-                items = raw.get('items') or []
-                comp_data = []
-                for item in items:
-                    d = item.get('domain', '')
-                    mentions = item.get('mentions', 0)
-                    ai_vol = item.get('ai_search_volume', 0)
-                    comp_data.append({
-                        'domain': d,
-                        'mentions': mentions,
-                        'ai_search_volume': ai_vol,
-                        'is_target': d.lower() == clean_domain.lower(),
-                    })
-                # Sort: target first, then by mentions desc
-                comp_data.sort(key=lambda x: (not x['is_target'], -x['mentions']))
-                result['competitor_comparison'] = comp_data
-            else:
-                result['competitor_comparison'] = []
+            result[key] = future.result()
         except Exception as exc:
-            logger.warning('Competitor Cross-Comparison fetch failed: %s', exc)
-            result['errors'].append(f'Competitor Comparison: {exc}')
-
-    # ── LLM Mentions — Search Mentions ────────────────────────────────────
-    # Questions / AI answers where the domain was cited as a source.
-    try:
-        resp = api_post('ai_optimization/llm_mentions/search/live', [{
-            'target': [{'domain': clean_domain, 'search_filter': 'include'}],
-            'location_code': location_code,
-            'language_code': 'en',
-            'limit': 10,
-        }])
-        mentions_results = get_result(resp)
-        if mentions_results:
-            raw = mentions_results[0] if isinstance(mentions_results, list) else mentions_results
-            items = raw.get('items') or []
-            result['mentions'] = [
-                {
-                    'question': item.get('question', ''),
-                    'answer_snippet': _clean_answer_snippet(item.get('answer') or '', max_chars=200),
-                    'ai_search_volume': item.get('ai_search_volume', 0),
-                    'platform': item.get('platform', 'google'),
-                    'source_domains': [
-                        s.get('domain', '') for s in (item.get('sources') or [])[:5]
-                    ],
-                }
-                for item in items
-            ]
-        else:
-            result['mentions'] = []
-    except Exception as exc:
-        logger.warning('LLM Mentions fetch failed: %s', exc)
-        result['errors'].append(f'LLM Mentions: {exc}')
-
-    # ── Google SERP AI Overview ────────────────────────────────────────────
-    # What Google's AI Overview says about the brand query + which pages it cites.
-    try:
-        resp = api_post('serp/google/organic/live/advanced', [{
-            'keyword': brand_query or clean_domain,
-            'location_code': location_code,
-            'language_code': 'en',
-            'expand_ai_overview': True,
-        }])
-        serp_results = get_result(resp)
-        if serp_results:
-            raw = serp_results[0] if isinstance(serp_results, list) else serp_results
-            items = raw.get('items') or []
-            for item in items:
-                if item.get('type') == 'ai_overview':
-                    overview_text = item.get('markdown') or item.get('text') or ''
-                    refs = item.get('references') or []
-                    ref_text = ' '.join(
-                        (r.get('domain', '') + ' ' + r.get('url', ''))
-                        for r in refs
-                    )
-                    result['ai_overview'] = {
-                        'text': overview_text,
-                        'references': [
-                            {
-                                'title': r.get('title', ''),
-                                'url': r.get('url', ''),
-                                'domain': r.get('domain', ''),
-                            }
-                            for r in refs[:10]
-                        ],
-                        'domain_mentioned': _domain_mentioned(
-                            overview_text + ' ' + ref_text,
-                            clean_domain,
-                            brand_query,
-                        ),
-                    }
-                    break
-        if result['ai_overview'] is None:
-            result['ai_overview'] = {'text': None, 'references': [], 'domain_mentioned': False}
-    except Exception as exc:
-        logger.warning('SERP AI Overview fetch failed: %s', exc)
-        result['errors'].append(f'Google AI Overview: {exc}')
-        if result['ai_overview'] is None:
-            result['ai_overview'] = {'text': None, 'references': [], 'domain_mentioned': False}
-
-    # ── ChatGPT Search Scraper ─────────────────────────────────────────────
-    try:
-        resp = api_post('ai_optimization/chat_gpt/llm_scraper/live/advanced', [{
-            'keyword': brand_query,
-            'location_code': location_code,
-            'language_code': 'en',
-        }])
-        chatgpt_results = get_result(resp)
-        if chatgpt_results:
-            raw = chatgpt_results[0] if isinstance(chatgpt_results, list) else chatgpt_results
-            items = raw.get('items') or []
-            answer_text = None
-            sources = []
-            for item in items:
-                item_type = item.get('type', '')
-                if item_type in ('chatgpt_answer', 'message', 'answer'):
-                    answer_text = (
-                        item.get('text')
-                        or item.get('description')
-                        or item.get('content')
-                    )
-                elif item_type in ('source', 'organic', 'link', 'citation'):
-                    sources.append({
-                        'title': item.get('title', ''),
-                        'url': item.get('url', '') or item.get('link', ''),
-                        'domain': item.get('domain', ''),
-                    })
-            source_text = ' '.join(
-                (s.get('url', '') + ' ' + s.get('domain', '') + ' ' + s.get('title', ''))
-                for s in sources
-            )
-            result['chatgpt'] = {
-                'answer': answer_text,
-                'sources': sources[:10],
-                'domain_mentioned': _domain_mentioned(
-                    (answer_text or '') + ' ' + source_text,
-                    clean_domain,
-                    brand_query,
-                ),
-            }
-    except Exception as exc:
-        logger.warning('ChatGPT Search fetch failed: %s', exc)
-        result['errors'].append(f'ChatGPT Search: {exc}')
-
-    # ── Multi-LLM Responses ────────────────────────────────────────────────
-    llm_platforms = [
-        ('ChatGPT',    'ai_optimization/chat_gpt/llm_responses/live',  'gpt-4.1-mini'),
-        ('Claude',     'ai_optimization/claude/llm_responses/live',     'claude-3-5-haiku-20241022'),
-        ('Gemini',     'ai_optimization/gemini/llm_responses/live',     'gemini-2.0-flash'),
-        ('Perplexity', 'ai_optimization/perplexity/llm_responses/live', 'sonar'),
-    ]
+            logger.warning('%s fetch failed: %s', log_label, exc)
+            result['errors'].append(f'{error_label}: {exc}')
+
+    if result['ai_overview'] is None:
+        result['ai_overview'] = dict(_EMPTY_AI_OVERVIEW, references=[])
 
     llm_data = []
-    for platform_name, endpoint, model_name in llm_platforms:
+    for (platform_name, _, _), future in zip(_LLM_PLATFORMS, llm_futures):
         try:
-            resp = api_post(endpoint, [{
-                'user_prompt': brand_query,
-                'model_name': model_name,
-            }])
-            llm_results = get_result(resp)
-            if llm_results:
-                raw = llm_results[0] if isinstance(llm_results, list) else llm_results
-                items = raw.get('items') or []
-                response_text = None
-                for item in items:
-                    if item.get('type') in ('message', 'answer', 'response'):
-                        sections = item.get('sections') or []
-                        if sections:
-                            response_text = '\n\n'.join(
-                                s.get('text', '') for s in sections if s.get('text')
-                            )
-                        else:
-                            response_text = item.get('text') or item.get('description')
-                        break
-                if response_text:
-                    llm_data.append({
-                        'platform': platform_name,
-                        'response': response_text,
-                        'domain_mentioned': _domain_mentioned(
-                            response_text, clean_domain, brand_query
-                        ),
-                        'sentiment': _classify_sentiment(response_text, clean_domain, brand_query),
-                    })
+            response = future.result()
         except Exception as exc:
             logger.warning('%s LLM response fetch failed: %s', platform_name, exc)
             result['errors'].append(f'{platform_name}: {exc}')
-
-    result['llm_responses'] = llm_data if llm_data else []
+            continue
+        if response:
+            llm_data.append(response)
+    result['llm_responses'] = llm_data
 
     # ── Visibility Score ─────────────────────────────────────────────────
     # Calculated from already-collected data — no new API calls.
@@ -615,4 +658,7 @@ def run_ai_visibility(domain: str, brand_query: str, location_code: int = 2826,
 
     result['recommendations'] = _generate_recommendations(result)
 
+    if not result['errors']:
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[cache_key] = copy.deepcopy(result)
     return result
@@ -1,10 +1,58 @@
+import copy
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+from cachetools import TTLCache
+
 from seo_audit import fetch_url, extract_meta, check_robots, check_sitemap
 
 logger = logging.getLogger(__name__)
 
+# The page, robots.txt/sitemap and backlinks lookups are independent network
+# round trips; running them side by side makes an audit as slow as the
+# slowest one rather than the sum of all three.
+_AUDIT_EXECUTOR = ThreadPoolExecutor(max_workers=12, thread_name_prefix='audit')
+
+
+# Per-host results of the robots.txt/sitemap checks, so re-running an audit on
+# the same site skips those round trips.  Kept briefly because the report tells
+# clients to change them.  Per-process and best-effort.  (Backlinks summaries
+# are cached by domain_service.fetch_backlinks_summary.)
+_ROBOTS_CACHE = TTLCache(maxsize=1024, ttl=15 * 60)
+_ROBOTS_CACHE_LOCK = threading.Lock()
+
+
+def _check_robots_and_sitemap(url: str, use_stealth: bool):
+    """robots.txt, then the sitemap (which may be named in robots.txt)."""
+    parsed = urlparse(url)
+    key = (parsed.scheme, parsed.netloc.lower(), use_stealth)
+    with _ROBOTS_CACHE_LOCK:
+        cached = _ROBOTS_CACHE.get(key)
+    if cached is not None:
+        robots, has_sitemap, sitemap_url = cached
+        return copy.deepcopy(robots), has_sitemap, sitemap_url
+
+    robots = check_robots(url, use_stealth=use_stealth)
+    has_sitemap, sitemap_url = check_sitemap(url, robots_content=robots.get('content'),
+                                             use_stealth=use_stealth)
+    # Only cache when robots.txt was actually fetched; a timeout or block
+    # would otherwise hide robots.txt and the sitemap until the entry expires
+    if robots.get('exists'):
+        with _ROBOTS_CACHE_LOCK:
+            _ROBOTS_CACHE[key] = (copy.deepcopy(robots), has_sitemap, sitemap_url)
+    return robots, has_sitemap, sitemap_url
+
+
+# A leading RFC 3986 scheme, matched the way urlparse splits one off
+_URL_SCHEME = re.compile(r'([A-Za-z][A-Za-z0-9+.-]*):')
+
+# Page-level findings when the page itself could not be fetched (read-only)
+_BLOCKED_META = {'title': None, 'description': None, 'og_tags': False,
+                 'h1': None, 'jsonld_count': 0}
+
 
 def run_audit(url: str, use_stealth: bool = False) -> dict:
     """Run full SEO/GEO audit, return structured dict for template rendering.
@@ -16,13 +64,18 @@ def run_audit(url: str, use_stealth: bool = False) -> dict:
     with a warning rather than failing completely. robots.txt and sitemap
     checks are attempted regardless of whether the main page is accessible.
     """
-    parsed = urlparse(url)
-    if parsed.scheme and parsed.scheme not in ('http', 'https'):
-        raise ValueError(f'Unsupported URL scheme: {parsed.scheme}. Only http and https are allowed.')
+    match = _URL_SCHEME.match(url)
+    scheme = match.group(1).lower() if match else ''
+    if scheme and scheme not in ('http', 'https'):
+        raise ValueError(f'Unsupported URL scheme: {scheme}. Only http and https are allowed.')
 
     if not url.startswith('http'):
         url = f'https://{url}'
 
+    robots_future = _AUDIT_EXECUTOR.submit(_check_robots_and_sitemap, url, use_stealth)
+    # Optional: fetch backlinks summary from DataForSEO if credentials are available
+    backlinks_future = _AUDIT_EXECUTOR.submit(_fetch_backlinks, url)
+
     content, headers, load_time = fetch_url(url, use_stealth=use_stealth)
 
     page_blocked = content is None
@@ -31,22 +84,17 @@ def run_audit(url: str, use_stealth: bool = False) -> dict:
         block_reason = load_time if isinstance(load_time, str) else (
             'Site may be unreachable or blocking automated requests'
         )
-        # Still run robots and sitemap — these often work even when the main page is blocked
-        meta = {'title': None, 'description': None, 'og_tags': False,
-                'h1': None, 'jsonld_count': 0}
+        # robots and sitemap are still checked — these often work even when the main page is blocked
+        meta = _BLOCKED_META
+        title = description = ''
         load_time = None
     else:
         meta = extract_meta(content)
+        title = meta.get('title') or ''
+        description = meta.get('description') or ''
 
-    robots = check_robots(url, use_stealth=use_stealth)
-    robots_content = robots.get('content')
-    has_sitemap, sitemap_url = check_sitemap(url, robots_content=robots_content, use_stealth=use_stealth)
-
-    title = meta.get('title') or ''
-    description = meta.get('description') or ''
-
-    # Optional: fetch backlinks summary from DataForSEO if credentials are available
-    backlinks_data = _fetch_backlinks(url)
+    robots, has_sitemap, sitemap_url = robots_future.result()
+    backlinks_data = backlinks_future.result()
 
     return {
         'url': url,
@@ -79,45 +127,34 @@ def run_audit(url: str, use_stealth: bool = False) -> dict:
 def _fetch_backlinks(url: str) -> dict:
     """Fetch backlinks summary from DataForSEO. Returns empty dict on any failure."""
     try:
-        import dataforseo_api as _dfs
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        domain = parsed.netloc
-        data = [{'target': domain, 'include_subdomains': True}]
-        response = _dfs.api_post('backlinks/summary/live', data)
-        results = _dfs.get_result(response)
-        if results:
-            item = results[0]
-            return {
-                'rank': item.get('rank'),
-                'referring_domains': item.get('referring_domains'),
-                'backlinks': item.get('backlinks'),
-            }
-    except (RuntimeError, ImportError, KeyError, TypeError, ConnectionError) as exc:
+        from services.domain_service import fetch_backlinks_summary
+        return fetch_backlinks_summary(urlparse(url).hostname or url) or {}
+    except (RuntimeError, ImportError, KeyError, TypeError, ValueError, ConnectionError) as exc:
         logger.warning('Backlinks fetch failed: %s', exc)
     return {}
 
 
+# Points per readiness check, in the order _calculate_score lists them:
+# title, description, OG tags, H1, JSON-LD, AI bots allowed, sitemap, load time
+_SCORE_WEIGHTS = (15, 10, 5, 10, 20, 15, 10, 15)
+_AI_BOTS_WEIGHT, _SITEMAP_WEIGHT = _SCORE_WEIGHTS[5:7]
+
+
 def _calculate_score(meta, robots, has_sitemap, load_time, page_blocked=False) -> int:
     """Simple 0–100 GEO readiness score."""
-    score = 0
-    title = meta.get('title') or ''
-    desc = meta.get('description') or ''
-    if title:
-        score += 15
-    if desc:
-        score += 10
-    if meta.get('og_tags'):
-        score += 5
-    if meta.get('h1'):
-        score += 10
-    if meta.get('jsonld_count', 0) > 0:
-        score += 20
-    # Score AI bots correctly: only award points for explicitly ALLOWED bots
-    if robots.get('ai_bots'):
-        score += 15
-    if has_sitemap:
-        score += 10
-    if isinstance(load_time, (int, float)) and load_time < 3:
-        score += 15
-    return score
+    if page_blocked:
+        # No page, so no meta or load-time points; only robots and sitemap count
+        return ((_AI_BOTS_WEIGHT if robots.get('ai_bots') else 0)
+                + (_SITEMAP_WEIGHT if has_sitemap else 0))
+    checks = (
+        meta.get('title'),
+        meta.get('description'),
+        meta.get('og_tags'),
+        meta.get('h1'),
+        meta.get('jsonld_count', 0) > 0,
+        # Only explicitly ALLOWED AI bots earn points
+        robots.get('ai_bots'),
+        has_sitemap,
+        isinstance(load_time, (int, float)) and load_time < 3,
+    )
+    return sum(w for w, passed in zip(_SCORE_WEIGHTS, checks) if passed)
@@ -1,19 +1,29 @@
+import functools
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+from cachetools import TTLCache
+
 from dataforseo_api import api_post, get_result, format_count
 
 logger = logging.getLogger(__name__)
 
 
+# Shell metacharacters and whitespace never appear in a real domain
+_INVALID_DOMAIN_CHARS = re.compile(r'[;&|`$\s]')
+
+
+@functools.lru_cache(maxsize=1024)
 def _clean_domain(domain: str) -> str:
     """Strip protocol/path from domain input and validate."""
     domain = domain.strip().lower()
     if not domain:
         raise ValueError('Domain must not be empty.')
     # Reject shell metacharacters, spaces, and other dangerous input
-    if re.search(r'[;&|`$\s]', domain):
+    if _INVALID_DOMAIN_CHARS.search(domain):
         raise ValueError(f'Invalid domain: {domain!r}')
     if domain.startswith('http'):
         parsed = urlparse(domain)
@@ -27,6 +37,121 @@ def _clean_domain(domain: str) -> str:
     return domain
 
 
+# Shared read-only default for missing nested objects in API items
+_EMPTY = {}
+
+# Fixed request parameters per endpoint; each call adds its target (and
+# location).  Treated as read-only — they are only ever serialised.
+_RANK_OVERVIEW_PARAMS = {'language_code': 'en'}
+_RANKED_KEYWORDS_PARAMS = {
+    'language_code': 'en',
+    'limit': 20,
+    'order_by': ['keyword_data.keyword_info.search_volume,desc'],
+}
+_COMPETITORS_PARAMS = {'language_code': 'en', 'limit': 10}
+_BACKLINKS_PARAMS = {'include_subdomains': True}
+
+# Errors a single section may raise; it is reported and the rest still render
+_SECTION_ERRORS = (RuntimeError, KeyError, TypeError, ConnectionError)
+
+# The four overview sections are independent DataForSEO calls, so they run
+# side by side and the overview takes as long as the slowest one.
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='dataforseo-domain')
+
+# Backlinks summaries per cleaned domain, shared with the site audit so running
+# both on one site makes a single paid call.  Backlink profiles move slowly;
+# only successful lookups are kept.  Entries are private copies (the summary
+# is flat, so a shallow copy suffices).  Per-process and best-effort.
+_BACKLINKS_CACHE = TTLCache(maxsize=1024, ttl=24 * 3600)
+_BACKLINKS_CACHE_LOCK = threading.Lock()
+
+
+def _fetch_rank_overview(domain: str, location_code: int) -> dict | None:
+    resp = api_post('dataforseo_labs/google/domain_rank_overview/live', [{
+        'target': domain, 'location_code': location_code, **_RANK_OVERVIEW_PARAMS,
+    }])
+    ro_results = get_result(resp)
+    if not ro_results:
+        return None
+    item = ro_results[0]
+    metrics = (item.get('metrics') or _EMPTY).get('organic') or _EMPTY
+    return {
+        'rank': item.get('domain_rank'),
+        'etv': format_count(metrics.get('etv')),
+        'keywords_count': format_count(metrics.get('count')),
+        'pos_1_3': metrics.get('pos_1_3', 0),
+        'pos_4_10': metrics.get('pos_4_10', 0),
+    }
+
+
+def _fetch_ranked_keywords(domain: str, location_code: int) -> list:
+    resp = api_post('dataforseo_labs/google/ranked_keywords/live', [{
+        'target': domain, 'location_code': location_code, **_RANKED_KEYWORDS_PARAMS,
+    }])
+    kw_results = get_result(resp)
+    keywords = []
+    if kw_results:
+        raw = kw_results[0] if isinstance(kw_results, list) else kw_results
+        items = raw.get('items') or kw_results
+        for item in (items if isinstance(items, list) else []):
+            kd = item.get('keyword_data') or _EMPTY
+            ki = kd.get('keyword_info') or _EMPTY
+            sr = (item.get('ranked_serp_element') or _EMPTY).get('serp_item') or _EMPTY
+            volume = ki.get('search_volume', 0)
+            keywords.append({
+                'keyword': kd.get('keyword', ''),
+                'position': sr['rank_absolute'] if 'rank_absolute' in sr else sr.get('rank_group', '—'),
+                'volume': format_count(volume),
+                'volume_raw': volume or 0,
+                'url': sr.get('relative_url') or sr.get('url', ''),
+            })
+    return keywords
+
+
+def _fetch_competitors(domain: str, location_code: int) -> list:
+    resp = api_post('dataforseo_labs/google/competitors_domain/live', [{
+        'target': domain, 'location_code': location_code, **_COMPETITORS_PARAMS,
+    }])
+    comp_results = get_result(resp)
+    competitors = []
+    if comp_results:
+        raw = comp_results[0] if isinstance(comp_results, list) else comp_results
+        items = raw.get('items') or comp_results
+        for item in (items if isinstance(items, list) else []):
+            competitors.append({
+                'domain': item.get('domain', ''),
+                'common_keywords': item.get('intersections', 0),
+                'relevance': round(item.get('relevance', 0), 3),
+                'domain_rank': item.get('domain_rank'),
+            })
+    return competitors
+
+
+def fetch_backlinks_summary(domain: str) -> dict | None:
+    """Backlinks summary for *domain* (URL or bare host), cached per cleaned domain."""
+    domain = _clean_domain(domain)
+    with _BACKLINKS_CACHE_LOCK:
+        cached = _BACKLINKS_CACHE.get(domain)
+    if cached is not None:
+        return dict(cached)
+
+    resp = api_post('backlinks/summary/live', [{'target': domain, **_BACKLINKS_PARAMS}])
+    bl_results = get_result(resp)
+    if not bl_results:
+        return None
+    item = bl_results[0]
+    summary = {
+        'rank': item.get('rank'),
+        'referring_domains': item.get('referring_domains', 0),
+        'backlinks': item.get('backlinks', 0),
+        'nofollow': item.get('nofollow', 0),
+        'dofollow': (item.get('backlinks') or 0) - (item.get('nofollow') or 0),
+    }
+    with _BACKLINKS_CACHE_LOCK:
+        _BACKLINKS_CACHE[domain] = dict(summary)
+    return summary
+
+
 def run_domain_overview(domain: str, location_code: int = 2826) -> dict:
     """Run a full domain overview: rank metrics, top keywords, competitors, backlinks.
 
@@ -44,97 +169,24 @@ def run_domain_overview(domain: str, location_code: int = 2826) -> dict:
         'errors': [],
     }
 
-    # ── Section 1: Domain Rank Overview ───────────────────────────────────
-    try:
-        resp = api_post('dataforseo_labs/google/domain_rank_overview/live', [{
-            'target': domain,
-            'location_code': location_code,
-            'language_code': 'en',
-        }])
-        ro_results = get_result(resp)
-        if ro_results:
-            item = ro_results[0]
-            metrics = item.get('metrics', {}).get('organic', {})
-            result['rank_overview'] = {
-                'rank': item.get('domain_rank'),
-                'etv': format_count(metrics.get('etv')),
-                'keywords_count': format_count(metrics.get('count')),
-                'pos_1_3': metrics.get('pos_1_3', 0),
-                'pos_4_10': metrics.get('pos_4_10', 0),
-            }
-    except (RuntimeError, KeyError, TypeError, ConnectionError) as exc:
-        logger.warning('Domain Rank Overview failed: %s', exc)
-        result['errors'].append(f'Domain Rank Overview: {exc}')
-
-    # ── Section 2: Top Ranking Keywords ───────────────────────────────────
-    try:
-        resp = api_post('dataforseo_labs/google/ranked_keywords/live', [{
-            'target': domain,
-            'location_code': location_code,
-            'language_code': 'en',
-            'limit': 20,
-            'order_by': ['keyword_data.keyword_info.search_volume,desc'],
-        }])
-        kw_results = get_result(resp)
-        if kw_results:
-            raw = kw_results[0] if isinstance(kw_results, list) else kw_results
-            items = raw.get('items') or kw_results
-            for item in (items if isinstance(items, list) else []):
-                kd = item.get('keyword_data', {})
-                ki = kd.get('keyword_info', {})
-                sr = item.get('ranked_serp_element', {}).get('serp_item', {})
-                result['keywords'].append({
-                    'keyword': kd.get('keyword', ''),
-                    'position': sr.get('rank_absolute', sr.get('rank_group', '—')),
-                    'volume': format_count(ki.get('search_volume', 0)),
-                    'volume_raw': ki.get('search_volume', 0) or 0,
-                    'url': sr.get('relative_url', '') or sr.get('url', ''),
-                })
-    except (RuntimeError, KeyError, TypeError, ConnectionError) as exc:
-        logger.warning('Ranked Keywords fetch failed: %s', exc)
-        result['errors'].append(f'Ranked Keywords: {exc}')
-
-    # ── Section 3: Top Competitors ─────────────────────────────────────────
-    try:
-        resp = api_post('dataforseo_labs/google/competitors_domain/live', [{
-            'target': domain,
-            'location_code': location_code,
-            'language_code': 'en',
-            'limit': 10,
-        }])
-        comp_results = get_result(resp)
-        if comp_results:
-            raw = comp_results[0] if isinstance(comp_results, list) else comp_results
-            items = raw.get('items') or comp_results
-            for item in (items if isinstance(items, list) else []):
-                result['competitors'].append({
-                    'domain': item.get('domain', ''),
-                    'common_keywords': item.get('intersections', 0),
-                    'relevance': round(item.get('relevance', 0), 3),
-                    'domain_rank': item.get('domain_rank'),
-                })
-    except (RuntimeError, KeyError, TypeError, ConnectionError) as exc:
-        logger.warning('Competitors fetch failed: %s', exc)
-        result['errors'].append(f'Competitors: {exc}')
-
-    # ── Section 4: Backlinks Summary ──────────────────────────────────────
-    try:
-        resp = api_post('backlinks/summary/live', [{
-            'target': domain,
-            'include_subdomains': True,
-        }])
-        bl_results = get_result(resp)
-        if bl_results:
-            item = bl_results[0]
-            result['backlinks'] = {
-                'rank': item.get('rank'),
-                'referring_domains': item.get('referring_domains', 0),
-                'backlinks': item.get('backlinks', 0),
-                'nofollow': item.get('nofollow', 0),
-                'dofollow': (item.get('backlinks') or 0) - (item.get('nofollow') or 0),
-            }
-    except (RuntimeError, KeyError, TypeError, ConnectionError) as exc:
-        logger.warning('Backlinks fetch failed: %s', exc)
-        result['errors'].append(f'Backlinks: {exc}')
+    # (result key, log message, error label, callable, args)
+    sections = (
+        ('rank_overview', 'Domain Rank Overview failed', 'Domain Rank Overview',
+         _fetch_rank_overview, (domain, location_code)),
+        ('keywords', 'Ranked Keywords fetch failed', 'Ranked Keywords',
+         _fetch_ranked_keywords, (domain, location_code)),
+        ('competitors', 'Competitors fetch failed', 'Competitors',
+         _fetch_competitors, (domain, location_code)),
+        ('backlinks', 'Backlinks fetch failed', 'Backlinks',
+         fetch_backlinks_summary, (domain,)),
+    )
+    futures = [_API_EXECUTOR.submit(fn, *args) for _, _, _, fn, args in sections]
+
+    for (key, log_message, error_label, _, _), future in zip(sections, futures):
+        try:
+            result[key] = future.result()
+        except _SECTION_ERRORS as exc:
+            logger.warning('%s: %s', log_message, exc)
+            result['errors'].append(f'{error_label}: {exc}')
 
     return result
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # dataforseo_api imports credential.py which must be on path too
 import dataforseo_api as _dfs_api
@@ -6,6 +7,63 @@ from dataforseo_api import api_post, get_result, format_count
 
 logger = logging.getLogger(__name__)
 
+# Errors an enrichment call may raise; the keyword list is returned without it
+_ENRICHMENT_ERRORS = (RuntimeError, KeyError, TypeError, ConnectionError)
+
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=12, thread_name_prefix='dataforseo-keywords')
+
+
+def _fetch_difficulty(kw_list: list, location_code: int) -> dict | None:
+    """keyword -> keyword_difficulty, or None when the call returned nothing."""
+    diff_results = get_result(api_post('dataforseo_labs/google/bulk_keyword_difficulty/live', [{
+        'keywords': kw_list,
+        'location_code': location_code,
+        'language_code': 'en',
+    }]))
+    if not diff_results:
+        return None
+    return {item.get('keyword'): item.get('keyword_difficulty') for item in diff_results}
+
+
+def _fetch_intent(kw_list: list) -> dict | None:
+    """keyword -> main search intent, or None when the call returned nothing."""
+    intent_results = get_result(api_post('dataforseo_labs/google/search_intent/live', [{
+        'keywords': kw_list,
+        'language_code': 'en',
+    }]))
+    if not intent_results:
+        return None
+    # result[] contains one item per keyword with 'keyword' and 'keyword_intent' keys
+    intent_map = {}
+    for item in intent_results:
+        ki = item.get('keyword_intent', {})
+        # Main intent is the type with highest probability
+        main_intent = ki.get('main_intent') if ki else None
+        if main_intent:
+            intent_map[item.get('keyword', '')] = main_intent
+    return intent_map
+
+
+def _fetch_ai_volume(kw_list: list, location_code: int) -> dict | None:
+    """keyword -> AI search volume, or None when the call returned nothing."""
+    ai_results = get_result(api_post('ai_optimization/ai_keyword_data/keywords_search_volume/live', [{
+        'keywords': kw_list,
+        'location_code': location_code,
+        'language_code': 'en',
+    }]))
+    if not ai_results:
+        return None
+    return {item.get('keyword'): item.get('ai_search_volume') for item in ai_results}
+
+
+def _enrichment(future, failure_message: str) -> dict | None:
+    """The enrichment map from *future*, or None if that call failed."""
+    try:
+        return future.result()
+    except _ENRICHMENT_ERRORS as exc:
+        logger.warning('%s: %s', failure_message, exc)
+        return None
+
 
 def run_keyword_research(keyword: str, location_code: int = 2826, limit: int = 20) -> dict:
     """Run keyword research via DataForSEO. Returns structured dict with intent,
@@ -47,68 +105,30 @@ def run_keyword_research(keyword: str, location_code: int = 2826, limit: int = 2
 
     kw_list = [k['keyword'] for k in keywords]
 
-    # ── Bulk keyword difficulty ───────────────────────────────────────────────
-    try:
-        diff_resp = api_post('dataforseo_labs/google/bulk_keyword_difficulty/live', [{
-            'keywords': kw_list,
-            'location_code': location_code,
-            'language_code': 'en',
-        }])
-        diff_results = get_result(diff_resp)
-        if diff_results:
-            diff_map = {item.get('keyword'): item.get('keyword_difficulty')
-                        for item in diff_results}
-            for kw in keywords:
-                kd = diff_map.get(kw['keyword'])
-                if kd is not None:
-                    kw['difficulty'] = kd
-    except (RuntimeError, KeyError, TypeError, ConnectionError) as exc:
-        logger.warning('Bulk keyword difficulty failed: %s', exc)
-
-    # ── Search intent ─────────────────────────────────────────────────────────
-    try:
-        intent_resp = api_post('dataforseo_labs/google/search_intent/live', [{
-            'keywords': kw_list,
-            'language_code': 'en',
-        }])
-        intent_results = get_result(intent_resp)
-        if intent_results:
-            # result[] contains one item per keyword with 'keyword' and 'keyword_intent' keys
-            intent_map = {}
-            for item in intent_results:
-                kw_text = item.get('keyword', '')
-                ki = item.get('keyword_intent', {})
-                # Main intent is the type with highest probability
-                main_intent = ki.get('main_intent') if ki else None
-                if main_intent:
-                    intent_map[kw_text] = main_intent
-            for kw in keywords:
-                kw['intent'] = intent_map.get(kw['keyword'])
-    except (RuntimeError, KeyError, TypeError, ConnectionError) as exc:
-        logger.warning('Search intent fetch failed: %s', exc)
-
-    # ── AI search volume ──────────────────────────────────────────────────────
-    try:
-        ai_resp = api_post('ai_optimization/ai_keyword_data/keywords_search_volume/live', [{
-            'keywords': kw_list,
-            'location_code': location_code,
-            'language_code': 'en',
-        }])
-        ai_results = get_result(ai_resp)
-        if ai_results:
-            ai_map = {item.get('keyword'): item.get('ai_search_volume')
-                      for item in ai_results}
-            for kw in keywords:
-                av = ai_map.get(kw['keyword'])
-                kw['ai_volume'] = format_count(av) if av else None
-                kw['ai_volume_raw'] = av or 0
-    except (RuntimeError, KeyError, TypeError, ConnectionError) as exc:
-        logger.warning('AI search volume fetch failed: %s', exc)
-
-    # Normalise difficulty display
+    # The three enrichment calls are independent, so they run side by side.
+    diff_future = _API_EXECUTOR.submit(_fetch_difficulty, kw_list, location_code)
+    intent_future = _API_EXECUTOR.submit(_fetch_intent, kw_list)
+    ai_future = _API_EXECUTOR.submit(_fetch_ai_volume, kw_list, location_code)
+
+    diff_map = _enrichment(diff_future, 'Bulk keyword difficulty failed')
+    intent_map = _enrichment(intent_future, 'Search intent fetch failed')
+    ai_map = _enrichment(ai_future, 'AI search volume fetch failed')
+
+    # One pass merges every enrichment and normalises difficulty display
     for kw in keywords:
+        key = kw['keyword']
+        if diff_map is not None:
+            kd = diff_map.get(key)
+            if kd is not None:
+                kw['difficulty'] = kd
         if kw['difficulty'] is None:
             kw['difficulty'] = 'N/A'
+        if intent_map is not None:
+            kw['intent'] = intent_map.get(key)
+        if ai_map is not None:
+            av = ai_map.get(key)
+            kw['ai_volume'] = format_count(av) if av else None
+            kw['ai_volume_raw'] = av or 0
 
     return {
         'seed_keyword': keyword,
@@ -1,18 +1,89 @@
+import atexit
+import logging
+import multiprocessing
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
 
-from report_generators.content_guide import build_content_guide
-from report_generators.geo_audit_report import build_geo_audit_report
+from config import Config
+from report_generators import content_guide, geo_audit_report
+from report_generators.docx_helpers import create_document
+
+logger = logging.getLogger(__name__)
+
+# Long-lived worker processes that build reports off the request thread.
+# python-docx/lxml hold the GIL while building, so a process pool keeps
+# other requests responsive; the template and static-table caches persist
+# in each worker between requests.  Built lazily on first report.
+#
+# Workers are spawned rather than forked: the app process already runs
+# threads (email, DataForSEO and audit executors) and a fork could copy a
+# lock one of them holds.
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _warm_worker():
+    """Pool initializer: load the branded template once per worker."""
+    create_document()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the process-wide report pool, or None when disabled."""
+    global _pool
+    if _pool is None and Config.REPORT_WORKERS > 0:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=Config.REPORT_WORKERS,
+                                            mp_context=multiprocessing.get_context('spawn'),
+                                            initializer=_warm_worker)
+                atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+    return _pool
+
+
+def _render(fn, *args) -> bytes:
+    """Run *fn* on the report pool, falling back to this thread if the pool
+    is disabled, a worker has died (the pool is rebuilt on next use) or the
+    task is still queued behind other builds after REPORT_TIMEOUT seconds.
+
+    A build a worker has already started is always waited for; rebuilding
+    it here would double the work exactly when the pool is overloaded.
+    """
+    global _pool
+    pool = _get_pool()
+    if pool is not None:
+        future = pool.submit(fn, *args)
+        try:
+            try:
+                return future.result(timeout=Config.REPORT_TIMEOUT)
+            except TimeoutError:
+                if not future.cancel():
+                    return future.result()
+                logger.warning('Report still queued after %ss; building inline',
+                               Config.REPORT_TIMEOUT)
+        except BrokenProcessPool:
+            with _pool_lock:
+                if _pool is pool:
+                    _pool = None
+    return fn(*args)
+
+
+def _write(path: str, data: bytes) -> None:
+    """Write the serialised report in one call.  A buffered writer (unlike
+    raw FileIO) keeps writing until every byte is on disk."""
+    with open(path, 'wb', buffering=1 << 23) as f:
+        f.write(data)
 
 
 def generate_content_guide_docx(params: dict, output_path: str):
     """Generate a Content Guide DOCX and save to output_path."""
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    doc = build_content_guide(params)
-    doc.save(output_path)
+    _write(output_path, _render(content_guide._build_and_serialize, params))
 
 
 def generate_geo_audit_docx(params: dict, audit: dict, output_path: str):
     """Generate a full GEO Audit Report DOCX and save to output_path."""
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    doc = build_geo_audit_report(params, audit)
-    doc.save(output_path)
+    _write(output_path, _render(geo_audit_report._build_and_serialize, params, audit))